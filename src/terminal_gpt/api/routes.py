@@ -1,18 +1,26 @@
 """FastAPI routes for Terminal GPT."""
 
+import asyncio
 import os
 import time
-from typing import Dict, Any, Optional
-from datetime import datetime
+from contextlib import aclosing
+from typing import (
+    AsyncGenerator, AsyncIterator, Callable, Dict, Any, List, Optional, Set, Tuple
+)
+from datetime import datetime, timezone
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, status
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi import WebSocket, WebSocketDisconnect
+import msgspec
+import orjson
 from pydantic import BaseModel, Field
 
 from ..application.orchestrator import ConversationOrchestrator
-from ..infrastructure.llm_providers import create_llm_provider
+from ..application.conversation_store import ConversationJournal, ShelveSpill
+from ..infrastructure.llm_providers import LLMResponse, create_llm_provider
+from ..infrastructure.llm_cache import LLMCache, MemoryLRUBackend
 from ..infrastructure.logging import configure_logging, get_logger
 from ..domain.exceptions import (
     TerminalGPTError, ValidationError, LLMError,
@@ -29,6 +37,54 @@ logger = get_logger("terminal_gpt.api")
 # Global orchestrator instance (in production, use dependency injection)
 _orchestrator: Optional[ConversationOrchestrator] = None
 
+# Disk storage for conversations evicted from memory, when configured
+_conversation_spill: Optional[ShelveSpill] = None
+
+# Change log that keeps active conversations across restarts, when configured
+_conversation_journal: Optional[ConversationJournal] = None
+
+# Micro-batching for /chat: requests arriving within BATCH_WAIT_MS of each
+# other are coalesced and dispatched to the orchestrator together
+MAX_BATCH = 32
+BATCH_WAIT_MS = 20
+
+_chat_queue: Optional[asyncio.Queue] = None
+_batch_worker: Optional[asyncio.Task] = None
+_batch_dispatches: Set[asyncio.Task] = set()
+
+# Minimum interval between health events published from /health probes
+HEALTH_PUBLISH_INTERVAL_S = 5.0
+
+_last_health_publish: float = 0.0
+
+# Health levels ordered by severity, so the overall status is the max level
+_HEALTH_STATUSES = ("healthy", "degraded", "unhealthy")
+
+
+def _resolve_version() -> str:
+    """Get the package version, resolved once at import time."""
+    try:
+        from .. import __version__
+        return __version__
+    except ImportError:
+        return "unknown"
+
+
+_VERSION = _resolve_version()
+_UTC = timezone.utc
+
+# WebSocket streaming: text chunks produced within WS_FLUSH_MS of each other
+# are coalesced into a single frame; the bounded queue applies backpressure
+WS_FLUSH_MS = 10
+WS_MAX_COALESCE = 64
+
+# Clients offering this WebSocket subprotocol exchange MessagePack frames
+# instead of JSON
+WS_MSGPACK_SUBPROTOCOL = "msgpack"
+_msgpack_encoder = msgspec.msgpack.Encoder()
+
+_STREAM_END = object()
+
 
 def get_orchestrator() -> ConversationOrchestrator:
     """Dependency injection for orchestrator."""
@@ -40,6 +96,168 @@ def get_orchestrator() -> ConversationOrchestrator:
     return _orchestrator
 
 
+async def _dispatch_chat_batch(
+    orchestrator: ConversationOrchestrator,
+    batch: List[Tuple[str, str, asyncio.Future]]
+) -> None:
+    """Process a coalesced batch and resolve each waiting request's future."""
+    try:
+        results = await orchestrator.process_user_messages_batch(
+            [(session_id, message) for session_id, message, _ in batch]
+        )
+    except Exception as e:
+        results = [e] * len(batch)
+
+    for (_, _, future), result in zip(batch, results):
+        if future.done():
+            # Client went away while the batch was in flight
+            continue
+        if isinstance(result, BaseException):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+async def _chat_batch_loop(orchestrator: ConversationOrchestrator) -> None:
+    """Collect queued /chat requests into batches and dispatch them."""
+    loop = asyncio.get_running_loop()
+
+    while True:
+        batch = [await _chat_queue.get()]
+        deadline = loop.time() + BATCH_WAIT_MS / 1000
+
+        while len(batch) < MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_chat_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        # Dispatch without blocking collection of the next batch
+        task = asyncio.create_task(_dispatch_chat_batch(orchestrator, batch))
+        _batch_dispatches.add(task)
+        task.add_done_callback(_batch_dispatches.discard)
+
+
+async def _send_ws_frame(
+    websocket: WebSocket,
+    data: Dict[str, Any],
+    encode: Callable[[Any], bytes] = orjson.dumps
+) -> None:
+    """Send a payload over a WebSocket as a binary frame, JSON by default."""
+    await websocket.send_bytes(encode(data))
+
+
+async def _pump_stream(stream: AsyncIterator[Any], queue: asyncio.Queue) -> None:
+    """Forward stream items into a queue, ending with a sentinel or the error."""
+    try:
+        async for chunk in stream:
+            await queue.put(chunk)
+    except Exception as e:
+        await queue.put(e)
+        return
+    await queue.put(_STREAM_END)
+
+
+async def _coalesced_frames(
+    stream: AsyncIterator[LLMResponse]
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """Yield WebSocket frames with text chunks batched per flush tick.
+
+    Frames carrying tool calls are never merged and are yielded as soon as
+    they are seen. Errors raised by the stream are re-raised here after any
+    pending text has been flushed. A single frame dict is reused for every
+    yield, so callers must serialize it before advancing the iterator.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=WS_MAX_COALESCE)
+    producer = asyncio.create_task(_pump_stream(stream, queue))
+    loop = asyncio.get_running_loop()
+
+    frame: Dict[str, Any] = {
+        "type": "chunk",
+        "content": None,
+        "finish_reason": None,
+        "model": None,
+        "usage": None,
+        "tools_used": None
+    }
+
+    def fill(
+        content: Optional[str],
+        finish_reason: Optional[str],
+        model: Optional[str],
+        usage: Optional[Dict[str, Any]],
+        tools_used: Optional[List[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        frame["content"] = content
+        frame["finish_reason"] = finish_reason
+        frame["model"] = model
+        frame["usage"] = usage
+        frame["tools_used"] = tools_used
+        return frame
+
+    try:
+        while True:
+            items = [await queue.get()]
+            deadline = loop.time() + WS_FLUSH_MS / 1000
+
+            while len(items) < WS_MAX_COALESCE and not (
+                items[-1] is _STREAM_END or isinstance(items[-1], Exception)
+            ):
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Merged text keeps the latest non-empty metadata of its chunks
+            parts: List[str] = []
+            finish_reason = model = usage = None
+
+            for item in items:
+                if item is _STREAM_END or isinstance(item, Exception):
+                    if parts:
+                        yield fill("".join(parts), finish_reason, model, usage, None)
+                    if isinstance(item, Exception):
+                        raise item
+                    return
+
+                if item.tool_calls:
+                    if parts:
+                        yield fill("".join(parts), finish_reason, model, usage, None)
+                        parts = []
+                        finish_reason = model = usage = None
+                    yield fill(
+                        item.content, item.finish_reason, item.model,
+                        item.usage, item.tool_calls
+                    )
+                    continue
+
+                parts.append(item.content)
+                if item.finish_reason is not None:
+                    finish_reason = item.finish_reason
+                if item.model is not None:
+                    model = item.model
+                if item.usage is not None:
+                    usage = item.usage
+
+            if parts:
+                yield fill("".join(parts), finish_reason, model, usage, None)
+    finally:
+        producer.cancel()
+
+
+async def _submit_chat(session_id: str, message: str) -> str:
+    """Enqueue a chat message for batched processing and await its reply."""
+    future = asyncio.get_running_loop().create_future()
+    await _chat_queue.put((session_id, message, future))
+    return await future
+
+
 # Pydantic models for API requests/responses
 class ChatRequest(BaseModel):
     """Request model for chat endpoint."""
@@ -49,6 +267,25 @@ class ChatRequest(BaseModel):
     temperature: Optional[float] = Field(None, description="Response creativity (0.0-1.0)")
 
 
+class ChatRequestStruct(msgspec.Struct):
+    """Fast-path decoder for chat requests (ChatRequest documents the schema)."""
+    session_id: str
+    message: str
+    model: Optional[str] = None
+    temperature: Optional[float] = None
+
+
+_chat_request_decoder = msgspec.json.Decoder(ChatRequestStruct)
+
+
+def _decode_chat_request(body: bytes) -> ChatRequestStruct:
+    """Decode and validate a raw /chat request body."""
+    try:
+        return _chat_request_decoder.decode(body)
+    except msgspec.DecodeError as e:
+        raise ValidationError(f"Invalid chat request: {e}")
+
+
 class ChatResponse(BaseModel):
     """Response model for chat endpoint."""
     session_id: str
@@ -86,7 +323,8 @@ app = FastAPI(
     description="AI-powered chat system with plugin support",
     version="0.1.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -102,7 +340,8 @@ app.add_middleware(
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
-    global _orchestrator
+    global _orchestrator, _conversation_spill, _conversation_journal
+    global _chat_queue, _batch_worker
 
     try:
         # Register built-in plugins first
@@ -128,15 +367,54 @@ async def startup_event():
             model="anthropic/claude-3.5-sonnet"
         )
 
+        # Share one pooled connection across all requests
+        await llm_provider.open()
+
+        # Repeated identical requests can be answered from the response cache
+        response_cache = None
+        if config["enable_response_cache"]:
+            response_cache = LLMCache(
+                MemoryLRUBackend(config["response_cache_size"]),
+                cache_sampled=True
+            )
+
+        # Keep conversations evicted from memory on disk, if configured
+        if config["conversation_spill_path"]:
+            _conversation_spill = ShelveSpill(config["conversation_spill_path"])
+
+        # Journal active conversations so a restart picks them back up
+        if config["conversation_journal_path"]:
+            _conversation_journal = ConversationJournal(
+                config["conversation_journal_path"]
+            )
+
         # Initialize orchestrator with Juice's personality
         _orchestrator = ConversationOrchestrator(
             llm_provider=llm_provider,
             max_conversation_length=config["max_conversation_length"],
             sliding_window_size=config["sliding_window_size"],
             enable_summarization=config["enable_summarization"],
-            system_prompt=config["system_prompt"]
+            system_prompt=config["system_prompt"],
+            max_parallel_tools=config["max_parallel_tools"],
+            max_context_tokens=config["max_context_tokens"] or None,
+            response_cache=response_cache,
+            conversation_spill=_conversation_spill,
+            conversation_journal=_conversation_journal
         )
 
+        # The orchestrator now exists, so swap the guarded dependency for a
+        # constant async lookup (async also avoids a threadpool hop per request)
+        orchestrator = _orchestrator
+
+        async def get_ready_orchestrator() -> ConversationOrchestrator:
+            return orchestrator
+
+        app.dependency_overrides[get_orchestrator] = get_ready_orchestrator
+
+        # Start /chat micro-batching worker
+        _chat_queue = asyncio.Queue()
+        _batch_worker = asyncio.create_task(_chat_batch_loop(_orchestrator))
+
         # Start event bus
         await event_bus.start()
 
@@ -154,11 +432,41 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up on shutdown."""
-    if _orchestrator:
-        # End all active conversations
+    if _batch_worker:
+        _batch_worker.cancel()
+        try:
+            await _batch_worker
+        except asyncio.CancelledError:
+            pass
+
+    if _orchestrator and not _conversation_journal:
+        # End all active conversations concurrently; journaled ones are kept
+        # for the next start instead
         summaries = _orchestrator.list_conversations()
-        for session_id in summaries.keys():
-            await _orchestrator.end_conversation(session_id)
+        session_ids = list(summaries.keys())
+        results = await asyncio.gather(
+            *(_orchestrator.end_conversation(sid) for sid in session_ids),
+            return_exceptions=True
+        )
+        for session_id, result in zip(session_ids, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Failed to end conversation during shutdown",
+                    session_id=session_id,
+                    error=str(result)
+                )
+
+    if _orchestrator:
+        await _orchestrator.drain_events()
+        await _orchestrator.aclose()
+
+    if _conversation_spill:
+        _conversation_spill.close()
+    if _conversation_journal:
+        _conversation_journal.close()
+
+    # Restore the guarded dependency
+    app.dependency_overrides.pop(get_orchestrator, None)
 
     # Stop event bus
     await event_bus.stop()
@@ -188,7 +496,7 @@ async def terminal_gpt_exception_handler(request, exc: TerminalGPTError):
     else:
         status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content=response_data
     )
@@ -204,7 +512,7 @@ async def general_exception_handler(request, exc: Exception):
         path=request.url.path
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": {
@@ -218,45 +526,57 @@ async def general_exception_handler(request, exc: Exception):
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
-    services_status = {
-        "orchestrator": "healthy" if _orchestrator else "unhealthy",
-        "event_bus": "healthy" if event_bus._running else "unhealthy",
-    }
+    global _last_health_publish
 
-    overall_status = "healthy"
-    if "unhealthy" in services_status.values():
-        overall_status = "unhealthy"
-    elif "degraded" in services_status.values():
-        overall_status = "degraded"
+    # Track the worst component status as an index into _HEALTH_STATUSES
+    orchestrator_level = 0 if _orchestrator else 2
+    event_bus_level = 0 if event_bus._running else 2
+    overall_status = _HEALTH_STATUSES[max(orchestrator_level, event_bus_level)]
 
-    # Get version from package
-    try:
-        from .. import __version__
-        version = __version__
-    except ImportError:
-        version = "unknown"
+    services_status = {
+        "orchestrator": _HEALTH_STATUSES[orchestrator_level],
+        "event_bus": _HEALTH_STATUSES[event_bus_level],
+    }
 
     response = HealthResponse(
         status=overall_status,
-        version=version,
+        version=_VERSION,
         services=services_status,
-        timestamp=datetime.utcnow()
+        timestamp=datetime.now(_UTC)
     )
 
-    # Publish health check event
-    await publish_health_check("api", overall_status, services_status)
+    # Publish health check event, rate-limited so frequent liveness probes
+    # don't flood the event bus
+    now = time.monotonic()
+    if now - _last_health_publish > HEALTH_PUBLISH_INTERVAL_S:
+        _last_health_publish = now
+        await publish_health_check("api", overall_status, services_status)
 
     return response
 
 
-@app.post("/chat", response_model=ChatResponse)
+@app.post(
+    "/chat",
+    response_model=ChatResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": ChatRequest.model_json_schema()}
+            },
+        }
+    },
+)
 async def chat(
-    request: ChatRequest,
+    http_request: Request,
     background_tasks: BackgroundTasks,
     orchestrator: ConversationOrchestrator = Depends(get_orchestrator)
 ):
     """Process a chat message and return AI response."""
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
+
+    # Decode the body with msgspec rather than a Pydantic body model
+    request = _decode_chat_request(await http_request.body())
 
     try:
         logger.info(
@@ -265,20 +585,16 @@ async def chat(
             message_length=len(request.message)
         )
 
-        # Process the message
-        response_text = await orchestrator.process_user_message(
-            request.session_id,
-            request.message
-        )
+        # Process the message (coalesced with concurrent requests)
+        response_text = await _submit_chat(request.session_id, request.message)
 
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         # Get conversation info for response
         conversation = orchestrator.get_conversation(request.session_id)
         if conversation:
-            message_count = conversation.get_message_count()
+            message_count, total_chars = conversation.stats()
             # Estimate tokens used (rough calculation)
-            total_chars = sum(len(msg.content) for msg in conversation.messages)
             tokens_used = total_chars // 4
         else:
             message_count = 0
@@ -295,7 +611,7 @@ async def chat(
             processing_time_ms=processing_time_ms
         )
 
-        return ChatResponse(
+        return ChatResponse.model_construct(
             session_id=request.session_id,
             reply=response_text,
             status=response_status,
@@ -305,7 +621,7 @@ async def chat(
 
     except LLMError:
         # LLM-specific error - mark as degraded but still functional
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         return ChatResponse(
             session_id=request.session_id,
@@ -316,7 +632,7 @@ async def chat(
 
     except Exception as e:
         # Unexpected error
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         logger.error(
             "Chat processing failed",
@@ -340,16 +656,16 @@ async def list_sessions(
     """List all active conversation sessions."""
     summaries = orchestrator.list_conversations()
 
-    sessions = {}
-    for session_id, summary in summaries.items():
-        sessions[session_id] = SessionInfo(
+    # Summaries come from trusted internal state, so skip re-validation
+    return {
+        session_id: SessionInfo.model_construct(
             session_id=session_id,
             message_count=summary.message_count,
             last_activity=summary.last_activity,
             created_at=summary.last_activity  # Would need to track separately in production
         )
-
-    return sessions
+        for session_id, summary in summaries.items()
+    }
 
 
 @app.post("/sessions/{session_id}")
@@ -384,106 +700,116 @@ async def get_stats(
     return stats
 
 
-@app.websocket("/ws/chat/{session_id}")
-async def chat_websocket(
+async def _stream_ws_reply(
     websocket: WebSocket,
+    orchestrator: ConversationOrchestrator,
     session_id: str,
-    orchestrator: ConversationOrchestrator = Depends(get_orchestrator)
-):
-    """WebSocket endpoint for real-time streaming chat responses."""
-    await websocket.accept()
-    
+    user_message: str,
+    encode: Callable[[Any], bytes]
+) -> None:
+    """Stream the reply to one message, ending with a complete or error frame."""
+    # Process the message with streaming
+    start_ns = time.perf_counter_ns()
+    tool_calls_seen: Set[bytes] = set()
+
     try:
-        # Receive the user message
-        message_data = await websocket.receive_json()
-        user_message = message_data.get("message")
-        
-        if not user_message:
-            await websocket.send_json({
-                "type": "error",
-                "error": "No message provided"
-            })
-            return
+        # Get the streaming response from orchestrator, coalescing
+        # text chunks into fewer, larger frames
+        async with aclosing(_coalesced_frames(
+            orchestrator.process_user_message_stream(session_id, user_message)
+        )) as frames:
+            async for response_data in frames:
+                tools_used = response_data["tools_used"]
+
+                # Log when tool calls are received, once per distinct set
+                if tools_used:
+                    key = orjson.dumps(tools_used, option=orjson.OPT_SORT_KEYS)
+                    if key not in tool_calls_seen:
+                        tool_calls_seen.add(key)
+                        logger.info(
+                            "Tool calls received",
+                            session_id=session_id,
+                            tool_calls=tools_used
+                        )
+
+                await _send_ws_frame(websocket, response_data, encode)
+
+        # Send completion message
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        await _send_ws_frame(websocket, {
+            "type": "complete",
+            "processing_time_ms": processing_time_ms
+        }, encode)
+
+    except LLMError as e:
+        # Handle LLM errors gracefully
+        await _send_ws_frame(websocket, {
+            "type": "error",
+            "error": "I'm having trouble connecting to my AI services right now. Please try again in a moment.",
+            "error_details": str(e)
+        }, encode)
 
-        logger.info(
-            "WebSocket chat request received",
+    except Exception as e:
+        # Handle unexpected errors
+        logger.error(
+            "WebSocket chat processing failed",
             session_id=session_id,
-            message_length=len(user_message),
-            message_preview=user_message[:50] + "..." if len(user_message) > 50 else user_message
+            error=str(e)
         )
 
-        # Process the message with streaming
-        start_time = time.time()
-        tool_calls_logged = []
+        await _send_ws_frame(websocket, {
+            "type": "error",
+            "error": "An unexpected error occurred. Please try again.",
+            "error_details": str(e)
+        }, encode)
 
-        try:
-            # Get the streaming response from orchestrator
-            async for chunk in orchestrator.process_user_message_stream(
-                session_id, user_message
-            ):
-                # Handle both LLMResponse objects and dictionary chunks
-                if hasattr(chunk, 'content'):
-                    # LLMResponse object
-                    tools_used = chunk.tool_calls
-                    response_data = {
-                        "type": "chunk",
-                        "content": chunk.content,
-                        "finish_reason": chunk.finish_reason,
-                        "model": chunk.model,
-                        "usage": chunk.usage,
-                        "tools_used": tools_used
-                    }
-                else:
-                    # Dictionary chunk (from error handling)
-                    tools_used = chunk.get("tool_calls")
-                    response_data = {
-                        "type": "chunk",
-                        "content": chunk.get("content", ""),
-                        "finish_reason": chunk.get("finish_reason"),
-                        "model": chunk.get("model"),
-                        "usage": chunk.get("usage"),
-                        "tools_used": tools_used
-                    }
-
-                # Log when tool calls are received
-                if tools_used and tools_used not in tool_calls_logged:
-                    tool_calls_logged.append(tools_used)
-                    logger.info(
-                        "Tool calls received",
-                        session_id=session_id,
-                        tool_calls=tools_used
-                    )
 
-                await websocket.send_json(response_data)
-
-            # Send completion message
-            processing_time_ms = int((time.time() - start_time) * 1000)
-            await websocket.send_json({
-                "type": "complete",
-                "processing_time_ms": processing_time_ms
-            })
-
-        except LLMError as e:
-            # Handle LLM errors gracefully
-            await websocket.send_json({
-                "type": "error",
-                "error": "I'm having trouble connecting to my AI services right now. Please try again in a moment.",
-                "error_details": str(e)
-            })
-
-        except Exception as e:
-            # Handle unexpected errors
-            logger.error(
-                "WebSocket chat processing failed",
+@app.websocket("/ws/chat/{session_id}")
+async def chat_websocket(
+    websocket: WebSocket,
+    session_id: str,
+    orchestrator: ConversationOrchestrator = Depends(get_orchestrator)
+) -> None:
+    """WebSocket endpoint for real-time streaming chat responses.
+
+    The connection stays open for further messages after each reply, so
+    clients can reuse it across turns instead of reconnecting.
+    """
+    # Speak MessagePack when the client offers it, JSON otherwise
+    use_msgpack = WS_MSGPACK_SUBPROTOCOL in websocket.scope.get("subprotocols", ())
+    await websocket.accept(
+        subprotocol=WS_MSGPACK_SUBPROTOCOL if use_msgpack else None
+    )
+    encode = _msgpack_encoder.encode if use_msgpack else orjson.dumps
+    
+    try:
+        while True:
+            # Receive the next user message
+            if use_msgpack:
+                message_data = msgspec.msgpack.decode(
+                    await websocket.receive_bytes()
+                )
+            else:
+                message_data = await websocket.receive_json()
+            user_message = message_data.get("message")
+            
+            if not user_message:
+                await _send_ws_frame(websocket, {
+                    "type": "error",
+                    "error": "No message provided"
+                }, encode)
+                continue
+
+            logger.info(
+                "WebSocket chat request received",
                 session_id=session_id,
-                error=str(e)
+                message_length=len(user_message),
+                message_preview=user_message[:50] + "..." if len(user_message) > 50 else user_message
+            )
+
+            await _stream_ws_reply(
+                websocket, orchestrator, session_id, user_message, encode
             )
-            
-            await websocket.send_json({
-                "type": "error",
-                "error": "An unexpected error occurred. Please try again.",
-                "error_details": str(e)
-            })
 
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for session {session_id}")
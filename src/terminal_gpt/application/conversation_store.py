@@ -0,0 +1,369 @@
+"""Bounded in-memory storage for active conversations."""
+
+import asyncio
+import os
+import shelve
+import weakref
+from collections import OrderedDict
+from collections.abc import ItemsView, MutableMapping, ValuesView
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional, Tuple
+
+import orjson
+
+from ..domain.models import ConversationState
+
+
+class ShelveSpill:
+    """Disk storage for conversations evicted from a ConversationStore.
+
+    States are kept as JSON in a ``shelve`` database so cold sessions can be
+    restored when their user comes back.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the spill file.
+
+        Args:
+            path: Filename of the shelve database
+        """
+        self._db = shelve.open(path)
+
+    def save(self, session_id: str, conversation: ConversationState) -> None:
+        """Write a conversation to disk."""
+        self._db[session_id] = conversation.model_dump_json()
+
+    def load(self, session_id: str) -> Optional[ConversationState]:
+        """Read a conversation back from disk and remove it there."""
+        data = self._db.pop(session_id, None)
+        if data is None:
+            return None
+        return ConversationState.model_validate_json(data)
+
+    def discard(self, session_id: str) -> None:
+        """Remove a conversation from disk, if present."""
+        self._db.pop(session_id, None)
+
+    def __contains__(self, session_id: object) -> bool:
+        return isinstance(session_id, str) and session_id in self._db
+
+    def close(self) -> None:
+        """Flush and close the database."""
+        self._db.close()
+
+
+class ConversationJournal:
+    """Append-only log of conversation changes, replayed after a restart.
+
+    Each stored turn appends one JSON line: the messages added since the
+    previous state and how many of the oldest were trimmed, or a full
+    snapshot when the history was rewritten otherwise (e.g. summarized) or
+    ``snapshot_every`` messages have been appended since the last one.
+    Loading replays the log and compacts it to one snapshot per session,
+    which keeps the file bounded across restarts.
+    """
+
+    def __init__(self, path: str, snapshot_every: int = 50):
+        """
+        Initialize the journal.
+
+        Args:
+            path: File the journal is appended to
+            snapshot_every: Appended messages after which a snapshot is written
+        """
+        self.path = Path(path)
+        self.snapshot_every = snapshot_every
+        self._appended: Dict[str, int] = {}
+        self._file: Optional[BinaryIO] = None
+
+    def load(self) -> Dict[str, ConversationState]:
+        """Replay the journal, compact it and open it for appending.
+
+        Sessions are returned least recently changed first.
+        """
+        states: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            with self.path.open("rb") as journal:
+                for line in journal:
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        break  # Torn final write
+                    self._replay(states, record)
+
+        conversations = {
+            session_id: ConversationState.model_validate(state)
+            for session_id, state in states.items()
+        }
+
+        # Rewrite as one snapshot per session, then append from there
+        compacted = self.path.with_suffix(self.path.suffix + ".tmp")
+        with compacted.open("wb") as journal:
+            for conversation in conversations.values():
+                journal.write(self._snapshot_line(conversation))
+        os.replace(compacted, self.path)
+        self._file = self.path.open("ab")
+        self._appended = dict.fromkeys(conversations, 0)
+        return conversations
+
+    def record(
+        self,
+        conversation: ConversationState,
+        previous: Optional[ConversationState]
+    ) -> None:
+        """Append a stored state, as a delta from ``previous`` when possible."""
+        session_id = conversation.session_id
+        delta = self._delta(conversation, previous) if previous is not None else None
+        if delta is not None:
+            trimmed, kept = delta
+            added = conversation.messages[kept:]
+            appended = self._appended.get(session_id, 0) + len(added)
+            if appended < self.snapshot_every:
+                self._write(orjson.dumps({
+                    "op": "append",
+                    "session_id": session_id,
+                    "trim": trimmed,
+                    "fields": conversation.model_dump(
+                        mode="json", exclude={"messages"}
+                    ),
+                    "messages": [msg.model_dump(mode="json") for msg in added]
+                }) + b"\n")
+                self._appended[session_id] = appended
+                return
+
+        self._write(self._snapshot_line(conversation))
+        self._appended[session_id] = 0
+
+    @staticmethod
+    def _delta(
+        conversation: ConversationState, previous: ConversationState
+    ) -> Optional[Tuple[int, int]]:
+        """Describe a state as trimmed and extended from the previous one.
+
+        Returns (oldest non-system messages dropped, messages kept), or None
+        when the history was rewritten some other way, e.g. summarized.
+        """
+        old, new = previous.messages, conversation.messages
+        if not old:
+            return 0, 0
+
+        # Find where the previous last message sits now; turns append few
+        # messages, so search from the end
+        last = old[-1]
+        kept = next(
+            (i + 1 for i in range(len(new) - 1, -1, -1) if new[i] is last), None
+        )
+        if kept is None:
+            return None
+
+        # The kept messages must be the old ones minus a run of the oldest
+        # regular messages, which is how trim_to_window shortens a history
+        trimmed = len(old) - kept
+        survivors = []
+        remaining = trimmed
+        for msg in old:
+            if msg.role != "system" and remaining > 0:
+                remaining -= 1
+            else:
+                survivors.append(msg)
+        if remaining or any(a is not b for a, b in zip(survivors, new[:kept])):
+            return None
+        return trimmed, kept
+
+    def remove(self, session_id: str) -> None:
+        """Record that a conversation ended."""
+        self._appended.pop(session_id, None)
+        self._write(orjson.dumps({"op": "delete", "session_id": session_id}) + b"\n")
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, line: bytes) -> None:
+        if self._file is None:
+            raise RuntimeError("ConversationJournal.load() must be called first")
+        self._file.write(line)
+        self._file.flush()
+
+    @staticmethod
+    def _snapshot_line(conversation: ConversationState) -> bytes:
+        return orjson.dumps({
+            "op": "snapshot",
+            "session_id": conversation.session_id,
+            "state": conversation.model_dump(mode="json")
+        }) + b"\n"
+
+    @staticmethod
+    def _replay(states: Dict[str, Dict[str, Any]], record: Dict[str, Any]) -> None:
+        session_id = record["session_id"]
+        if record["op"] == "snapshot":
+            states.pop(session_id, None)
+            states[session_id] = record["state"]
+        elif record["op"] == "append" and session_id in states:
+            # Reinsert so the order follows the latest change
+            state = states[session_id] = states.pop(session_id)
+            messages = state["messages"]
+            trim = record["trim"]
+            if trim:
+                kept = []
+                for msg in messages:
+                    if msg["role"] != "system" and trim > 0:
+                        trim -= 1
+                    else:
+                        kept.append(msg)
+                messages = kept
+            state.update(record["fields"])
+            state["messages"] = messages + record["messages"]
+        elif record["op"] == "delete":
+            states.pop(session_id, None)
+
+
+class ConversationStore(MutableMapping):
+    """LRU-bounded mapping of session IDs to conversation states.
+
+    The least recently used session is evicted once ``max_sessions`` is
+    exceeded. Message and character totals across all sessions are kept as
+    running counters so statistics don't need to scan every conversation.
+
+    With a ``spill``, evicted sessions are written to disk and transparently
+    restored on lookup; length, iteration and totals cover only the sessions
+    held in memory. With a ``journal``, every stored state and deletion is
+    logged and the journal's sessions are restored on construction; evicted
+    sessions leave the journal, surviving only through the spill. Spill and
+    journal writes are synchronous file I/O done inline, so under asyncio
+    they block the event loop for their duration; keep both on local disk.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 1000,
+        on_evict: Optional[Callable[[str, ConversationState], None]] = None,
+        spill: Optional[ShelveSpill] = None,
+        journal: Optional[ConversationJournal] = None
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            max_sessions: Maximum number of conversations kept in memory
+            on_evict: Optional callback invoked with each evicted session
+            spill: Optional disk storage for evicted sessions
+            journal: Optional change log used to survive restarts
+        """
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+
+        self.max_sessions = max_sessions
+        self._on_evict = on_evict
+        self._spill = spill
+        self._data: "OrderedDict[str, ConversationState]" = OrderedDict()
+        # (message count, character total) recorded when each state was stored
+        self._stats: Dict[str, Tuple[int, int]] = {}
+        self.total_messages = 0
+        self.total_chars = 0
+        # Per-session locks serializing read-modify-write turns. A lock lives
+        # as long as a turn holds or awaits it, even past its session's
+        # eviction, so no second lock can be handed out for the session.
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+            weakref.WeakValueDictionary()
+        )
+
+        # Restore journaled sessions before logging new changes. Sessions
+        # past max_sessions, the least recently changed, are evicted up
+        # front: they leave the journal and go to the spill, if any
+        self._journal = None
+        if journal is not None:
+            restored = list(journal.load().items())
+            overflow = max(len(restored) - max_sessions, 0)
+            for session_id, conversation in restored[:overflow]:
+                journal.remove(session_id)
+                if spill:
+                    spill.save(session_id, conversation)
+            for session_id, conversation in restored[overflow:]:
+                self[session_id] = conversation
+            self._journal = journal
+
+    def __getitem__(self, session_id: str) -> ConversationState:
+        conversation = self._data.get(session_id)
+        if conversation is None:
+            conversation = self._spill.load(session_id) if self._spill else None
+            if conversation is None:
+                raise KeyError(session_id)
+            self[session_id] = conversation
+            return conversation
+
+        self._data.move_to_end(session_id)
+        return conversation
+
+    def __setitem__(self, session_id: str, conversation: ConversationState) -> None:
+        previous = self._data.get(session_id)
+        if self._journal is not None and previous is not conversation:
+            self._journal.record(conversation, previous)
+        if previous is not None:
+            self._forget_stats(session_id)
+        self._data[session_id] = conversation
+        self._data.move_to_end(session_id)
+
+        message_count, char_total = conversation.stats()
+        self._stats[session_id] = (message_count, char_total)
+        self.total_messages += message_count
+        self.total_chars += char_total
+
+        while len(self._data) > self.max_sessions:
+            evicted_id, evicted = self._data.popitem(last=False)
+            self._forget_stats(evicted_id)
+            if self._journal is not None:
+                self._journal.remove(evicted_id)
+            if self._spill:
+                self._spill.save(evicted_id, evicted)
+            if self._on_evict:
+                self._on_evict(evicted_id, evicted)
+
+    def __delitem__(self, session_id: str) -> None:
+        if self._journal is not None and session_id in self:
+            self._journal.remove(session_id)
+        if self._spill and session_id in self._spill:
+            self._spill.discard(session_id)
+            if session_id not in self._data:
+                return
+        del self._data[session_id]
+        self._forget_stats(session_id)
+
+    def __contains__(self, session_id: object) -> bool:
+        # Membership checks don't count as use for LRU purposes
+        if session_id in self._data:
+            return True
+        return self._spill is not None and session_id in self._spill
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def items(self) -> ItemsView[str, ConversationState]:
+        """Iterate stored items without touching LRU order."""
+        return self._data.items()
+
+    def values(self) -> ValuesView[ConversationState]:
+        """Iterate stored conversations without touching LRU order."""
+        return self._data.values()
+
+    def lock(self, session_id: str) -> asyncio.Lock:
+        """Get the lock serializing updates to a session.
+
+        Callers must keep a reference while using it, e.g. ``async with``.
+        """
+        lock = self._locks.get(session_id)
+        if lock is None:
+            lock = self._locks[session_id] = asyncio.Lock()
+        return lock
+
+    def _forget_stats(self, session_id: str) -> None:
+        """Remove a session's recorded totals from the running counters."""
+        message_count, char_total = self._stats.pop(session_id)
+        self.total_messages -= message_count
+        self.total_chars -= char_total
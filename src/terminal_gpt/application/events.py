@@ -6,12 +6,23 @@ coordination without tight coupling.
 """
 
 import asyncio
+import inspect
+import itertools
+import os
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Callable, Type, TypeVar, Generic
+from typing import (
+    Any, Awaitable, Dict, List, Optional, Callable, Sequence, Tuple, Type, TypeVar,
+    Generic, Union
+)
 from enum import Enum
 
+from ..infrastructure.logging import get_logger
+
+logger = get_logger("terminal_gpt.events")
+
 
 class EventPriority(Enum):
     """Priority levels for event processing."""
@@ -31,7 +42,7 @@ class EventCategory(Enum):
     CONVERSATION = "conversation"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Event:
     """Base event class.
 
@@ -53,14 +64,14 @@ class Event:
 
 
 # Specific event types
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserMessageReceived(Event):
     """Event fired when a user message is received."""
     session_id: str
     message_content: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AssistantMessageGenerated(Event):
     """Event fired when an assistant response is generated."""
     session_id: str
@@ -68,7 +79,7 @@ class AssistantMessageGenerated(Event):
     tokens_used: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PluginExecuted(Event):
     """Event fired when a plugin is executed."""
     plugin_name: str
@@ -77,7 +88,7 @@ class PluginExecuted(Event):
     session_id: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LLMCallCompleted(Event):
     """Event fired when an LLM API call completes."""
     provider: str
@@ -87,7 +98,7 @@ class LLMCallCompleted(Event):
     duration_ms: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConversationErrorOccurred(Event):
     """Event fired when a conversation error occurs."""
     session_id: str
@@ -95,7 +106,7 @@ class ConversationErrorOccurred(Event):
     error_message: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SystemHealthCheck(Event):
     """Event fired during system health checks."""
     component: str
@@ -105,6 +116,41 @@ class SystemHealthCheck(Event):
 
 EventType = TypeVar('EventType', bound=Event)
 
+_gather = asyncio.gather
+
+
+async def _run_concurrently(coros: List[Awaitable[None]]) -> None:
+    """Await handler coroutines concurrently, swallowing their errors.
+
+    Most events have a single handler, so that case is awaited directly
+    rather than paying for gather's bookkeeping.
+    """
+    if len(coros) == 1:
+        try:
+            await coros[0]
+        except Exception as e:
+            logger.error(
+                "Event handler failed", error=str(e), error_type=type(e).__name__
+            )
+    elif coros:
+        results = await _gather(*coros, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(
+                    "Event handler failed",
+                    error=str(result),
+                    error_type=type(result).__name__
+                )
+
+
+# Monotonic sequence making event IDs unique without formatting timestamps
+_event_seq = itertools.count()
+
+
+def _make_event_id(prefix: str) -> str:
+    """Build a unique event ID from a prefix and the event sequence."""
+    return f"{prefix}-{next(_event_seq)}"
+
 
 class EventHandler(Generic[EventType], ABC):
     """Abstract base class for event handlers."""
@@ -114,6 +160,19 @@ class EventHandler(Generic[EventType], ABC):
         """Handle an event asynchronously."""
         pass
 
+    async def handle_batch(self, events: Sequence[EventType]) -> None:
+        """Handle a batch of events drained from the queue together.
+
+        Handlers can override this to amortize I/O across the batch. The
+        default handles each event in order, so one failing event does not
+        stop the rest of the batch from being handled.
+        """
+        for event in events:
+            try:
+                await self.handle(event)
+            except Exception:
+                logger.exception("Event handler failed", event_id=event.event_id)
+
     @property
     @abstractmethod
     def event_type(self) -> Type[EventType]:
@@ -124,22 +183,43 @@ class EventHandler(Generic[EventType], ABC):
 class EventBus:
     """Central event bus for publishing and subscribing to events."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_queued: int = 10_000,
+        workers: Optional[int] = None,
+        max_batch: int = 64
+    ):
         self._handlers: Dict[Type[Event], List[EventHandler]] = {}
+        # Frozen snapshot of _handlers used on the dispatch path
+        self._dispatch: Dict[Type[Event], Tuple[EventHandler, ...]] = {}
+        # Middleware is split by kind when added so dispatch doesn't inspect it
         self._middleware: List[Callable[[Event], None]] = []
+        self._async_middleware: List[Callable[[Event], Awaitable[None]]] = []
         self._running = False
-        self._queue: asyncio.Queue[Event] = asyncio.Queue()
-        self._task: Optional[asyncio.Task] = None
+        self._workers = workers or os.cpu_count() or 4
+        # One queue per worker, sharing the bound so publishers are slowed
+        # down when handlers fall behind. Events of one session always land
+        # on the same queue, so they are handled in publish order.
+        shard_size = max(1, max_queued // self._workers)
+        self._queues: List[asyncio.Queue[Event]] = [
+            asyncio.Queue(maxsize=shard_size) for _ in range(self._workers)
+        ]
+        # Most events a worker takes off its queue for a single dispatch
+        self._max_batch = max_batch
+        self._tasks: List[asyncio.Task] = []
 
     async def start(self) -> None:
-        """Start the event processing loop."""
+        """Start the event processing workers."""
         if self._running:
             return
 
         self._running = True
-        self._task = asyncio.create_task(self._process_events())
+        self._tasks = [
+            asyncio.create_task(self._process_events(queue))
+            for queue in self._queues
+        ]
         await self.publish(SystemHealthCheck(
-            event_id=f"system-start-{datetime.utcnow().isoformat()}",
+            event_id=_make_event_id("system-start"),
             category=EventCategory.SYSTEM,
             priority=EventPriority.NORMAL,
             timestamp=datetime.utcnow(),
@@ -151,17 +231,24 @@ class EventBus:
         ))
 
     async def stop(self) -> None:
-        """Stop the event processing loop."""
+        """Stop the event processing workers."""
         if not self._running:
             return
 
         self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def join(self) -> None:
+        """Wait until every queued event has been processed."""
+        await asyncio.gather(*(queue.join() for queue in self._queues))
+
+    def _queue_for(self, event: Event) -> "asyncio.Queue[Event]":
+        """Pick the worker queue for an event, by session or event type."""
+        key = getattr(event, "session_id", None) or type(event)
+        return self._queues[hash(key) % len(self._queues)]
 
     def register_handler(self, handler: EventHandler) -> None:
         """Register an event handler."""
@@ -169,6 +256,7 @@ class EventBus:
         if event_type not in self._handlers:
             self._handlers[event_type] = []
         self._handlers[event_type].append(handler)
+        self._dispatch[event_type] = tuple(self._handlers[event_type])
 
     def unregister_handler(self, handler: EventHandler) -> None:
         """Unregister an event handler."""
@@ -177,54 +265,125 @@ class EventBus:
             self._handlers[event_type].remove(handler)
             if not self._handlers[event_type]:
                 del self._handlers[event_type]
-
-    def add_middleware(self, middleware: Callable[[Event], None]) -> None:
-        """Add middleware that runs on all events."""
-        self._middleware.append(middleware)
+                del self._dispatch[event_type]
+            else:
+                self._dispatch[event_type] = tuple(self._handlers[event_type])
+
+    def has_handlers(self, event_type: Type[Event]) -> bool:
+        """Check whether publishing an event type would reach anything.
+
+        Middleware runs on every event, so this is true whenever any
+        middleware is installed.
+        """
+        return (
+            bool(self._middleware or self._async_middleware)
+            or event_type in self._dispatch
+        )
+
+    def add_middleware(
+        self,
+        middleware: Union[
+            Callable[[Event], None], Callable[[Event], Awaitable[None]]
+        ]
+    ) -> None:
+        """Add middleware that runs on all events.
+
+        Coroutine functions are awaited alongside the event's handlers; plain
+        callables run inline before dispatch.
+        """
+        if inspect.iscoroutinefunction(middleware):
+            self._async_middleware.append(middleware)
+        else:
+            self._middleware.append(middleware)
 
     async def publish(self, event: Event) -> None:
         """Publish an event to all registered handlers."""
+        if not self.has_handlers(type(event)):
+            # Nobody is listening, so there is nothing to queue
+            return
+
         if not self._running:
             # If not running, process synchronously for startup/shutdown events
             await self._process_event(event)
             return
 
-        await self._queue.put(event)
+        await self._queue_for(event).put(event)
+
+    async def _process_events(self, queue: "asyncio.Queue[Event]") -> None:
+        """Event processing loop run by each worker over its own queue.
 
-    async def _process_events(self) -> None:
-        """Main event processing loop."""
+        Waits for one event, then takes up to ``max_batch`` more that are
+        already queued so handlers are dispatched once per batch instead of
+        once per event. Each worker only sees its own shard, so batches of
+        one session are processed one after another, in order.
+        """
         while self._running:
             try:
-                event = await self._queue.get()
-                await self._process_event(event)
-                self._queue.task_done()
+                batch = [await queue.get()]
+                while len(batch) < self._max_batch:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                try:
+                    await self._process_batch(batch)
+                finally:
+                    for _ in batch:
+                        queue.task_done()
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                # Log event processing errors (would use proper logging in real impl)
-                print(f"Error processing event: {e}")
+                logger.exception("Error processing events", error=str(e))
+
+    async def _process_batch(self, batch: List[Event]) -> None:
+        """Process a drained batch of events through middleware and handlers."""
+        by_type: Dict[Type[Event], List[Event]] = defaultdict(list)
+        for event in batch:
+            if self._middleware:
+                self._apply_middleware(event)
+            by_type[type(event)].append(event)
+
+        tasks = [
+            handler.handle_batch(events)
+            for event_type, events in by_type.items()
+            for handler in self._dispatch.get(event_type, ())
+        ]
+        if self._async_middleware:
+            tasks.extend(
+                middleware(event)
+                for event in batch
+                for middleware in self._async_middleware
+            )
+        await _run_concurrently(tasks)
 
-    async def _process_event(self, event: Event) -> None:
-        """Process a single event through middleware and handlers."""
-        # Apply middleware
+    def _apply_middleware(self, event: Event) -> None:
+        """Run all synchronous middleware on an event."""
         for middleware in self._middleware:
             try:
                 middleware(event)
             except Exception as e:
-                print(f"Middleware error: {e}")
+                logger.error(
+                    "Event middleware failed",
+                    event_id=event.event_id,
+                    error=str(e),
+                    error_type=type(e).__name__
+                )
 
-        # Find and call handlers
-        event_type = type(event)
-        if event_type in self._handlers:
-            handlers = self._handlers[event_type]
-            # Process handlers concurrently
-            tasks = [
-                handler.handle(event)
-                for handler in handlers
-                if isinstance(event, handler.event_type)
-            ]
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+    async def _process_event(self, event: Event) -> None:
+        """Process a single event through middleware and handlers."""
+        if self._middleware:
+            self._apply_middleware(event)
+
+        # Handlers are registered under their event type, so no isinstance
+        # check is needed here
+        tasks = [
+            handler.handle(event)
+            for handler in self._dispatch.get(type(event), ())
+        ]
+        if self._async_middleware:
+            tasks.extend(middleware(event) for middleware in self._async_middleware)
+        await _run_concurrently(tasks)
 
 
 # Global event bus instance
@@ -234,8 +393,10 @@ event_bus = EventBus()
 # Convenience functions for common event publishing
 async def publish_user_message(session_id: str, content: str) -> None:
     """Publish a user message received event."""
+    if not event_bus.has_handlers(UserMessageReceived):
+        return
     await event_bus.publish(UserMessageReceived(
-        event_id=f"user-msg-{session_id}-{datetime.utcnow().isoformat()}",
+        event_id=_make_event_id(f"user-msg-{session_id}"),
         category=EventCategory.USER,
         priority=EventPriority.NORMAL,
         timestamp=datetime.utcnow(),
@@ -249,8 +410,10 @@ async def publish_user_message(session_id: str, content: str) -> None:
 async def publish_assistant_response(session_id: str, content: str,
                                    tokens_used: Optional[int] = None) -> None:
     """Publish an assistant response generated event."""
+    if not event_bus.has_handlers(AssistantMessageGenerated):
+        return
     await event_bus.publish(AssistantMessageGenerated(
-        event_id=f"assistant-msg-{session_id}-{datetime.utcnow().isoformat()}",
+        event_id=_make_event_id(f"assistant-msg-{session_id}"),
         category=EventCategory.CONVERSATION,
         priority=EventPriority.NORMAL,
         timestamp=datetime.utcnow(),
@@ -265,9 +428,11 @@ async def publish_assistant_response(session_id: str, content: str,
 async def publish_plugin_execution(plugin_name: str, execution_time_ms: float,
                                  success: bool, session_id: Optional[str] = None) -> None:
     """Publish a plugin execution event."""
+    if not event_bus.has_handlers(PluginExecuted):
+        return
     priority = EventPriority.HIGH if not success else EventPriority.NORMAL
     await event_bus.publish(PluginExecuted(
-        event_id=f"plugin-{plugin_name}-{datetime.utcnow().isoformat()}",
+        event_id=_make_event_id(f"plugin-{plugin_name}"),
         category=EventCategory.PLUGIN,
         priority=priority,
         timestamp=datetime.utcnow(),
@@ -283,9 +448,11 @@ async def publish_plugin_execution(plugin_name: str, execution_time_ms: float,
 async def publish_llm_call(provider: str, model: str, tokens_used: int,
                           success: bool, duration_ms: float) -> None:
     """Publish an LLM call completion event."""
+    if not event_bus.has_handlers(LLMCallCompleted):
+        return
     priority = EventPriority.HIGH if not success else EventPriority.NORMAL
     await event_bus.publish(LLMCallCompleted(
-        event_id=f"llm-{provider}-{datetime.utcnow().isoformat()}",
+        event_id=_make_event_id(f"llm-{provider}"),
         category=EventCategory.LLM,
         priority=priority,
         timestamp=datetime.utcnow(),
@@ -302,8 +469,10 @@ async def publish_llm_call(provider: str, model: str, tokens_used: int,
 async def publish_conversation_error(session_id: str, error_type: str,
                                    error_message: str) -> None:
     """Publish a conversation error event."""
+    if not event_bus.has_handlers(ConversationErrorOccurred):
+        return
     await event_bus.publish(ConversationErrorOccurred(
-        event_id=f"error-{session_id}-{datetime.utcnow().isoformat()}",
+        event_id=_make_event_id(f"error-{session_id}"),
         category=EventCategory.CONVERSATION,
         priority=EventPriority.HIGH,
         timestamp=datetime.utcnow(),
@@ -318,9 +487,11 @@ async def publish_conversation_error(session_id: str, error_type: str,
 async def publish_health_check(component: str, status: str,
                               metrics: Dict[str, Any]) -> None:
     """Publish a system health check event."""
+    if not event_bus.has_handlers(SystemHealthCheck):
+        return
     priority = EventPriority.CRITICAL if status == "unhealthy" else EventPriority.LOW
     await event_bus.publish(SystemHealthCheck(
-        event_id=f"health-{component}-{datetime.utcnow().isoformat()}",
+        event_id=_make_event_id(f"health-{component}"),
         category=EventCategory.SYSTEM,
         priority=priority,
         timestamp=datetime.utcnow(),
@@ -1,16 +1,34 @@
 """Intelligent conversation orchestrator for Terminal GPT."""
 
-import json
+import asyncio
+import hashlib
+import logging
+import os
+import random
+import re
 import time
-from typing import Dict, List, Optional, Any
+from collections import deque
+from functools import partial
+from itertools import chain
+from types import MappingProxyType
+from typing import (
+    Any, AsyncGenerator, AsyncIterator, Coroutine, Deque, Dict, List, Mapping,
+    Optional, Set, Tuple, Union
+)
+
+import orjson
 
 from ..domain.models import Message, ConversationState, ConversationSummary
 from ..domain.exceptions import LLMError, PluginError, ValidationError
-from ..infrastructure.llm_providers import LLMProvider
+from ..infrastructure.llm_providers import LLMProvider, LLMResponse
+from ..infrastructure.llm_cache import LLMCache, request_key
 from ..domain.plugins import plugin_registry
 from ..application.events import (
     publish_user_message, publish_assistant_response,
-    publish_plugin_execution, publish_conversation_error
+    publish_plugin_execution, publish_conversation_error, publish_health_check
+)
+from ..application.conversation_store import (
+    ConversationJournal, ConversationStore, ShelveSpill
 )
 from ..infrastructure.logging import get_logger
 from ..infrastructure.prompt_manager import get_system_prompt
@@ -18,6 +36,100 @@ from ..infrastructure.context_summarizer import ContextSummarizer
 
 logger = get_logger("terminal_gpt.orchestrator")
 
+# Tool results are sent compact, since indentation only adds tokens for the
+# LLM; they are pretty-printed when DEBUG is set to ease reading transcripts.
+# Non-string keys are allowed to match what the stdlib json module accepted
+_TOOL_RESULT_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+if os.getenv("DEBUG", "false").lower() in ('true', '1', 'yes'):
+    _TOOL_RESULT_JSON_OPTIONS |= orjson.OPT_INDENT_2
+
+
+def _dump_tool_result(value: Any) -> str:
+    """Serialize a tool result or error payload for the LLM."""
+    return orjson.dumps(value, option=_TOOL_RESULT_JSON_OPTIONS).decode()
+
+
+# Marks the end of a stream forwarded by _pump_chunks
+_CHUNKS_END = object()
+
+
+async def _pump_chunks(
+    chunks: AsyncIterator[LLMResponse], queue: asyncio.Queue
+) -> None:
+    """Forward stream chunks into a queue, ending with a sentinel or the error."""
+    try:
+        async for chunk in chunks:
+            await queue.put(chunk)
+    except Exception as e:
+        await queue.put(e)
+        return
+    await queue.put(_CHUNKS_END)
+
+
+async def _coalesce_chunks(
+    chunks: AsyncIterator[LLMResponse], window_ns: int, max_chars: int
+) -> AsyncGenerator[LLMResponse, None]:
+    """Merge stream chunks arriving within ``window_ns`` of a batch's first.
+
+    A batch is flushed when its deadline passes, when a chunk carries tool
+    calls or a finish reason, or when its content reaches ``max_chars``, so
+    received text is never held longer than the window. Errors raised by the
+    stream are re-raised after any pending text has been flushed.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    producer = asyncio.create_task(_pump_chunks(chunks, queue))
+    loop = asyncio.get_running_loop()
+    window = window_ns / 1_000_000_000
+
+    try:
+        while True:
+            item = await queue.get()
+            deadline = loop.time() + window
+            pending: List[LLMResponse] = []
+            pending_chars = 0
+
+            while True:
+                if item is _CHUNKS_END or isinstance(item, Exception):
+                    if pending:
+                        yield _merge_chunks(pending)
+                    if item is _CHUNKS_END:
+                        return
+                    raise item
+
+                pending.append(item)
+                pending_chars += len(item.content)
+                if (
+                    item.tool_calls
+                    or item.finish_reason
+                    or pending_chars >= max_chars
+                ):
+                    break
+
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+
+            yield _merge_chunks(pending)
+    finally:
+        producer.cancel()
+
+
+def _merge_chunks(chunks: List[LLMResponse]) -> LLMResponse:
+    """Combine chunks into one, keeping the last chunk's metadata."""
+    if len(chunks) == 1:
+        return chunks[0]
+    return chunks[-1].model_copy(
+        update={"content": "".join(chunk.content for chunk in chunks)}
+    )
+
+
+# Generation settings for conversation turns, shared read-only by all requests
+_LLM_CONFIG = MappingProxyType({"temperature": 0.7, "max_tokens": 4096})
+
 # Terminal intents that should short-circuit tool calling
 TERMINAL_INTENTS = {
     "quit", "exit", "bye", "goodbye", "thanks", "thank you",
@@ -25,17 +137,40 @@ TERMINAL_INTENTS = {
 }
 
 
+# One compiled pass matching a message that starts with a terminal phrase as
+# a whole word, e.g. "bye!", "Thanks a bunch" or "see ya later"
+_TERMINAL_INTENT_RE = re.compile(
+    r"\s*(?:%s)\b" % "|".join(
+        sorted(map(re.escape, TERMINAL_INTENTS), key=len, reverse=True)
+    ),
+    re.IGNORECASE
+)
+
+
 def is_terminal_intent(message: str) -> bool:
     """Check if user message is a terminal/farewell intent."""
-    normalized = message.lower().strip().rstrip("!.")
-    # Check exact match or if message starts with terminal phrase
-    if normalized in TERMINAL_INTENTS:
-        return True
-    # Check for phrases like "thanks a bunch", "thanks anyway"
-    for intent in TERMINAL_INTENTS:
-        if normalized.startswith(intent):
-            return True
-    return False
+    return _TERMINAL_INTENT_RE.match(message) is not None
+
+
+# Fraction of max_conversation_length at which a background summary starts
+SUMMARIZE_HIGH_WATER_RATIO = 0.8
+
+# Rough per-message overhead of role and separators, in tokens
+_MESSAGE_TOKEN_OVERHEAD = 4
+
+
+def _estimate_tokens(msg: Message) -> int:
+    """Estimate a message's token count (about 4 characters per token)."""
+    return len(msg.content or "") // 4 + _MESSAGE_TOKEN_OVERHEAD
+
+
+# Replies to a terminal intent, picked at random
+_FAREWELLS = (
+    "👋 Catch you later!",
+    "No worries, talk soon!",
+    "All good, see ya!",
+    "Later! Hit me up if you need anything."
+)
 
 
 class ConversationOrchestrator:
@@ -47,26 +182,83 @@ class ConversationOrchestrator:
         max_conversation_length: int = 100,
         sliding_window_size: int = 50,
         enable_summarization: bool = False,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        max_parallel_tools: int = 4,
+        max_sessions: int = 1000,
+        response_cache: Optional[LLMCache] = None,
+        conversation_spill: Optional[ShelveSpill] = None,
+        conversation_journal: Optional[ConversationJournal] = None,
+        max_context_tokens: Optional[int] = None,
+        stream_coalesce_ms: float = 0.0,
+        stream_coalesce_chars: int = 2048
     ):
         """
         Initialize the conversation orchestrator.
 
         Args:
             llm_provider: LLM provider for generating responses
-            max_conversation_length: Maximum messages in conversation
-            sliding_window_size: Size of context window for LLM
+            max_conversation_length: Maximum messages in conversation. With
+                summarization off, history is already trimmed to
+                ``sliding_window_size`` regular messages each turn, so this
+                only has an effect when it is the smaller limit
+            sliding_window_size: Size of context window for LLM, and the
+                history kept when summarization is off
             enable_summarization: Whether to enable conversation summarization
             system_prompt: Optional system prompt to add to conversations
+            max_parallel_tools: Maximum plugins executing at the same time
+            max_sessions: Maximum conversations kept before the least
+                recently used one is evicted
+            response_cache: Optional cache of final LLM responses
+            conversation_spill: Optional disk storage for evicted
+                conversations, restored when their session returns
+            conversation_journal: Optional change log that active
+                conversations are restored from after a restart
+            max_context_tokens: Optional estimated token budget for the LLM
+                context; the oldest regular messages past it are left out
+            stream_coalesce_ms: Streamed chunks arriving within this many
+                milliseconds of the first unsent one are merged; 0 (the
+                default) disables, leaving batching to the transport
+            stream_coalesce_chars: Merged content size that is sent right away
         """
         self.llm_provider = llm_provider
         self.max_conversation_length = max_conversation_length
         self.sliding_window_size = sliding_window_size
         self.enable_summarization = enable_summarization
         self.system_prompt = system_prompt
-
-        # Active conversations (in production, this would be persistent storage)
-        self._conversations: Dict[str, ConversationState] = {}
+        self.max_context_tokens = max_context_tokens
+        self.stream_coalesce_ns = int(stream_coalesce_ms * 1_000_000)
+        self.stream_coalesce_chars = stream_coalesce_chars
+        self._tool_semaphore = asyncio.Semaphore(max_parallel_tools)
+        self.response_cache = response_cache
+        self._provider_open = False
+        # Provider calls in flight, keyed by request_key, for coalescing
+        self._inflight: Dict[str, "asyncio.Task[LLMResponse]"] = {}
+
+        # Event publications running in the background; references are held
+        # here so the tasks aren't garbage collected before they finish
+        self._pending_events: Set[asyncio.Task] = set()
+
+        # Tool definitions keyed by the plugin registry version they came from
+        self._tools_cache: Tuple[int, Tuple[Dict[str, Any], ...]] = (-1, ())
+
+        # Background summarizations per session, with the state they started from
+        self._summarize_tasks: Dict[
+            str, Tuple[ConversationState, "asyncio.Task[Optional[ConversationState]]"]
+        ] = {}
+
+        # Last formatted LLM context per session: (selected messages, dicts)
+        self._context_cache: Dict[
+            str, Tuple[List[Message], List[Dict[str, Any]]]
+        ] = {}
+
+        # Active conversations (in production, this would be persistent
+        # storage). Created last, as the eviction callback uses the state above
+        self._conversations = ConversationStore(
+            max_sessions=max_sessions,
+            on_evict=self._on_conversation_evicted,
+            spill=conversation_spill,
+            journal=conversation_journal
+        )
 
     async def start_conversation(self, session_id: str) -> ConversationState:
         """Start a new conversation session."""
@@ -102,139 +294,189 @@ class ConversationOrchestrator:
 
         This is the main entry point for conversation processing.
         """
-        try:
-            # Get or create conversation
-            if session_id not in self._conversations:
-                await self.start_conversation(session_id)
+        # Turns of one session are serialized so none is lost to a race
+        async with self._conversations.lock(session_id):
+            try:
+                # Get or create conversation
+                if session_id not in self._conversations:
+                    await self.start_conversation(session_id)
 
-            conversation = self._conversations[session_id]
+                conversation = self._conversations[session_id]
+                conversation = await self._apply_background_summary(conversation)
 
-            # Add user message
-            user_message = Message(role="user", content=user_content)
-            conversation = conversation.add_message(user_message)
+                # Add user message; this makes the turn's private copy, so later
+                # messages can be appended in place
+                user_message = Message(role="user", content=user_content)
+                conversation = conversation.add_message(user_message)
 
-            # Publish user message event
-            await publish_user_message(session_id, user_content)
+                # Bound per-turn work to the context window; the summarizer
+                # manages history itself when enabled
+                if not self.enable_summarization:
+                    conversation = conversation.trim_to_window(self.sliding_window_size)
 
-            # Generate assistant response
-            response_content = await self._generate_assistant_response(conversation)
+                # Publish user message event
+                self._publish_in_background(
+                    publish_user_message(session_id, user_content)
+                )
 
-            # Add assistant response
-            assistant_message = Message(role="assistant", content=response_content)
-            conversation = conversation.add_message(assistant_message)
+                # Generate assistant response
+                response_content = await self._generate_assistant_response(conversation)
 
-            # Update conversation state
-            self._conversations[session_id] = conversation
+                # Add assistant response
+                assistant_message = Message(role="assistant", content=response_content)
+                conversation.append_message(assistant_message)
 
-            # Publish assistant response event
-            await publish_assistant_response(session_id, response_content)
+                # Publish assistant response event
+                self._publish_in_background(
+                    publish_assistant_response(session_id, response_content)
+                )
 
-            # Manage conversation length
-            conversation = await self._manage_conversation_length(conversation)
-            self._conversations[session_id] = conversation
+                # Manage conversation length and update conversation state once
+                conversation = await self._manage_conversation_length(conversation)
+                self._conversations[session_id] = conversation
 
-            return response_content
+                return response_content
 
-        except Exception as e:
-            # Publish conversation error event
-            await publish_conversation_error(
-                session_id=session_id,
-                error_type=type(e).__name__,
-                error_message=str(e)
-            )
-            raise
+            except Exception as e:
+                # Publish conversation error event
+                self._publish_in_background(publish_conversation_error(
+                    session_id=session_id,
+                    error_type=type(e).__name__,
+                    error_message=str(e)
+                ))
+                raise
+
+    async def process_user_messages_batch(
+        self,
+        requests: List[Tuple[str, str]]
+    ) -> List[Union[str, BaseException]]:
+        """
+        Process a batch of (session_id, user_content) pairs concurrently.
+
+        Messages for the same session are processed in arrival order so the
+        conversation history stays consistent; distinct sessions run in
+        parallel. Results are returned in input order, with failures returned
+        as exception instances rather than raised.
+        """
+        results: List[Union[str, BaseException]] = [None] * len(requests)
+
+        # Group request indices by session, preserving arrival order
+        by_session: Dict[str, List[int]] = {}
+        for index, (session_id, _) in enumerate(requests):
+            by_session.setdefault(session_id, []).append(index)
+
+        async def run_session(session_id: str, indices: List[int]) -> None:
+            for index in indices:
+                try:
+                    results[index] = await self.process_user_message(
+                        session_id, requests[index][1]
+                    )
+                except Exception as e:
+                    results[index] = e
+
+        await asyncio.gather(*(
+            run_session(session_id, indices)
+            for session_id, indices in by_session.items()
+        ))
+
+        return results
 
     async def process_user_message_stream(
         self,
         session_id: str,
         user_content: str
-    ):
+    ) -> AsyncGenerator[LLMResponse, None]:
         """
         Process a user message and stream the assistant's response.
 
         This is the main entry point for streaming conversation processing.
+        Every chunk, including farewell and error replies, is an LLMResponse.
         """
-        try:
-            # Get or create conversation
-            if session_id not in self._conversations:
-                await self.start_conversation(session_id)
+        # Turns of one session are serialized so none is lost to a race
+        async with self._conversations.lock(session_id):
+            try:
+                # Get or create conversation
+                if session_id not in self._conversations:
+                    await self.start_conversation(session_id)
 
-            conversation = self._conversations[session_id]
+                conversation = self._conversations[session_id]
+                conversation = await self._apply_background_summary(conversation)
 
-            # Check for terminal intent BEFORE adding message or calling LLM
-            if is_terminal_intent(user_content):
-                logger.info(
-                    "Terminal intent detected, skipping tool calls",
-                    session_id=session_id,
-                    user_content=user_content
-                )
-                # Reset tool cycle and mark awaiting user
+                # Check for terminal intent BEFORE adding message or calling LLM
+                if is_terminal_intent(user_content):
+                    logger.info(
+                        "Terminal intent detected, skipping tool calls",
+                        session_id=session_id,
+                        user_content=user_content
+                    )
+                    # Reset tool cycle and mark awaiting user
+                    conversation = conversation.copy(
+                        update={
+                            'tool_cycle_count': 0,
+                            'awaiting_user': True,
+                            'active_task': None
+                        }
+                    )
+                    # Add user message
+                    user_message = Message(role="user", content=user_content)
+                    conversation = conversation.add_message(user_message)
+                
+                    # Yield a simple farewell response
+                    farewell = random.choice(_FAREWELLS)
+                
+                    yield LLMResponse(
+                        content=farewell,
+                        finish_reason="stop",
+                        model="terminal-gpt",
+                        usage={}
+                    )
+                
+                    # Add assistant response to conversation
+                    assistant_message = Message(role="assistant", content=farewell)
+                    conversation.append_message(assistant_message)
+                    self._conversations[session_id] = conversation
+                    return
+
+                # Reset tool cycle count for new user turn
                 conversation = conversation.copy(
                     update={
                         'tool_cycle_count': 0,
-                        'awaiting_user': True,
-                        'active_task': None
+                        'awaiting_user': False
                     }
                 )
+
                 # Add user message
                 user_message = Message(role="user", content=user_content)
                 conversation = conversation.add_message(user_message)
-                
-                # Yield a simple farewell response
-                farewell_responses = [
-                    "👋 Catch you later!",
-                    "No worries, talk soon!",
-                    "All good, see ya!",
-                    "Later! Hit me up if you need anything."
-                ]
-                import random
-                farewell = random.choice(farewell_responses)
-                
-                yield {
-                    "content": farewell,
-                    "finish_reason": "stop",
-                    "model": "terminal-gpt",
-                    "usage": {},
-                    "tool_calls": []
-                }
-                
-                # Add assistant response to conversation
-                assistant_message = Message(role="assistant", content=farewell)
-                conversation = conversation.add_message(assistant_message)
-                self._conversations[session_id] = conversation
-                return
-
-            # Reset tool cycle count for new user turn
-            conversation = conversation.copy(
-                update={
-                    'tool_cycle_count': 0,
-                    'awaiting_user': False
-                }
-            )
 
-            # Add user message
-            user_message = Message(role="user", content=user_content)
-            conversation = conversation.add_message(user_message)
+                # Bound per-turn work to the context window; the summarizer
+                # manages history itself when enabled
+                if not self.enable_summarization:
+                    conversation = conversation.trim_to_window(self.sliding_window_size)
 
-            # Publish user message event
-            await publish_user_message(session_id, user_content)
+                # Publish user message event
+                self._publish_in_background(
+                    publish_user_message(session_id, user_content)
+                )
 
-            # Generate assistant response with streaming
-            async for chunk in self._generate_assistant_response_stream(conversation):
-                yield chunk
+                # Generate assistant response with streaming
+                async for chunk in self._generate_assistant_response_stream(
+                    conversation
+                ):
+                    yield chunk
 
-            # Manage conversation length
-            conversation = await self._manage_conversation_length(conversation)
-            self._conversations[session_id] = conversation
+                # Manage conversation length
+                conversation = await self._manage_conversation_length(conversation)
+                self._conversations[session_id] = conversation
 
-        except Exception as e:
-            # Publish conversation error event
-            await publish_conversation_error(
-                session_id=session_id,
-                error_type=type(e).__name__,
-                error_message=str(e)
-            )
-            raise
+            except Exception as e:
+                # Publish conversation error event
+                self._publish_in_background(publish_conversation_error(
+                    session_id=session_id,
+                    error_type=type(e).__name__,
+                    error_message=str(e)
+                ))
+                raise
 
     async def _generate_assistant_response(self, conversation: ConversationState) -> str:
         """Generate an assistant response, potentially involving tool calls."""
@@ -247,30 +489,29 @@ class ConversationOrchestrator:
             # Prepare context for LLM
             messages = self._prepare_context_messages(conversation)
             tools = self._get_available_tools()
+            cache_key = self._response_cache_key(messages, tools, _LLM_CONFIG)
+            # Cacheable requests are already hashed into their cache key
+            key = cache_key or request_key(
+                self.llm_provider.model, messages, tools, _LLM_CONFIG
+            )
 
             try:
-                # Generate LLM response
-                start_time = time.time()
-                async with self.llm_provider:
-                    llm_response = await self.llm_provider.generate(
-                        messages=messages,
-                        tools=tools,
-                        config={
-                            "temperature": 0.7,
-                            "max_tokens": 4096
-                        }
-                    )
-                duration_ms = int((time.time() - start_time) * 1000)
-
-                logger.info(
-                    "LLM response generated",
-                    session_id=conversation.session_id,
-                    duration_ms=duration_ms,
-                    tokens_used=(
-                        llm_response.usage.get("total_tokens", 0)
-                        if llm_response.usage else 0
+                # Generate LLM response, unless an identical request is cached
+                start_ns = time.perf_counter_ns()
+                llm_response = await self._get_cached_response(cache_key)
+                if llm_response is None:
+                    llm_response = await self._generate_shared(key, messages, tools)
+                    await self._store_response(cache_key, llm_response)
+                if logger.is_enabled_for(logging.INFO):
+                    logger.info(
+                        "LLM response generated",
+                        session_id=conversation.session_id,
+                        duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
+                        tokens_used=(
+                            llm_response.usage.get("total_tokens", 0)
+                            if llm_response.usage else 0
+                        )
                     )
-                )
 
                 # Check for tool calls
                 if llm_response.tool_calls:
@@ -317,7 +558,9 @@ class ConversationOrchestrator:
         )
         return "I'm sorry, but this conversation has become too complex. Please start a new conversation."
 
-    async def _generate_assistant_response_stream(self, conversation: ConversationState):
+    async def _generate_assistant_response_stream(
+        self, conversation: ConversationState
+    ) -> AsyncGenerator[LLMResponse, None]:
         """Generate an assistant response with streaming, potentially involving tool calls.
         
         Enforces one tool cycle per user message to prevent runaway loops.
@@ -325,6 +568,7 @@ class ConversationOrchestrator:
         max_iterations = 3  # Reduced from 5 - one tool cycle + final answer max
         current_iteration = 0
         has_completed_tool_cycle = False
+        config = self._generation_config(conversation)
 
         while current_iteration < max_iterations:
             current_iteration += 1
@@ -345,35 +589,55 @@ class ConversationOrchestrator:
 
             try:
                 # Generate LLM response with streaming
-                start_time = time.time()
-                full_response = ""
+                start_ns = time.perf_counter_ns()
                 tool_calls_found = None
+                cache_key = self._response_cache_key(messages, tools, _LLM_CONFIG)
 
-                async with self.llm_provider:
-                    async for chunk in self.llm_provider.generate_stream(
+                cached_response = await self._get_cached_response(cache_key)
+                if cached_response is not None:
+                    # Replay an identical earlier request as a single chunk
+                    yield cached_response
+                    full_response = cached_response.content
+                else:
+                    finish_reason = None
+                    parts: List[str] = []
+                    await self._open_provider()
+                    stream = self.llm_provider.generate_stream(
                         messages=messages,
                         tools=tools,
-                        config={
-                            "temperature": 0.7,
-                            "max_tokens": 4096
-                        }
-                    ):
+                        config=config
+                    )
+                    if self.stream_coalesce_ns:
+                        stream = _coalesce_chunks(
+                            stream, self.stream_coalesce_ns, self.stream_coalesce_chars
+                        )
+                    async for chunk in stream:
                         # Yield the chunk for UI display
                         yield chunk
-                        full_response += chunk.content
+                        if chunk.content:
+                            parts.append(chunk.content)
+                        finish_reason = chunk.finish_reason or finish_reason
 
                         # Capture tool calls if present
                         if chunk.tool_calls and tool_calls_found is None:
                             tool_calls_found = chunk.tool_calls
 
-                duration_ms = int((time.time() - start_time) * 1000)
+                    full_response = "".join(parts)
+                    if full_response and not tool_calls_found:
+                        await self._store_response(cache_key, LLMResponse(
+                            content=full_response,
+                            model=self.llm_provider.model,
+                            finish_reason=finish_reason or "stop",
+                            usage={}
+                        ))
 
-                logger.info(
-                    "LLM streaming response completed",
-                    session_id=conversation.session_id,
-                    duration_ms=duration_ms,
-                    has_tool_calls=tool_calls_found is not None
-                )
+                if logger.is_enabled_for(logging.INFO):
+                    logger.info(
+                        "LLM streaming response completed",
+                        session_id=conversation.session_id,
+                        duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
+                        has_tool_calls=tool_calls_found is not None
+                    )
 
                 # Handle tool calls if found
                 if tool_calls_found:
@@ -445,16 +709,15 @@ class ConversationOrchestrator:
                     error_type=type(e).__name__,
                     iteration=current_iteration
                 )
-                yield {
-                    "content": (
+                yield LLMResponse(
+                    content=(
                         "I apologize, but I'm having trouble generating a "
                         "response right now. Please try again."
                     ),
-                    "finish_reason": "error",
-                    "model": self.llm_provider.model,
-                    "usage": {},
-                    "tool_calls": []
-                }
+                    finish_reason="error",
+                    model=self.llm_provider.model,
+                    usage={}
+                )
                 break
 
         # Max iterations reached
@@ -464,16 +727,149 @@ class ConversationOrchestrator:
                 session_id=conversation.session_id,
                 max_iterations=max_iterations
             )
-            yield {
-                "content": (
+            yield LLMResponse(
+                content=(
                     "I'm sorry, but this conversation has become too complex. "
                     "Please start a new conversation."
                 ),
-                "finish_reason": "length",
-                "model": self.llm_provider.model,
-                "usage": {},
-                "tool_calls": []
-            }
+                finish_reason="length",
+                model=self.llm_provider.model,
+                usage={}
+            )
+
+    def _generation_config(self, conversation: ConversationState) -> Dict[str, Any]:
+        """Build the provider config for a turn's LLM requests.
+
+        Built once per turn: it only adds the prompt cache key, which doesn't
+        change between tool iterations, to the shared ``_LLM_CONFIG``. Cache
+        and coalescing keys use ``_LLM_CONFIG`` itself so responses can be
+        shared across sessions. Calls shared that way are sent without the
+        session's prompt cache key, so only streamed turns use this config.
+        """
+        return {
+            **_LLM_CONFIG,
+            "prompt_cache_key": self._prompt_cache_key(conversation)
+        }
+
+    @staticmethod
+    def _prompt_cache_key(conversation: ConversationState) -> str:
+        """Get a stable key for the prompt prefix shared by a session's requests.
+
+        Context is only ever appended to between turns, so the session and its
+        leading system messages identify a prefix the provider can keep cached
+        and only prefill what follows.
+        """
+        digest = hashlib.sha256(conversation.session_id.encode())
+        for msg in conversation.messages:
+            if msg.role != "system":
+                break
+            digest.update(b"\0")
+            digest.update((msg.content or "").encode())
+        return digest.hexdigest()[:32]
+
+    def _response_cache_key(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[Tuple[Dict[str, Any], ...]],
+        config: Mapping[str, Any]
+    ) -> Optional[str]:
+        """Get the response cache key for a request, if it is cacheable."""
+        if self.response_cache is None:
+            return None
+        return self.response_cache.make_key(
+            self.llm_provider.model, messages, tools, config
+        )
+
+    async def _generate_shared(
+        self,
+        key: str,
+        messages: List[Dict[str, Any]],
+        tools: Optional[Tuple[Dict[str, Any], ...]]
+    ) -> LLMResponse:
+        """Generate a response, sharing one provider call between identical
+        requests that are in flight at the same time.
+
+        Requests from any session may join a call, so it is made with the
+        shared ``_LLM_CONFIG`` only, without a session's prompt cache key.
+        The call runs as its own task, so a caller being cancelled doesn't
+        abort it for the others waiting on it.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            await self._open_provider()
+            task = asyncio.create_task(self.llm_provider.generate(
+                messages=messages,
+                tools=tools,
+                config=dict(_LLM_CONFIG)
+            ))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._forget_inflight, key))
+        else:
+            logger.debug("Joining identical in-flight LLM request", request_key=key)
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: str, task: "asyncio.Task[LLMResponse]") -> None:
+        """Drop a finished shared call from the in-flight map.
+
+        Its error is retrieved here, since every caller may have been
+        cancelled before it finished.
+        """
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()
+
+    async def _get_cached_response(
+        self, cache_key: Optional[str]
+    ) -> Optional[LLMResponse]:
+        """Look up a cached response for a request key."""
+        if cache_key is None:
+            return None
+        return await self.response_cache.get(cache_key)
+
+    async def _store_response(
+        self, cache_key: Optional[str], response: LLMResponse
+    ) -> None:
+        """Cache a final response for a request key."""
+        if cache_key is not None:
+            await self.response_cache.set(cache_key, response)
+
+    async def _open_provider(self) -> None:
+        """Open the provider's client once for the orchestrator's lifetime.
+
+        Entering the provider per request would tear the client down between
+        tool iterations when nothing else holds it open.
+        """
+        if not self._provider_open:
+            await self.llm_provider.open()
+            self._provider_open = True
+
+    async def aclose(self) -> None:
+        """Close the provider's client."""
+        self._provider_open = False
+        await self.llm_provider.aclose()
+
+    def _publish_in_background(self, publication: Coroutine[Any, Any, None]) -> None:
+        """Run an event publication without blocking the conversation."""
+        task = asyncio.create_task(publication)
+        self._pending_events.add(task)
+        task.add_done_callback(self._on_event_published)
+
+    def _on_event_published(self, task: asyncio.Task) -> None:
+        """Forget a finished publication, logging it if it failed."""
+        self._pending_events.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            error = task.exception()
+            logger.error(
+                "Background event publication failed",
+                error=str(error),
+                error_type=type(error).__name__
+            )
+
+    async def drain_events(self) -> None:
+        """Wait for background event publications to finish."""
+        # Publications can schedule others (e.g. eviction health checks)
+        while self._pending_events:
+            await asyncio.gather(*self._pending_events, return_exceptions=True)
 
     def _prepare_context_messages(self, conversation: ConversationState) -> List[Dict[str, Any]]:
         """Prepare messages for LLM context, managing sliding window.
@@ -486,22 +882,31 @@ class ConversationOrchestrator:
         if len(all_messages) <= self.sliding_window_size:
             selected_messages = all_messages
         else:
-            # Use sliding window approach
-            # Always include system message if present
-            context_messages = []
-            regular_messages = []
-
-            for msg in all_messages:
-                if msg.role == "system":
-                    context_messages.append(msg)
-                else:
-                    regular_messages.append(msg)
+            # Use sliding window approach, always including system messages
+            system_count = conversation.system_count
+            if all(msg.role == "system" for msg in all_messages[:system_count]):
+                # Usual layout: system messages lead, so slice the window
+                # directly instead of walking the whole history
+                start = max(
+                    system_count, len(all_messages) - self.sliding_window_size
+                )
+                selected_messages = all_messages[:system_count] + all_messages[start:]
+            else:
+                # A system message was added mid-conversation; the bounded
+                # deque keeps only the most recent regular messages in one pass
+                context_messages = []
+                recent_messages: Deque[Message] = deque(
+                    maxlen=self.sliding_window_size
+                )
 
-            # Take most recent messages within window size
-            recent_messages = regular_messages[-self.sliding_window_size:]
+                for msg in all_messages:
+                    if msg.role == "system":
+                        context_messages.append(msg)
+                    else:
+                        recent_messages.append(msg)
 
-            # Combine system messages with recent conversation
-            selected_messages = context_messages + recent_messages
+                # Combine system messages with recent conversation
+                selected_messages = list(chain(context_messages, recent_messages))
 
             logger.info(
                 "Using sliding window context",
@@ -510,40 +915,108 @@ class ConversationOrchestrator:
                 context_messages=len(selected_messages)
             )
 
-        # Format messages for LLM API, including tool calling fields
-        formatted_messages = []
-        for msg in selected_messages:
-            formatted_msg: Dict[str, Any] = {"role": msg.role}
-            
-            # Handle content (can be None for assistant with tool_calls)
-            if msg.content is not None:
-                formatted_msg["content"] = msg.content
-            else:
-                formatted_msg["content"] = None
-            
-            # Include tool_calls for assistant messages
-            if msg.role == "assistant" and msg.tool_calls is not None:
-                formatted_msg["tool_calls"] = msg.tool_calls
-            
-            # Include tool_call_id and name for tool messages
-            if msg.role == "tool":
-                if msg.tool_call_id:
-                    formatted_msg["tool_call_id"] = msg.tool_call_id
-                if msg.name:
-                    formatted_msg["name"] = msg.name
-            
-            formatted_messages.append(formatted_msg)
+        if self.max_context_tokens is not None:
+            selected_messages = self._fit_token_budget(selected_messages)
+
+        formatted_messages = self._format_messages(
+            conversation.session_id, selected_messages
+        )
+
+        # Surface a note about messages physically trimmed from the window
+        if conversation.evicted_summary:
+            insert_at = next(
+                (i for i, m in enumerate(formatted_messages) if m["role"] != "system"),
+                len(formatted_messages)
+            )
+            formatted_messages.insert(insert_at, {
+                "role": "system",
+                "content": (
+                    "Earlier conversation (trimmed from context):\n"
+                    + conversation.evicted_summary
+                )
+            })
 
         return formatted_messages
 
-    def _get_available_tools(self) -> List[Dict[str, Any]]:
-        """Get tool definitions for available plugins."""
-        tools = plugin_registry.list_tools()
-        logger.info(
-            "Available tools for LLM",
-            tool_count=len(tools),
-            tool_names=[t.get("function", {}).get("name", "unknown") for t in tools]
+    def _fit_token_budget(self, messages: List[Message]) -> List[Message]:
+        """Drop the oldest regular messages that don't fit the token budget.
+
+        System messages are always kept and the newest regular message is
+        kept even if it alone exceeds the budget. Tool results left without
+        the assistant message that requested them are dropped too, since the
+        API rejects them.
+        """
+        budget = self.max_context_tokens - sum(
+            _estimate_tokens(msg) for msg in messages if msg.role == "system"
         )
+
+        # Walk newest to oldest until the budget runs out
+        keep_from = len(messages)
+        for index in range(len(messages) - 1, -1, -1):
+            msg = messages[index]
+            if msg.role == "system":
+                continue
+            budget -= _estimate_tokens(msg)
+            if budget < 0 and keep_from < len(messages):
+                break
+            keep_from = index
+
+        if keep_from == 0:
+            return messages
+
+        while keep_from < len(messages) - 1 and messages[keep_from].role == "tool":
+            keep_from += 1
+
+        return [
+            msg for msg in messages[:keep_from] if msg.role == "system"
+        ] + messages[keep_from:]
+
+    def _format_messages(
+        self, session_id: str, selected_messages: List[Message]
+    ) -> List[Dict[str, Any]]:
+        """Format messages for the LLM API, reusing the session's last output.
+
+        Each message builds its API dict once (``Message.as_llm_dict``). When
+        the selection only grew since the previous call (new turns, tool
+        results) the cached list is extended with just the new tail. A fresh
+        list is returned so callers can't disturb the cache.
+        """
+        cached_messages, formatted = self._context_cache.get(session_id, ((), None))
+        cached_count = len(cached_messages)
+        if formatted is not None and len(selected_messages) >= cached_count and all(
+            new is old for new, old in zip(selected_messages, cached_messages)
+        ):
+            # Common case: append only the new tail
+            formatted.extend(
+                msg.as_llm_dict for msg in selected_messages[cached_count:]
+            )
+        else:
+            # First call, or the window slid or history was rewritten
+            formatted = [msg.as_llm_dict for msg in selected_messages]
+
+        self._context_cache[session_id] = (list(selected_messages), formatted)
+        return list(formatted)
+
+    def _get_available_tools(self) -> Tuple[Dict[str, Any], ...]:
+        """Get tool definitions for available plugins.
+
+        The definitions are rebuilt only when the plugin registry changes;
+        a tuple is returned so callers can't modify the cached value.
+        """
+        version, tools = self._tools_cache
+        if version == plugin_registry.version:
+            return tools
+
+        tools = tuple(plugin_registry.list_tools())
+        self._tools_cache = (plugin_registry.version, tools)
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Available tools for LLM",
+                tool_count=len(tools),
+                tool_names=[
+                    t.get("function", {}).get("name", "unknown") for t in tools
+                ]
+            )
         return tools
 
     async def _execute_tool_calls(
@@ -551,16 +1024,15 @@ class ConversationOrchestrator:
         session_id: str,
         tool_calls: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """Execute tool calls and return results with tool_call_id."""
-        results = []
+        """Execute tool calls concurrently and return results with tool_call_id.
 
+        Results are returned in the order of ``tool_calls``. At most
+        ``max_parallel_tools`` plugins run at once.
+        """
+        # Fail loudly if any tool_call_id is missing, before running anything
         for tool_call in tool_calls:
-            tool_name = tool_call["function"]["name"]
-            tool_args_str = tool_call["function"]["arguments"]
-            tool_call_id = tool_call.get("id")
-
-            # Fail loudly if tool_call_id is missing
-            if not tool_call_id:
+            if not tool_call.get("id"):
+                tool_name = tool_call["function"]["name"]
                 logger.error(
                     "CRITICAL: tool_call_id missing from tool_call",
                     session_id=session_id,
@@ -571,33 +1043,49 @@ class ConversationOrchestrator:
                     f"tool_call_id is required but missing for tool: {tool_name}"
                 )
 
-            try:
-                # Parse tool arguments (JSON string to dict)
-                tool_args = json.loads(tool_args_str)
+        # Most turns request a single tool; skip gather's task overhead then
+        if len(tool_calls) == 1:
+            return [
+                await self._execute_tool_call(session_id, tool_calls[0])
+            ]
 
-                # Execute tool
-                start_time = time.time()
-                result = await plugin_registry.execute_tool_call(tool_name, tool_args)
-                duration_ms = int((time.time() - start_time) * 1000)
+        return list(await asyncio.gather(*(
+            self._execute_tool_call(session_id, tool_call)
+            for tool_call in tool_calls
+        )))
 
-                # Publish plugin execution event
-                await publish_plugin_execution(
-                    plugin_name=tool_name,
-                    execution_time_ms=duration_ms,
-                    success=True,
-                    session_id=session_id
-                )
+    async def _execute_tool_call(
+        self,
+        session_id: str,
+        tool_call: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Execute a single tool call, converting failures into error results."""
+        tool_name = tool_call["function"]["name"]
+        tool_args_str = tool_call["function"]["arguments"]
+        tool_call_id = tool_call["id"]
+
+        try:
+            # Parse tool arguments (JSON string to dict)
+            tool_args = orjson.loads(tool_args_str)
+
+            # Execute tool, bounded to respect backend rate limits
+            async with self._tool_semaphore:
+                start_ns = time.perf_counter_ns()
+                result = await plugin_registry.execute_tool_call(tool_name, tool_args)
+                duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
-                # Format result for LLM
-                result_content = json.dumps(result, indent=2)
+            # Publish plugin execution event
+            self._publish_in_background(publish_plugin_execution(
+                plugin_name=tool_name,
+                execution_time_ms=duration_ms,
+                success=True,
+                session_id=session_id
+            ))
 
-                results.append({
-                    "tool_name": tool_name,
-                    "tool_call_id": tool_call_id,
-                    "result": result_content,
-                    "success": True
-                })
+            # Format result for LLM
+            result_content = _dump_tool_result(result)
 
+            if logger.is_enabled_for(logging.INFO):
                 logger.info(
                     "Plugin executed successfully",
                     session_id=session_id,
@@ -606,72 +1094,79 @@ class ConversationOrchestrator:
                     duration_ms=duration_ms
                 )
 
-            except PluginError as e:
-                # Publish failed plugin execution event
-                await publish_plugin_execution(
-                    plugin_name=tool_name,
-                    execution_time_ms=0,
-                    success=False,
-                    session_id=session_id
-                )
+            return {
+                "tool_name": tool_name,
+                "tool_call_id": tool_call_id,
+                "result": result_content,
+                "success": True
+            }
 
-                # Return error result to LLM
-                error_result = json.dumps({
+        except PluginError as e:
+            # Publish failed plugin execution event
+            self._publish_in_background(publish_plugin_execution(
+                plugin_name=tool_name,
+                execution_time_ms=0,
+                success=False,
+                session_id=session_id
+            ))
+
+            logger.error(
+                "Plugin execution failed",
+                session_id=session_id,
+                plugin_name=tool_name,
+                tool_call_id=tool_call_id,
+                error=str(e)
+            )
+
+            # Return error result to LLM
+            return {
+                "tool_name": tool_name,
+                "tool_call_id": tool_call_id,
+                "result": _dump_tool_result({
                     "error": str(e),
                     "plugin_name": tool_name
-                }, indent=2)
-
-                results.append({
-                    "tool_name": tool_name,
-                    "tool_call_id": tool_call_id,
-                    "result": error_result,
-                    "success": False
-                })
+                }),
+                "success": False
+            }
 
-                logger.error(
-                    "Plugin execution failed",
-                    session_id=session_id,
-                    plugin_name=tool_name,
-                    tool_call_id=tool_call_id,
-                    error=str(e)
-                )
+        except Exception as e:
+            # Unexpected error
+            self._publish_in_background(publish_plugin_execution(
+                plugin_name=tool_name,
+                execution_time_ms=0,
+                success=False,
+                session_id=session_id
+            ))
 
-            except Exception as e:
-                # Unexpected error
-                await publish_plugin_execution(
-                    plugin_name=tool_name,
-                    execution_time_ms=0,
-                    success=False,
-                    session_id=session_id
-                )
+            logger.error(
+                "Unexpected plugin error",
+                session_id=session_id,
+                plugin_name=tool_name,
+                tool_call_id=tool_call_id,
+                error=str(e)
+            )
 
-                error_result = json.dumps({
+            return {
+                "tool_name": tool_name,
+                "tool_call_id": tool_call_id,
+                "result": _dump_tool_result({
                     "error": f"Unexpected error in {tool_name}: {str(e)}",
                     "plugin_name": tool_name
-                }, indent=2)
-
-                results.append({
-                    "tool_name": tool_name,
-                    "tool_call_id": tool_call_id,
-                    "result": error_result,
-                    "success": False
-                })
-
-                logger.error(
-                    "Unexpected plugin error",
-                    session_id=session_id,
-                    plugin_name=tool_name,
-                    tool_call_id=tool_call_id,
-                    error=str(e)
-                )
-
-        return results
+                }),
+                "success": False
+            }
 
     async def _manage_conversation_length(
         self, conversation: ConversationState
     ) -> ConversationState:
-        """Manage conversation length through truncation or summarization."""
+        """Manage conversation length through truncation or summarization.
+
+        Summarization normally runs in the background once a conversation
+        nears the limit (see ``_schedule_summarization``); this handles
+        conversations that reach it anyway.
+        """
         if len(conversation.messages) <= self.max_conversation_length:
+            self._schedule_summarization(conversation)
             return conversation
 
         logger.info(
@@ -682,58 +1177,12 @@ class ConversationOrchestrator:
         )
 
         if self.enable_summarization:
-            try:
-                # Initialize context summarizer with LLM provider
-                context_summarizer = ContextSummarizer(
-                    llm_provider=self.llm_provider,
-                    summarization_threshold=0.7,
-                    max_summary_length=500,
-                    preserve_user_preferences=True,
-                    preserve_tool_results=True,
-                    preserve_file_context=True
-                )
-
-                # Check if summarization should be triggered
-                should_summarize = await context_summarizer.should_summarize(
-                    conversation
-                )
-
-                if should_summarize:
-                    # Generate summary and get recent messages to keep
-                    summary, recent_messages = await (
-                        context_summarizer.summarize_conversation(
-                            conversation
-                        )
-                    )
-
-                    # Convert summary to system message
-                    summary_message = summary.to_message()
-
-                    # Create new conversation with summary + recent messages
-                    summarized_messages = [summary_message] + recent_messages
-                    summarized_conversation = ConversationState(
-                        session_id=conversation.session_id,
-                        messages=summarized_messages
-                    )
-
-                    logger.info(
-                        "Conversation summarized",
-                        session_id=conversation.session_id,
-                        original_length=len(conversation.messages),
-                        new_length=len(summarized_conversation.messages),
-                        summary_length=len(summary.summary_text)
-                    )
-
-                    return summarized_conversation
-
-            except Exception as e:
-                # Log summarization failure and fall back to truncation
-                logger.error(
-                    "Conversation summarization failed, falling back to truncation",
-                    session_id=conversation.session_id,
-                    error=str(e),
-                    error_type=type(e).__name__
-                )
+            # Prefer a summary already running in the background
+            summarized = await self._apply_background_summary(conversation)
+            if summarized is conversation:
+                summarized = await self._summarize(conversation)
+            if summarized is not None:
+                return summarized
 
         # Fallback to simple truncation
         keep_count = min(self.max_conversation_length, len(conversation.messages))
@@ -754,6 +1203,155 @@ class ConversationOrchestrator:
 
         return truncated_conversation
 
+    async def _summarize(
+        self, conversation: ConversationState
+    ) -> Optional[ConversationState]:
+        """Summarize a conversation, or return None if it isn't worthwhile."""
+        try:
+            # Initialize context summarizer with LLM provider
+            context_summarizer = ContextSummarizer(
+                llm_provider=self.llm_provider,
+                summarization_threshold=0.7,
+                max_summary_length=500,
+                preserve_user_preferences=True,
+                preserve_tool_results=True,
+                preserve_file_context=True
+            )
+
+            # Check if summarization should be triggered
+            if not await context_summarizer.should_summarize(conversation):
+                return None
+
+            # Generate summary and get recent messages to keep
+            summary, recent_messages = await (
+                context_summarizer.summarize_conversation(conversation)
+            )
+
+            # Convert summary to system message, dated like the first kept
+            # message so the history stays in chronological order
+            summary_message = summary.to_message()
+            if recent_messages:
+                summary_message = summary_message.model_copy(
+                    update={"timestamp": recent_messages[0].timestamp}
+                )
+
+            # Create new conversation with summary + recent messages
+            summarized_messages = [summary_message] + recent_messages
+            summarized_conversation = ConversationState(
+                session_id=conversation.session_id,
+                messages=summarized_messages
+            )
+
+        except Exception as e:
+            # Log summarization failure; callers fall back to truncation
+            logger.error(
+                "Conversation summarization failed, falling back to truncation",
+                session_id=conversation.session_id,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            return None
+
+        logger.info(
+            "Conversation summarized",
+            session_id=conversation.session_id,
+            original_length=len(conversation.messages),
+            new_length=len(summarized_conversation.messages),
+            summary_length=len(summary.summary_text)
+        )
+
+        # The summary replaces the start of the context, so the cached
+        # formatting no longer shares a prefix with it and would only pin
+        # the pre-summary history in memory
+        self._context_cache.pop(conversation.session_id, None)
+
+        return summarized_conversation
+
+    def _schedule_summarization(self, conversation: ConversationState) -> None:
+        """Start summarizing in the background once near the length limit.
+
+        The summary is applied at the start of a later turn, so its LLM call
+        overlaps with the user's think time instead of delaying a reply.
+        """
+        if (
+            not self.enable_summarization
+            or conversation.session_id in self._summarize_tasks
+            or len(conversation.messages)
+            < self.max_conversation_length * SUMMARIZE_HIGH_WATER_RATIO
+        ):
+            return
+
+        self._summarize_tasks[conversation.session_id] = (
+            conversation, asyncio.create_task(self._summarize(conversation))
+        )
+
+    async def _apply_background_summary(
+        self, conversation: ConversationState
+    ) -> ConversationState:
+        """Swap in a finished background summary for a conversation.
+
+        A summary still running is waited for only once the conversation has
+        reached its length limit; otherwise the turn goes ahead without it.
+        Messages added since the summary's snapshot are carried over.
+        """
+        session_id = conversation.session_id
+        pending = self._summarize_tasks.get(session_id)
+        if pending is None:
+            return conversation
+
+        snapshot, task = pending
+        if not task.done():
+            if len(conversation.messages) < self.max_conversation_length:
+                return conversation
+            await asyncio.wait({task})
+
+        del self._summarize_tasks[session_id]
+        summarized = None if task.cancelled() else task.result()
+        if summarized is None:
+            return conversation
+
+        # Skip the summary if the history was rewritten in the meantime
+        snapshot_count = len(snapshot.messages)
+        if (
+            len(conversation.messages) < snapshot_count
+            or conversation.messages[snapshot_count - 1]
+            is not snapshot.messages[-1]
+        ):
+            return conversation
+
+        merged = ConversationState(
+            session_id=session_id,
+            messages=summarized.messages + conversation.messages[snapshot_count:]
+        )
+        self._conversations[session_id] = merged
+        return merged
+
+    def _cancel_summarization(self, session_id: str) -> None:
+        """Stop a session's background summarization, if one is running."""
+        pending = self._summarize_tasks.pop(session_id, None)
+        if pending is not None:
+            pending[1].cancel()
+
+    def _on_conversation_evicted(
+        self, session_id: str, conversation: ConversationState
+    ) -> None:
+        """Drop cached state for an evicted session and report the eviction."""
+        self._context_cache.pop(session_id, None)
+        self._cancel_summarization(session_id)
+        logger.info(
+            "Conversation evicted",
+            session_id=session_id,
+            message_count=len(conversation.messages)
+        )
+        self._publish_in_background(publish_health_check(
+            component="orchestrator",
+            status="healthy",
+            metrics={
+                "evicted_session": session_id,
+                "active_conversations": len(self._conversations)
+            }
+        ))
+
     def get_conversation(self, session_id: str) -> Optional[ConversationState]:
         """Get a conversation by session ID."""
         return self._conversations.get(session_id)
@@ -767,17 +1365,22 @@ class ConversationOrchestrator:
 
     async def end_conversation(self, session_id: str) -> None:
         """End a conversation and clean up resources."""
+        self._context_cache.pop(session_id, None)
+        self._cancel_summarization(session_id)
         if session_id in self._conversations:
             del self._conversations[session_id]
             logger.info("Conversation ended", session_id=session_id)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get orchestrator statistics."""
-        total_messages = sum(len(conv.messages) for conv in self._conversations.values())
         return {
             "active_conversations": len(self._conversations),
-            "total_messages": total_messages,
+            "total_messages": self._conversations.total_messages,
+            "total_tokens_estimate": self._conversations.total_chars // 4,
             "max_conversation_length": self.max_conversation_length,
             "sliding_window_size": self.sliding_window_size,
             "summarization_enabled": self.enable_summarization,
+            "response_cache": (
+                dict(self.response_cache.stats) if self.response_cache else None
+            ),
         }
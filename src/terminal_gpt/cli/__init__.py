@@ -1 +1,17 @@
 """CLI layer - Terminal user interface."""
+
+import asyncio
+
+
+def use_uvloop() -> None:
+    """Make uvloop the default event loop when it is installed.
+
+    uvloop is an optional, non-Windows dependency; the standard asyncio loop
+    is used otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
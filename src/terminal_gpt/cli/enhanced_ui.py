@@ -1,19 +1,27 @@
 """Enhanced UI module for Terminal GPT with professional polish and accessibility."""
 
 import asyncio
+import re
 import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
-from typing import Optional, Dict, Any, List
-from rich.console import Console
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+)
+
+import orjson
+from rich import box
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
-from rich.table import Table
 from rich.text import Text
-from rich.spinner import Spinner
 from rich.theme import Theme
-from rich.markdown import Markdown
-from rich.live import Live
-from rich.columns import Columns
-from rich.align import Align
+
+# Heavier Rich renderables (Markdown pulls in markdown-it and Pygments) are
+# imported where they are first used, keeping CLI startup fast
+if TYPE_CHECKING:
+    from rich.table import Table
 
 # Professional color theme
 PROFESSIONAL_THEME = Theme({
@@ -54,6 +62,79 @@ PROFESSIONAL_THEME = Theme({
 
 console = Console(theme=PROFESSIONAL_THEME, force_terminal=True)
 
+# Theme style for each plugin's output
+_PLUGIN_COLORS = {
+    "read_file": "plugin.file",
+    "write_file": "plugin.file",
+    "search_web": "plugin.web",
+    "calculate": "plugin.calc",
+    "sports": "plugin.sports"
+}
+
+# Plugin tables longer than this are printed without borders
+_BOXED_TABLE_MAX_ROWS = 200
+
+# Text that Markdown renders differently from plain text: emphasis, code,
+# links, tables, quotes, escapes, HTML and entities; line breaks, which
+# Markdown joins into paragraphs; and leading whitespace, lists, rules and
+# setext headings at the start
+_MARKDOWN_SYNTAX = re.compile(r"[*_#`\[\]|>~\\<&\r\n]|\A(?:\s|[-+=]|\d+[.)])")
+
+# Status table: metric name formatting and numeric status thresholds
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+_NUMBER_TYPES = (int, float)
+_STAT_HIGH = 1000
+_STAT_MEDIUM = 100
+
+# Display line for each known message metadata key; None hides the value
+_METADATA_FORMATTERS: Dict[str, Callable[[Any], Optional[str]]] = {
+    "tokens_used": lambda value: f"📝 Tokens: {value}" if value else None,
+    "processing_time_ms": lambda value: f"⏱️ Time: {value}ms" if value else None,
+    "status": lambda value: f"🔧 Status: {value}" if value != "ok" else None,
+}
+
+# Last formatted wall-clock second, shared by everything printed within it
+_clock_second = 0
+_clock_text = ""
+
+
+def _now_hms() -> str:
+    """Get the current local time as HH:MM:SS, formatted once per second."""
+    global _clock_second, _clock_text
+    now = int(time.time())
+    if now != _clock_second:
+        _clock_second = now
+        _clock_text = time.strftime("%H:%M:%S", time.localtime(now))
+    return _clock_text
+
+
+# ASCII art for "Jengo"
+_JENGO_ART_LINES = (
+    "     ██╗███████╗███╗   ██╗ ██████╗  ██████╗ ",
+    "     ██║██╔════╝████╗  ██║██╔════╝ ██╔═══██╗ ",
+    "     ██║█████╗  ██╔██╗ ██║██║  ███╗██║   ██║ ",
+    "     ██║██╔══╝  ██║╚██╗██║██║   ██║██║   ██║ ",
+    "██   ██║██╔══╝  ██║╚██╗██║██║   ██║██║   ██║ ",
+    "╚█████╔╝███████╗██║ ╚████║╚██████╔╝╚██████╔╝",
+    "╚════╝ ╚══════╝╚═╝  ╚═══╝ ╚═════╝  ╚═════╝ ",
+)
+
+
+def _build_jengo_art() -> Text:
+    """Style the art as one Text so it prints in a single call."""
+    art = Text()
+    for i, line in enumerate(_JENGO_ART_LINES):
+        # Gradient effect: the middle lines use the brighter accent
+        style = "jengo.accent" if 2 <= i < 4 else "jengo.header"
+        if i:
+            art.append("\n")
+        art.append(line, style=style)
+    return art
+
+
+# Styles are theme names, resolved when printed, so the art is built once
+_JENGO_ART = _build_jengo_art()
+
 
 class StatusLevel:
     """Status message levels with associated colors and icons."""
@@ -69,87 +150,164 @@ class StatusLevel:
         return [cls.SUCCESS, cls.WARNING, cls.ERROR, cls.INFO, cls.DEBUG]
 
 
+# Text prefix and style of each level, built once for print_status
+_LEVEL_PREFIXES = {
+    level: (f"{level[0]} ", level[1]) for level in StatusLevel.get_all()
+}
+
+# Header icon and border style of each message role, for print_message
+_ROLE_STYLES = {
+    "user": ("👤", "role.user"),
+    "assistant": ("🤖", "role.assistant"),
+    "system": ("⚙️", "role.system"),
+    "tool": ("🔧", "role.tool"),
+}
+_DEFAULT_ROLE_STYLE = ("💬", "ui.border")
+
+
 class ThinkingSpinner:
     """Enhanced thinking spinner with different modes and messages."""
     
-    def __init__(self):
-        self.spinner_types = {
-            "thinking": ("dots", "Analyzing your request"),
-            "processing": ("bouncingBall", "Processing data"),
-            "loading": ("line", "Loading resources"),
-            "searching": ("star", "Searching for information"),
-            "computing": ("growVertical", "Performing calculations"),
-            "waiting": ("simpleDotsScrolling", "Waiting for response")
-        }
+    # Spinner name and message for each mode
+    SPINNER_TYPES = {
+        "thinking": ("dots", "Analyzing your request"),
+        "processing": ("bouncingBall", "Processing data"),
+        "loading": ("line", "Loading resources"),
+        "searching": ("star", "Searching for information"),
+        "computing": ("growVertical", "Performing calculations"),
+        "waiting": ("simpleDotsScrolling", "Waiting for response")
+    }
     
     def get_spinner(self, mode: str = "thinking"):
         """Get spinner configuration for different modes."""
-        if mode not in self.spinner_types:
-            mode = "thinking"
-        
-        spinner_type, message = self.spinner_types[mode]
+        spinner_type, message = (
+            self.SPINNER_TYPES.get(mode) or self.SPINNER_TYPES["thinking"]
+        )
+        from rich.spinner import Spinner
+
         return Spinner(spinner_type, text=message, style="status.info")
 
 
+@lru_cache(maxsize=None)
+def _welcome_renderables() -> Tuple[RenderableType, RenderableType]:
+    """Build the constant parts of the welcome screen on first use."""
+    from rich.align import Align
+    from rich.columns import Columns
+    
+    # Subtitle
+    subtitle = Text("AI-Powered Terminal Assistant", style="jengo.subtitle")
+    
+    # Features list; markup is parsed here once rather than on each print
+    features = Panel(
+        Text.from_markup(
+            "[bold]✨ Features:[/bold]\n"
+            "• Real-time AI conversations\n"
+            "• Plugin ecosystem (files, web search, calculations)\n"
+            "• Context-aware responses\n"
+            "• Streaming responses\n"
+            "• Multi-session support\n\n"
+            "[dim]Type /help for commands or start chatting![/dim]"
+        ),
+        title="Welcome",
+        border_style="status.info",
+        padding=(1, 2)
+    )
+    
+    # Tips
+    tips = Panel(
+        Text.from_markup(
+            "[bold]💡 Tips:[/bold]\n"
+            "• Use /clear to clear the screen\n"
+            "• Use /sessions to manage conversations\n"
+            "• Use /stats to check system status\n"
+            "• Type /help for all commands"
+        ),
+        title="Quick Tips",
+        border_style="status.info",
+        padding=(1, 2)
+    )
+    
+    return (
+        Align(subtitle, align="center"),
+        Columns([features, tips], equal=True, expand=True)
+    )
+
+
+def _tree_children(item: Any) -> Iterator[Tuple[str, Any, bool]]:
+    """Yield (label, value, is_last) for each entry of a dict or list."""
+    if isinstance(item, dict):
+        entries = ((str(key), value) for key, value in item.items())
+    elif isinstance(item, list):
+        entries = ((f"[item {i}]", value) for i, value in enumerate(item, 1))
+    else:
+        return
+    
+    last = len(item) - 1
+    for i, (label, value) in enumerate(entries):
+        yield label, value, i == last
+
+
 class EnhancedUI:
     """Enhanced UI with professional polish and accessibility features."""
     
+    # Message bodies kept for reprinting (history replays, re-renders)
+    MESSAGE_CACHE_SIZE = 128
+
     def __init__(self):
         self.console = console
         self.thinking_spinner = ThinkingSpinner()
         self.last_status_time = 0
+        # Rendered message bodies by (role, content, metadata line); reuse
+        # skips re-parsing Markdown, the main cost for long responses
+        self._message_cache: "OrderedDict[Tuple[str, str, str], RenderableType]" = (
+            OrderedDict()
+        )
+        # Last terminal validation and the (width, height, colors) it was for
+        self._terminal_key: Optional[Tuple[int, int, Optional[str]]] = None
+        self._terminal_validation: Dict[str, Any] = {}
     
     def print_jengo_ascii_art(self):
         """Print ASCII art heading for Jengo with green theme."""
-        # ASCII art for "Faya" with green gradient
-        ascii_art = [
-                "     ██╗███████╗███╗   ██╗ ██████╗  ██████╗ ",
-                "     ██║██╔════╝████╗  ██║██╔════╝ ██╔═══██╗ ",
-                "     ██║█████╗  ██╔██╗ ██║██║  ███╗██║   ██║ ",
-                "     ██║██╔══╝  ██║╚██╗██║██║   ██║██║   ██║ ",
-                "██   ██║██╔══╝  ██║╚██╗██║██║   ██║██║   ██║ ",
-                "╚█████╔╝███████╗██║ ╚████║╚██████╔╝╚██████╔╝",
-                "╚════╝ ╚══════╝╚═╝  ╚═══╝ ╚═════╝  ╚═════╝ ",
-        ]
-        
-        # Print each line with green gradient
-        for i, line in enumerate(ascii_art):
-            # Create gradient effect from light to dark green
-            if i < 2:
-                style = "jengo.header"
-            elif i < 4:
-                style = "jengo.accent"
-            else:
-                style = "jengo.header"
-            
-            self.console.print(Text(line, style=style))
+        self.console.print(_JENGO_ART)
         
     def print_status(self, level: tuple, message: str, details: Optional[str] = None, 
                     persistent: bool = False):
         """Print color-coded status message with optional details."""
-        icon, style, level_name = level
+        status_text = self._status_text(level, message, details)
+        
+        # Print with appropriate spacing
+        if persistent:
+            # For persistent status that shouldn't be cleared
+            self.console.print(status_text)
+        else:
+            # For temporary status that can be overwritten
+            self.console.print(status_text, end="\r" if not details else "\n")
+    
+    def _status_text(self, level: tuple, message: str,
+                     details: Optional[str] = None) -> Text:
+        """Build the styled text of a status message."""
+        prefix, style = _LEVEL_PREFIXES.get(level) or (f"{level[0]} ", level[1])
         
         # Create status text
-        status_text = Text(f"{icon} {message}", style=style)
+        status_text = Text(prefix + message, style=style)
         
         # Add details if provided
         if details:
-            details_text = Text(f"  {details}", style="ui.muted")
-            status_text.append("\n")
-            status_text.append(details_text)
+            status_text.append(f"\n  {details}", style="ui.muted")
         
         # Add timestamp for debugging
-        if level == StatusLevel.DEBUG:
+        if level is StatusLevel.DEBUG:
             timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
             status_text.append(f" [{timestamp}]", style="ui.muted")
         
-        # Print with appropriate spacing
-        if persistent:
-            # For persistent status that shouldn't be cleared
-            self.console.print(status_text)
-        else:
-            # For temporary status that can be overwritten
-            self.console.print(status_text, end="\r" if not details else "\n")
+        return status_text
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Buffer everything printed in the block into one terminal write."""
+        # Rich holds console output until its outermost context exits
+        with self.console:
+            yield
     
     def print_warning(self, message: str, details: Optional[str] = None, persistent: bool = False):
         """Print a warning message."""
@@ -169,72 +327,32 @@ class EnhancedUI:
     
     def print_welcome(self):
         """Print enhanced welcome message with Jengo ASCII art."""
-        # Print ASCII art header
-        self.print_jengo_ascii_art()
-        
-        # Print subtitle
-        subtitle = Text("AI-Powered Terminal Assistant", 
-                       style="jengo.subtitle")
-        self.console.print(Align(subtitle, align="center"))
-        self.console.print()  # Empty line for spacing 
-        
-        # Create features list
-        features = Panel(
-            "[bold]✨ Features:[/bold]\n"
-            "• Real-time AI conversations\n"
-            "• Plugin ecosystem (files, web search, calculations)\n"
-            "• Context-aware responses\n"
-            "• Streaming responses\n"
-            "• Multi-session support\n\n"
-            "[dim]Type /help for commands or start chatting![/dim]",
-            title="Welcome",
-            border_style="status.info",
-            padding=(1, 2)
-        )
-        
-        # Create tips
-        tips = Panel(
-            "[bold]💡 Tips:[/bold]\n"
-            "• Use /clear to clear the screen\n"
-            "• Use /sessions to manage conversations\n"
-            "• Use /stats to check system status\n"
-            "• Type /help for all commands",
-            title="Quick Tips",
-            border_style="status.info",
-            padding=(1, 2)
-        )
-        
-        # Display welcome
-        self.console.print(Columns([features, tips], equal=True, expand=True))
+        subtitle, panels = _welcome_renderables()
+        
+        # Display welcome as one write
+        with self.batch():
+            self.print_jengo_ascii_art()
+            self.console.print(subtitle)
+            self.console.print()  # Empty line for spacing
+            self.console.print(panels)
     
-    def print_message(self, role: str, content: str, session_id: Optional[str] = None, 
-                     metadata: Optional[Dict[str, Any]] = None):
-        """Print chat message with enhanced formatting."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+    def print_message(self, role: str, content: RenderableType,
+                     session_id: Optional[str] = None, 
+                     metadata: Optional[Dict[str, Any]] = None,
+                     timestamp: Optional[str] = None):
+        """Print chat message with enhanced formatting.
+
+        ``content`` may be a string, whose rendered body is cached, or an
+        already built renderable (e.g. a Markdown kept by the caller), which
+        is used as is. ``timestamp`` (HH:MM:SS) defaults to the current
+        time; callers printing several messages at once can format it once
+        and pass it.
+        """
+        if timestamp is None:
+            timestamp = _now_hms()
         
         # Determine role styling
-        if role == "user":
-            header_style = "role.user"
-            border_style = "role.user"
-            header_icon = "👤"
-        elif role == "assistant":
-            header_style = "role.assistant"
-            border_style = "role.assistant"
-            header_icon = "🤖"
-            # Render as markdown for better formatting
-            content = Markdown(content)
-        elif role == "system":
-            header_style = "role.system"
-            border_style = "role.system"
-            header_icon = "⚙️"
-        elif role == "tool":
-            header_style = "role.tool"
-            border_style = "role.tool"
-            header_icon = "🔧"
-        else:
-            header_style = "ui.muted"
-            border_style = "ui.border"
-            header_icon = "💬"
+        header_icon, border_style = _ROLE_STYLES.get(role, _DEFAULT_ROLE_STYLE)
         
         # Create header with session info
         header_text = f"{header_icon} {role.title()}"
@@ -242,15 +360,9 @@ class EnhancedUI:
             header_text += f" [dim]• {session_id}[/dim]"
         header_text += f" [dim]• {timestamp}[/dim]"
         
-        # Add metadata if provided
-        if metadata:
-            meta_text = self._format_metadata(metadata)
-            if meta_text:
-                content = f"{content}\n\n{meta_text}"
-        
         # Create panel
         panel = Panel(
-            content,
+            self._message_body(role, content, metadata),
             title=header_text,
             border_style=border_style,
             title_align="left",
@@ -259,6 +371,41 @@ class EnhancedUI:
         
         self.console.print(panel)
     
+    def _message_body(self, role: str, content: RenderableType,
+                      metadata: Optional[Dict[str, Any]]) -> RenderableType:
+        """Get the panel body for a message, reusing recently built ones."""
+        meta_text = self._format_metadata(metadata) if metadata else ""
+        if not isinstance(content, str):
+            return Group(content, Text(f"\n{meta_text}")) if meta_text else content
+
+        key = (role, content, meta_text)
+        body = self._message_cache.get(key)
+        if body is not None:
+            self._message_cache.move_to_end(key)
+            return body
+
+        if role == "assistant":
+            # Render as markdown for better formatting
+            if _MARKDOWN_SYNTAX.search(content):
+                from rich.markdown import Markdown
+
+                body = Markdown(content)
+            else:
+                # A single line of plain prose renders the same in the
+                # panel without the Markdown parse
+                body = Text(content)
+            if meta_text:
+                body = Group(body, Text(f"\n{meta_text}"))
+        elif meta_text:
+            body = f"{content}\n\n{meta_text}"
+        else:
+            body = content
+
+        self._message_cache[key] = body
+        if len(self._message_cache) > self.MESSAGE_CACHE_SIZE:
+            self._message_cache.popitem(last=False)
+        return body
+
     def _format_metadata(self, metadata: Dict[str, Any]) -> str:
         """Format metadata for display."""
         if not metadata:
@@ -266,14 +413,13 @@ class EnhancedUI:
         
         meta_lines = []
         for key, value in metadata.items():
-            if key == "tokens_used" and value:
-                meta_lines.append(f"📝 Tokens: {value}")
-            elif key == "processing_time_ms" and value:
-                meta_lines.append(f"⏱️ Time: {value}ms")
-            elif key == "status" and value != "ok":
-                meta_lines.append(f"🔧 Status: {value}")
+            formatter = _METADATA_FORMATTERS.get(key)
+            if formatter is not None:
+                line = formatter(value)
+                if line:
+                    meta_lines.append(line)
         
-        return " | ".join(meta_lines) if meta_lines else ""
+        return " | ".join(meta_lines)
     
     def thinking_indicator(self, mode: str = "thinking", duration: Optional[float] = None):
         """Create a thinking indicator context manager."""
@@ -282,26 +428,18 @@ class EnhancedUI:
     def print_plugin_output(self, plugin_name: str, output_type: str, data: Any, 
                            title: Optional[str] = None):
         """Print standardized plugin output."""
-        # Determine plugin color
-        plugin_colors = {
-            "read_file": "plugin.file",
-            "write_file": "plugin.file", 
-            "search_web": "plugin.web",
-            "calculate": "plugin.calc",
-            "sports": "plugin.sports"
-        }
-        
-        color = plugin_colors.get(plugin_name, "plugin.file")
+        color = _PLUGIN_COLORS.get(plugin_name, "plugin.file")
+        title = title or plugin_name.title()
         
         # Format output based on type
         if output_type == "table":
-            self._print_plugin_table(data, title or plugin_name.title(), color)
+            self._print_plugin_table(data, title, color)
         elif output_type == "list":
-            self._print_plugin_list(data, title or plugin_name.title(), color)
+            self._print_plugin_list(data, title, color)
         elif output_type == "tree":
-            self._print_plugin_tree(data, title or plugin_name.title(), color)
+            self._print_plugin_tree(data, title, color)
         else:
-            self._print_plugin_text(data, title or plugin_name.title(), color)
+            self._print_plugin_text(data, title, color)
     
     def _print_plugin_table(self, data: List[Dict], title: str, color: str):
         """Print plugin output as a table."""
@@ -309,16 +447,24 @@ class EnhancedUI:
             self.print_status(StatusLevel.INFO, f"No data from {title}")
             return
         
-        table = Table(title=f"📊 {title}", border_style=color, show_header=True)
+        # Long tables skip the box drawing, which Rich measures per row
+        from rich.table import Table
+
+        table = Table(
+            title=f"📊 {title}",
+            border_style=color,
+            show_header=True,
+            box=box.HEAVY_HEAD if len(data) <= _BOXED_TABLE_MAX_ROWS else None
+        )
         
         # Add columns based on first row
-        if data:
-            for key in data[0].keys():
-                table.add_column(key.title(), style=color)
-            
-            # Add rows
-            for row in data:
-                table.add_row(*[str(row[key]) for key in row.keys()])
+        columns = list(data[0])
+        for key in columns:
+            table.add_column(key.title(), style=color)
+        
+        # Add rows
+        for row in data:
+            table.add_row(*(str(row.get(key, "")) for key in columns))
         
         self.console.print(table)
     
@@ -328,38 +474,49 @@ class EnhancedUI:
             self.print_status(StatusLevel.INFO, f"No results from {title}")
             return
         
-        list_text = Text(f"📋 {title}:\n", style=color)
-        for i, item in enumerate(data, 1):
-            list_text.append(f"  {i}. {item}\n", style="ui.muted")
+        # One Text in the plugin color with a single muted range for the items
+        header = f"📋 {title}:\n"
+        items = "".join(f"  {i}. {item}\n" for i, item in enumerate(data, 1))
+        list_text = Text(header + items, style=color)
+        list_text.stylize("ui.muted", len(header))
         
         self.console.print(Panel(list_text, border_style=color))
     
     def _print_plugin_tree(self, data: Dict, title: str, color: str):
         """Print plugin output as a tree."""
-        # Simple tree implementation
-        tree_text = Text(f"🌳 {title}:\n", style=color)
-        
-        def add_tree_item(item, prefix="", is_last=True):
-            if isinstance(item, dict):
-                for i, (key, value) in enumerate(item.items()):
-                    is_last_item = i == len(item) - 1
-                    connector = "└── " if is_last_item else "├── "
-                    tree_text.append(f"{prefix}{connector}{key}\n", style=color)
-                    
-                    if isinstance(value, (dict, list)):
-                        new_prefix = prefix + ("    " if is_last_item else "│   ")
-                        add_tree_item(value, new_prefix, is_last_item)
-                    else:
-                        current_prefix = prefix + ("    " if is_last_item else "│   ")
-                        tree_text.append(f"{current_prefix}    {value}\n", style="ui.muted")
-            elif isinstance(item, list):
-                for i, value in enumerate(item):
-                    is_last_item = i == len(item) - 1
-                    connector = "└── " if is_last_item else "├── "
-                    tree_text.append(f"{prefix}{connector}[item {i+1}]\n", style=color)
-                    add_tree_item(value, prefix + ("    " if is_last_item else "│   "), is_last_item)
-        
-        add_tree_item(data)
+        # Build the text as one string in the plugin color, recording the
+        # (start, end) ranges of the muted value lines
+        lines: List[str] = [f"🌳 {title}:\n"]
+        muted: List[Tuple[int, int]] = []
+        length = len(lines[0])
+        
+        # Depth-first walk with an explicit stack of (children, prefix)
+        stack = [(_tree_children(data), "")]
+        while stack:
+            children, prefix = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                continue
+            
+            label, value, is_last = child
+            connector = "└── " if is_last else "├── "
+            line = f"{prefix}{connector}{label}\n"
+            
+            child_prefix = prefix + ("    " if is_last else "│   ")
+            if isinstance(value, (dict, list)):
+                stack.append((_tree_children(value), child_prefix))
+            else:
+                value_line = f"{child_prefix}    {value}\n"
+                start = length + len(line)
+                muted.append((start, start + len(value_line)))
+                line += value_line
+            lines.append(line)
+            length += len(line)
+        
+        tree_text = Text("".join(lines), style=color)
+        for start, end in muted:
+            tree_text.stylize("ui.muted", start, end)
         self.console.print(Panel(tree_text, border_style=color))
     
     def _print_plugin_text(self, data: str, title: str, color: str):
@@ -368,14 +525,14 @@ class EnhancedUI:
             self.print_status(StatusLevel.INFO, f"No output from {title}")
             return
         
-        # Try to parse as JSON for better formatting
-        try:
-            import json
-            parsed = json.loads(data)
-            formatted = json.dumps(parsed, indent=2)
-            data = formatted
-        except:
-            pass  # Keep original data
+        # Pretty-print JSON objects and arrays; other text is left alone
+        # without attempting a parse
+        if isinstance(data, str) and data.lstrip()[:1] in ("{", "["):
+            try:
+                parsed = orjson.loads(data)
+                data = orjson.dumps(parsed, option=orjson.OPT_INDENT_2).decode()
+            except orjson.JSONDecodeError:
+                pass  # Keep original data
         
         panel = Panel(
             data,
@@ -385,8 +542,10 @@ class EnhancedUI:
         )
         self.console.print(panel)
     
-    def create_status_table(self, stats: Dict[str, Any]) -> Table:
+    def create_status_table(self, stats: Dict[str, Any]) -> "Table":
         """Create an enhanced status table."""
+        from rich.table import Table
+
         table = Table(
             title="📊 System Status", 
             border_style="status.info",
@@ -398,11 +557,11 @@ class EnhancedUI:
         table.add_column("Status", style="status.info", width=15)
         
         for key, value in stats.items():
-            # Determine status indicator
-            if isinstance(value, (int, float)):
-                if value > 1000:
+            # Determine status indicator; exact types leave bools as "OK"
+            if type(value) in _NUMBER_TYPES:
+                if value > _STAT_HIGH:
                     status = "⚠️ High"
-                elif value > 100:
+                elif value > _STAT_MEDIUM:
                     status = "ℹ️ Medium"
                 else:
                     status = "✅ Low"
@@ -410,7 +569,7 @@ class EnhancedUI:
                 status = "✅ OK"
             
             table.add_row(
-                key.replace("_", " ").title(),
+                key.translate(_UNDERSCORE_TO_SPACE).title(),
                 str(value),
                 status
             )
@@ -434,6 +593,11 @@ class EnhancedUI:
         size = self.console.size
         width, height = size.width, size.height
         
+        # Reuse the last result while the terminal is unchanged
+        key = (width, height, self.console.color_system)
+        if key == self._terminal_key:
+            return self._terminal_validation
+        
         issues = []
         recommendations = []
         
@@ -451,36 +615,40 @@ class EnhancedUI:
             issues.append("Color support not detected")
             recommendations.append("Enable color support in your terminal for better experience")
         
-        return {
+        self._terminal_key = key
+        self._terminal_validation = {
             "width": width,
             "height": height,
             "issues": issues,
             "recommendations": recommendations,
             "is_compatible": len(issues) == 0
         }
+        return self._terminal_validation
     
     def print_accessibility_report(self):
         """Print accessibility and terminal compatibility report."""
         validation = self.validate_terminal_size()
+        size = f"Size: {validation['width']}x{validation['height']}"
         
         if validation["is_compatible"]:
-            self.print_status(
-                StatusLevel.SUCCESS, 
-                "✅ Terminal is compatible", 
-                f"Size: {validation['width']}x{validation['height']}"
-            )
-        else:
-            self.print_status(
-                StatusLevel.WARNING,
-                "⚠️ Terminal compatibility issues detected",
-                f"Size: {validation['width']}x{validation['height']}"
+            self.print_status(StatusLevel.SUCCESS, "✅ Terminal is compatible", size)
+            return
+        
+        # Collect the whole report so it is written in one print
+        lines = [
+            self._status_text(
+                StatusLevel.WARNING, "⚠️ Terminal compatibility issues detected", size
             )
-            
-            for issue in validation["issues"]:
-                self.print_status(StatusLevel.WARNING, issue, persistent=True)
-            
-            for rec in validation["recommendations"]:
-                self.print_status(StatusLevel.INFO, rec, persistent=True)
+        ]
+        lines.extend(
+            self._status_text(StatusLevel.WARNING, issue)
+            for issue in validation["issues"]
+        )
+        lines.extend(
+            self._status_text(StatusLevel.INFO, rec)
+            for rec in validation["recommendations"]
+        )
+        self.console.print(Group(*lines))
 
 
 class ThinkingIndicator:
@@ -493,30 +661,44 @@ class ThinkingIndicator:
         self.spinner = ui.thinking_spinner.get_spinner(mode)
         self.start_time = None
         self.task = None
+        self._animation = None
+        self._stopped = None
     
     async def __aenter__(self):
         """Start the thinking indicator."""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         
-        # Create a live display for the spinner
-        self.live = Live(self.spinner, console=self.ui.console, refresh_per_second=10)
-        self.live.start()
+        # Create a live display for the spinner, redrawn by _animate only
+        # when the frame changes rather than on a fixed timer. Dumb terminals
+        # can't redraw in place, so they get no spinner at all.
+        from rich.live import Live
+
+        self.live = Live(self.spinner, console=self.ui.console, auto_refresh=False)
+        if not self.ui.console.is_dumb_terminal:
+            self.spinner.start_time = self.ui.console.get_time()
+            self.live.start(refresh=True)
+            self._animation = asyncio.create_task(self._animate())
         
         # If duration is specified, schedule auto-stop
         if self.duration:
+            self._stopped = asyncio.Event()
             self.task = asyncio.create_task(self._auto_stop())
         
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Stop the thinking indicator."""
-        if self.task and not self.task.done():
-            self.task.cancel()
+        if self.task:
+            # Wakes _auto_stop so it finishes without being cancelled
+            self._stopped.set()
+            await self.task
+        if self._animation:
+            self._animation.cancel()
         
         self.live.stop()
         
         # Print completion status
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         if elapsed > 5:  # Only show if it took significant time
             self.ui.print_status(
                 StatusLevel.INFO,
@@ -524,10 +706,28 @@ class ThinkingIndicator:
                 persistent=True
             )
     
+    async def _animate(self):
+        """Refresh the live display each time the spinner advances a frame."""
+        spinner = self.spinner
+        frame_seconds = spinner.interval / 1000 / spinner.speed
+        get_time = self.ui.console.get_time
+        last_frame = 0  # Drawn when the display started
+        
+        while self.live.is_started:
+            elapsed = get_time() - spinner.start_time
+            frame = int(elapsed / frame_seconds)
+            if frame != last_frame:
+                self.live.refresh()
+                last_frame = frame
+            # Sleep until the next frame is due
+            await asyncio.sleep(frame_seconds - elapsed % frame_seconds)
+    
     async def _auto_stop(self):
         """Auto-stop the spinner after specified duration."""
-        await asyncio.sleep(self.duration)
-        self.live.stop()
+        try:
+            await asyncio.wait_for(self._stopped.wait(), timeout=self.duration)
+        except asyncio.TimeoutError:
+            self.live.stop()
 
 
 # Global enhanced UI instance
@@ -1,18 +1,22 @@
 """Streaming CLI client for Terminal GPT with WebSocket support."""
 
 import asyncio
-import json
+from collections import deque
 from datetime import datetime
-from typing import Optional, List
+from typing import Callable, Deque, List, Optional
 
+import msgspec
+import orjson
 import typer
 import websockets
-from rich.live import Live
+from websockets.exceptions import ConnectionClosed, InvalidHandshake, InvalidStatus
+from websockets.protocol import State
 from rich.panel import Panel
 from rich.prompt import Prompt
-from rich.text import Text
+from rich.status import Status
 
 from ..infrastructure.logging import get_logger
+from ..cli import use_uvloop
 from ..cli.enhanced_ui import enhanced_ui
 
 logger = get_logger("terminal_gpt.streaming_cli")
@@ -28,136 +32,267 @@ ui = enhanced_ui
 MAX_RETRY_ATTEMPTS = 3
 RETRY_DELAYS = [1, 2, 4]
 CONNECTION_TIMEOUT = 30.0
-PACING_ENABLED = True
+# Largest frame accepted, and how many received frames may wait unread,
+# both in the connection and in the reply's frame queue, before reading from
+# the socket pauses
+MAX_FRAME_SIZE = 2**22
+MAX_QUEUED_FRAMES = 64
+# Optional typing effect: a pause after each chunk scaled to its length
+PACING_ENABLED = False
+PACING_SECONDS_PER_CHAR = 0.0005
+PACING_MAX_SECONDS = 0.02
+
+# WebSocket subprotocol for MessagePack frames; servers that don't accept it
+# are spoken to in JSON
+MSGPACK_SUBPROTOCOL = "msgpack"
+
+# Conversation history for display, keeping the most recent messages
+HISTORY_SIZE = 6
+conversation_history: Deque[dict] = deque(maxlen=HISTORY_SIZE)
+
+# WebSocket kept open across turns, and the URL it was opened for
+_connection = None
+_connection_url: Optional[str] = None
+
+
+async def _get_connection(websocket_url: str):
+    """Return the open WebSocket for a URL, connecting if there is none."""
+    global _connection, _connection_url
+
+    if (
+        _connection is not None
+        and _connection_url == websocket_url
+        and _connection.state is State.OPEN
+    ):
+        return _connection
+
+    await close_connection()
+    _connection = await websockets.connect(
+        websocket_url,
+        open_timeout=CONNECTION_TIMEOUT,
+        close_timeout=10.0,
+        subprotocols=[MSGPACK_SUBPROTOCOL],
+        max_size=MAX_FRAME_SIZE,
+        max_queue=MAX_QUEUED_FRAMES,
+        # Chunks are small; compressing them costs more than it saves
+        compression=None
+    )
+    _connection_url = websocket_url
+    return _connection
+
+
+async def close_connection() -> None:
+    """Close the WebSocket kept open across turns, if any."""
+    global _connection, _connection_url
+
+    websocket, _connection, _connection_url = _connection, None, None
+    if websocket is not None:
+        await websocket.close()
+
+
+async def _read_frames(websocket, frames: asyncio.Queue) -> None:
+    """Queue received frames, ending with the error that stopped reading.
+
+    Waits while the queue is full, so a reply arriving faster than it is
+    written out stays in the socket rather than piling up in memory.
+
+    Text frames are queued as raw bytes: the JSON parser checks their
+    encoding while parsing, so decoding them to str first would validate
+    every chunk's UTF-8 twice.
+    """
+    try:
+        while True:
+            await frames.put(await websocket.recv(decode=False))
+    except Exception as e:
+        await frames.put(e)
+
+
+async def _send_message(websocket, message: str) -> Callable[[bytes], dict]:
+    """Send a user message and return the decoder for the reply's frames.
 
-# Conversation history for display
-conversation_history: List[dict] = []
+    The message goes as a binary MessagePack frame if the server agreed to
+    it, else as a JSON text frame.
+    """
+    if websocket.subprotocol == MSGPACK_SUBPROTOCOL:
+        await websocket.send(msgspec.msgpack.encode({"message": message}))
+        return msgspec.msgpack.decode
+    await websocket.send(orjson.dumps({"message": message}).decode())
+    return orjson.loads
 
 
-async def send_streaming_message(session_id: str, message: str):
-    """Send a message and stream the response."""
+async def send_streaming_message(
+    session_id: str,
+    message: str,
+    thinking: Optional[Status] = None
+):
+    """Send a message and stream the response.
+
+    A ``thinking`` status shown while waiting is stopped before the first
+    text is written, since the text bypasses Rich's live display. Connection
+    failures, a handshake rejected by the server and a response timeout are
+    raised for send_streaming_message_with_retry to handle, as long as no
+    reply text has arrived yet. After that they are reported here and the
+    partial reply is returned, since retrying would send the turn twice.
+    """
     websocket_url = f"{api_base_url}/ws/chat/{session_id}"
 
+    # Reuse the connection from the previous turn; if the server has
+    # closed it in the meantime, reconnect once and send again
+    websocket = await _get_connection(websocket_url)
     try:
-        async with websockets.connect(
-            websocket_url,
-            open_timeout=CONNECTION_TIMEOUT,
-            close_timeout=10.0
-        ) as websocket:
-            # Send the message
-            await websocket.send(json.dumps({"message": message}))
-
-            # Receive and display streaming response
-            full_response = ""
-            first_chunk = True
-
-            while True:
-                try:
-                    response = await asyncio.wait_for(
-                        websocket.recv(),
-                        timeout=300.0
-                    )
-                    data = json.loads(response)
-
-                    if data["type"] == "chunk":
-                        content = data.get("content", "")
-                        if content:
-                            if first_chunk:
-                                # Print assistant header
-                                ui.console.print(
-                                    "\n[bold magenta]🤖 Jengo[/bold magenta]"
-                                )
-                                first_chunk = False
-
-                            # Print the chunk content
-                            for char in content:
-                                ui.console.print(char, end="", soft_wrap=True)
-                                full_response += char
-
-                                # Reduced pacing for readability
-                                if PACING_ENABLED:
-                                    if char in ".!?":
-                                        await asyncio.sleep(0.02)
-                                    elif char in ",;:":
-                                        await asyncio.sleep(0.01)
-                                    else:
-                                        await asyncio.sleep(0.001)
-
-                    elif data["type"] == "complete":
-                        # Response completed
-                        processing_time = data.get("processing_time_ms", 0)
-                        # Add to conversation history
-                        conversation_history.append({
-                            "role": "assistant",
-                            "content": full_response,
-                            "time": datetime.now()
-                        })
-                        # Trim history if too long
-                        if len(conversation_history) > 6:
-                            conversation_history.pop(0) if conversation_history[0]["role"] == "user" else None
-                        ui.console.print(
-                            f"\n[dim]⚡ {processing_time}ms[/dim]"
-                        )
-                        break
-
-                    elif data["type"] == "error":
-                        error_msg = data.get("error", "Unknown error")
-                        ui.print_error("AI Response Error", error_msg)
-                        break
-
-                except asyncio.TimeoutError:
-                    ui.print_error("Response timeout", "No data received")
+        decode = await _send_message(websocket, message)
+    except ConnectionClosed:
+        await close_connection()
+        websocket = await _get_connection(websocket_url)
+        decode = await _send_message(websocket, message)
+
+    # Receive and display streaming response. A reader task queues
+    # frames as they arrive, so every frame already waiting is handled
+    # together and its text written at once. The text written so far is
+    # joined once the reply ends.
+    response_parts: List[str] = []
+    frames: asyncio.Queue = asyncio.Queue(maxsize=MAX_QUEUED_FRAMES)
+    reader = asyncio.create_task(_read_frames(websocket, frames))
+
+    replied = False
+    try:
+        finished = False
+        while not finished:
+            try:
+                batch = [await asyncio.wait_for(frames.get(), timeout=300.0)]
+            except TimeoutError:
+                if not response_parts:
+                    raise
+                ui.print_error("Response timeout", "The reply stopped arriving")
+                break
+            while not frames.empty():
+                batch.append(frames.get_nowait())
+
+            # Collect the batch's text up to the end of the response
+            parts = []
+            outcome = None
+            for response in batch:
+                if isinstance(response, Exception):
+                    outcome = response
                     break
-                except websockets.exceptions.ConnectionClosed:
-                    ui.print_error("Connection closed by server")
+                data = decode(response)
+                if data["type"] == "chunk":
+                    content = data.get("content", "")
+                    if content:
+                        parts.append(content)
+                elif data["type"] in ("complete", "error"):
+                    outcome = data
                     break
 
-            return full_response
+            if parts:
+                if not response_parts:
+                    if thinking is not None:
+                        thinking.stop()
+                    # Print assistant header
+                    ui.console.print(
+                        "\n[bold magenta]🤖 Jengo[/bold magenta]"
+                    )
+
+                # Write the text as-is in one go; Rich's print adds
+                # markup parsing and rendering per call
+                content = "".join(parts)
+                ui.console.file.write(content)
+                ui.console.file.flush()
+                response_parts.append(content)
 
-    except Exception as e:
-        status_code = getattr(e, 'status_code', None)
-        if status_code == 404:
-            ui.print_error("Session not found", f"Session '{session_id}' not found")
-        elif status_code == 500:
-            ui.print_error("Server error", "The server encountered an error")
-        elif status_code:
-            ui.print_error(f"Connection failed (Status {status_code})", str(e))
-        else:
-            ui.print_error("Connection failed", str(e))
-        return None
+                if PACING_ENABLED:
+                    await asyncio.sleep(min(
+                        PACING_MAX_SECONDS,
+                        len(content) * PACING_SECONDS_PER_CHAR
+                    ))
+
+            if outcome is None:
+                continue
+            finished = True
+
+            if isinstance(outcome, Exception):
+                if not response_parts:
+                    raise outcome
+                # The server has already taken this turn, so sending the
+                # message again would repeat it; keep the partial reply
+                ui.print_error("Connection closed by server", str(outcome))
+            elif outcome["type"] == "complete":
+                # Response completed
+                replied = True
+                processing_time = outcome.get("processing_time_ms", 0)
+                # Add to conversation history
+                conversation_history.append({
+                    "role": "assistant",
+                    "content": "".join(response_parts),
+                    "time": datetime.now()
+                })
+                ui.console.print(
+                    f"\n[dim]⚡ {processing_time}ms[/dim]"
+                )
+            else:
+                replied = True
+                error_msg = outcome.get("error", "Unknown error")
+                ui.print_error("AI Response Error", error_msg)
+    finally:
+        reader.cancel()
+        if not replied:
+            # Frames left from an unfinished reply would be read as
+            # part of the next one, so don't reuse this connection
+            await close_connection()
+
+    return "".join(response_parts)
 
 
 async def send_streaming_message_with_retry(
     session_id: str,
     message: str,
-    max_retries: int = MAX_RETRY_ATTEMPTS
+    max_retries: int = MAX_RETRY_ATTEMPTS,
+    thinking: Optional[Status] = None
 ) -> Optional[str]:
-    """Send a message with automatic reconnection on failure."""
+    """Send a message with automatic reconnection on failure.
+
+    Dropped connections, timeouts and server errors are retried after the
+    RETRY_DELAYS backoff; the error is shown once retries run out, or at
+    once when the server rejects the session.
+    """
     retry_delays = RETRY_DELAYS[:max_retries]
 
     for attempt, delay in enumerate(retry_delays):
         try:
-            return await send_streaming_message(session_id, message)
+            return await send_streaming_message(session_id, message, thinking)
 
-        except websockets.exceptions.ConnectionClosed:
-            if attempt < len(retry_delays) - 1:
-                logger.warning(f"Connection closed, retrying in {delay}s...")
+        except (ConnectionClosed, InvalidHandshake, TimeoutError, OSError) as e:
+            status_code = _status_code(e)
+            retryable = status_code is None or status_code >= 500
+            if retryable and attempt < len(retry_delays) - 1:
+                logger.warning(f"Connection error: {e}, retrying in {delay}s...")
                 ui.print_warning(f"Connection lost. Retrying in {delay}s...")
                 await asyncio.sleep(delay)
                 continue
-            else:
-                ui.print_error("Connection failed", "Unable to reconnect")
-                return None
 
-        except Exception as e:
-            if attempt < len(retry_delays) - 1:
-                logger.warning(f"Connection error: {e}, retrying in {delay}s...")
-                await asyncio.sleep(delay)
-                continue
+            if status_code == 404:
+                ui.print_error(
+                    "Session not found", f"Session '{session_id}' not found"
+                )
+            elif status_code == 500:
+                ui.print_error("Server error", "The server encountered an error")
+            elif status_code:
+                ui.print_error(f"Connection failed (Status {status_code})", str(e))
+            elif isinstance(e, TimeoutError):
+                ui.print_error("Response timeout", "No data received")
+            elif isinstance(e, ConnectionClosed):
+                ui.print_error("Connection failed", "Unable to reconnect")
             else:
                 ui.print_error("Connection failed", str(e))
-                return None
+            return None
+
+    return None
+
 
+def _status_code(error: Exception) -> Optional[int]:
+    """Get the HTTP status of a rejected WebSocket handshake, if any."""
+    if isinstance(error, InvalidStatus):
+        return error.response.status_code
     return None
 
 
@@ -200,7 +335,7 @@ async def handle_new_session(session_id: str):
     """Handle new session creation."""
     global current_session, conversation_history
     current_session = session_id
-    conversation_history = []
+    conversation_history = deque(maxlen=HISTORY_SIZE)
     ui.print_success(f"Started new session")
 
 
@@ -233,30 +368,16 @@ async def chat_loop():
                 "time": datetime.now()
             })
 
-            # Show thinking animation
-            with Live(refresh_per_second=8) as live:
-                frames = ["Jengo is thinking.  ", 
-                         "Jengo is thinking.. ", 
-                         "Jengo is thinking..."]
-                frame_idx = 0
-                for _ in range(24):  # Up to 6 seconds
-                    if conversation_history and \
-                            conversation_history[-1].get("role") == "user":
-                        live.update(Text(frames[frame_idx], 
-                                         style="bold cyan"))
-                        frame_idx = (frame_idx + 1) % len(frames)
-                        await asyncio.sleep(0.25)
-                    else:
-                        break
-
-            # Send message and get response
-            if conversation_history and \
-                    conversation_history[-1].get("role") == "user":
+            # Send message and get response, with a spinner until the
+            # reply starts streaming
+            with ui.console.status(
+                "Jengo is thinking...", spinner="dots"
+            ) as thinking:
                 response = await send_streaming_message_with_retry(
-                    current_session, user_input
+                    current_session, user_input, thinking=thinking
                 )
-                if not response:
-                    conversation_history.pop()
+            if not response:
+                conversation_history.pop()
 
         except KeyboardInterrupt:
             ui.print_warning("Type /quit to exit or continue chatting.")
@@ -298,7 +419,10 @@ def chat(
         except Exception as e:
             ui.print_error(f"Fatal error: {e}")
             logger.error("Fatal CLI error", error=str(e))
+        finally:
+            await close_connection()
 
+    use_uvloop()
     asyncio.run(main())
 
 
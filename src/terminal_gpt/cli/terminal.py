@@ -10,15 +10,13 @@ from typing import Optional
 import httpx
 import typer
 from rich.console import Console
-from rich.live import Live
-from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
-from rich.spinner import Spinner
 from rich.table import Table
 from rich.theme import Theme
 
 from ..infrastructure.logging import get_logger
+from . import use_uvloop
 from .enhanced_ui import enhanced_ui, StatusLevel
 
 logger = get_logger("terminal_gpt.cli")
@@ -275,27 +273,29 @@ async def chat_loop():
                 response = await send_chat_message(current_session, user_input)
 
             if response:
-                # Display AI response
-                ui.print_message("assistant", response["reply"])
-
-                # Show metadata if available
-                if response.get("tokens_used"):
-                    ui.print_status(
-                        StatusLevel.INFO, 
-                        f"Tokens used: {response['tokens_used']}"
-                    )
-                if response.get("processing_time_ms"):
-                    ui.print_status(
-                        StatusLevel.INFO, 
-                        f"Response time: {response['processing_time_ms']}ms"
-                    )
-
-                # Show status
-                status = response.get("status", "unknown")
-                if status == "degraded":
-                    ui.print_status(StatusLevel.WARNING, "Response generated in degraded mode")
-                elif status == "error":
-                    ui.print_status(StatusLevel.ERROR, "Response generated with errors")
+                # Write the response and its status lines together
+                with ui.batch():
+                    # Display AI response
+                    ui.print_message("assistant", response["reply"])
+
+                    # Show metadata if available
+                    if response.get("tokens_used"):
+                        ui.print_status(
+                            StatusLevel.INFO, 
+                            f"Tokens used: {response['tokens_used']}"
+                        )
+                    if response.get("processing_time_ms"):
+                        ui.print_status(
+                            StatusLevel.INFO, 
+                            f"Response time: {response['processing_time_ms']}ms"
+                        )
+
+                    # Show status
+                    status = response.get("status", "unknown")
+                    if status == "degraded":
+                        ui.print_status(StatusLevel.WARNING, "Response generated in degraded mode")
+                    elif status == "error":
+                        ui.print_status(StatusLevel.ERROR, "Response generated with errors")
 
             else:
                 ui.print_status(StatusLevel.ERROR, "Failed to get response from AI")
@@ -384,6 +384,7 @@ def chat(
             await client.aclose()
 
     # Run async main
+    use_uvloop()
     asyncio.run(main())
 
 
@@ -399,6 +400,7 @@ def sessions(api_url: str = typer.Option("http://localhost:8000", "--api-url", h
 
         await handle_sessions_command()
 
+    use_uvloop()
     asyncio.run(main())
 
 
@@ -414,6 +416,7 @@ def stats(api_url: str = typer.Option("http://localhost:8000", "--api-url", help
 
         await handle_stats_command()
 
+    use_uvloop()
     asyncio.run(main())
 
 
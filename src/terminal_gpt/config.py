@@ -195,6 +195,8 @@ struggle.
 
 # Default configuration
 DEFAULT_CONFIG = {
+    # Without summarization, history is trimmed to sliding_window_size each
+    # turn and max_conversation_length only applies when it is smaller
     "max_conversation_length": 100,
     "sliding_window_size": 50,
     "enable_summarization": False,
@@ -205,6 +207,17 @@ DEFAULT_CONFIG = {
     "preserve_user_preferences": True,
     "preserve_tool_results": True,
     "preserve_file_context": True,
+    # Estimated token budget for LLM context; 0 limits by message count only
+    "max_context_tokens": 0,
+    # Maximum plugins run concurrently for one LLM response
+    "max_parallel_tools": 4,
+    # File for conversations evicted from memory; empty discards them
+    "conversation_spill_path": "",
+    # Change log active conversations are restored from; empty disables it
+    "conversation_journal_path": "",
+    # LLM response cache settings
+    "enable_response_cache": False,
+    "response_cache_size": 256,
 }
 
 # Environment variable mappings
@@ -213,6 +226,12 @@ CONFIG_ENV_VARS = {
     "SLIDING_WINDOW_SIZE": "sliding_window_size",
     "ENABLE_SUMMARIZATION": "enable_summarization",
     "USE_OPTIMIZED_PROMPT": "use_optimized_prompt",
+    "MAX_CONTEXT_TOKENS": "max_context_tokens",
+    "MAX_PARALLEL_TOOLS": "max_parallel_tools",
+    "CONVERSATION_SPILL_PATH": "conversation_spill_path",
+    "CONVERSATION_JOURNAL_PATH": "conversation_journal_path",
+    "ENABLE_RESPONSE_CACHE": "enable_response_cache",
+    "RESPONSE_CACHE_SIZE": "response_cache_size",
 }
 
 
@@ -231,10 +250,19 @@ def load_config() -> dict:
                     config[config_key] = int(env_value)
                 except ValueError:
                     pass  # Keep default
+            else:
+                config[config_key] = env_value
 
     # Handle system prompt selection - always use new concise prompt
     config["system_prompt"] = JENGO_SYSTEM_PROMPT
 
+    # No tool could ever run with zero slots, so turns with tool calls hang
+    if config["max_parallel_tools"] < 1:
+        raise ValueError(
+            "MAX_PARALLEL_TOOLS must be at least 1, "
+            f"got {config['max_parallel_tools']}."
+        )
+
     return config
 
 
@@ -1,8 +1,9 @@
 """Core domain models for Terminal GPT."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional
-from pydantic import BaseModel, Field, field_validator, model_validator
+from functools import cached_property
+from typing import Any, Dict, List, Literal, Mapping, Optional, Self
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
 
 class Message(BaseModel):
@@ -67,11 +68,46 @@ class Message(BaseModel):
             raise ValueError("tool_call_id cannot be empty if provided")
         return v.strip() if v else v
 
+    @cached_property
+    def as_llm_dict(self) -> Dict[str, Any]:
+        """The message in LLM API form, built once per message.
+
+        Includes ``tool_calls`` for assistant messages and ``tool_call_id``
+        and ``name`` for tool messages. The dict is shared, so treat it as
+        read-only.
+        """
+        llm_dict: Dict[str, Any] = {"role": self.role, "content": self.content}
+
+        if self.role == "assistant" and self.tool_calls is not None:
+            llm_dict["tool_calls"] = self.tool_calls
+
+        if self.role == "tool":
+            if self.tool_call_id:
+                llm_dict["tool_call_id"] = self.tool_call_id
+            if self.name:
+                llm_dict["name"] = self.name
+
+        return llm_dict
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the message, dropping the cached LLM dict if fields change."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("as_llm_dict", None)
+        return copied
+
     class Config:
         """Pydantic configuration."""
         frozen = True  # Immutable messages
 
 
+# Bounds for the plain-text note kept about messages trimmed from a window
+EVICTED_EXCERPT_LENGTH = 80
+EVICTED_SUMMARY_MAX_LINES = 10
+
+
 class ConversationState(BaseModel):
     """The state of a conversation session."""
 
@@ -82,6 +118,21 @@ class ConversationState(BaseModel):
     awaiting_user: bool = Field(default=False)
     active_task: Optional[str] = Field(default=None)
     tool_cycle_count: int = Field(default=0)
+    evicted_summary: Optional[str] = Field(default=None)
+
+    # Running total of message content length, maintained incrementally so
+    # token estimates don't rescan the whole history every turn
+    _char_total: int = PrivateAttr(default=0)
+    # Number of system messages, so context selection can tell whether they
+    # all sit at the start without scanning the history
+    _system_count: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Seed the counters from any initial messages."""
+        self._char_total = sum(
+            len(msg.content) for msg in self.messages if msg.content
+        )
+        self._system_count = sum(1 for msg in self.messages if msg.role == "system")
 
     @field_validator('session_id')
     @classmethod
@@ -116,12 +167,63 @@ class ConversationState(BaseModel):
     def add_message(self, message: Message) -> 'ConversationState':
         """Add a message to the conversation (immutable update)."""
         new_messages = self.messages + [message]
-        return self.copy(
+        updated = self.copy(
             update={
                 'messages': new_messages,
                 'updated_at': datetime.utcnow()
             }
         )
+        updated._char_total = self._char_total + len(message.content or "")
+        updated._system_count = self._system_count + (message.role == "system")
+        return updated
+
+    def append_message(self, message: Message) -> None:
+        """Append a message in place.
+
+        Cheaper than ``add_message`` for long histories, but only safe on a
+        state that is not shared, e.g. a copy already made for this turn.
+        """
+        self.messages.append(message)
+        self.updated_at = datetime.utcnow()
+        self._char_total += len(message.content or "")
+        self._system_count += message.role == "system"
+
+    def trim_to_window(self, window_size: int) -> 'ConversationState':
+        """Drop all but the most recent non-system messages (immutable update).
+
+        System messages are always kept. A short plain-text note of the
+        evicted user turns is accumulated in ``evicted_summary`` so the
+        dropped prefix can still be surfaced to the LLM without extra calls.
+        """
+        evict_count = len(self.messages) - self._system_count - window_size
+        if evict_count <= 0:
+            return self
+
+        kept: list[Message] = []
+        evicted_chars = 0
+        summary_lines = self.evicted_summary.split("\n") if self.evicted_summary else []
+
+        for msg in self.messages:
+            if msg.role != "system" and evict_count > 0:
+                evict_count -= 1
+                evicted_chars += len(msg.content or "")
+                if msg.role == "user" and msg.content:
+                    excerpt = msg.content[:EVICTED_EXCERPT_LENGTH].replace("\n", " ")
+                    summary_lines.append(f"- user: {excerpt}")
+            else:
+                kept.append(msg)
+
+        trimmed = self.copy(
+            update={
+                'messages': kept,
+                'evicted_summary': (
+                    "\n".join(summary_lines[-EVICTED_SUMMARY_MAX_LINES:])
+                    if summary_lines else None
+                ),
+            }
+        )
+        trimmed._char_total = self._char_total - evicted_chars
+        return trimmed
 
     def get_recent_messages(self, limit: int = 50) -> list[Message]:
         """Get the most recent messages for context."""
@@ -131,6 +233,24 @@ class ConversationState(BaseModel):
         """Get the total number of messages."""
         return len(self.messages)
 
+    @property
+    def char_total(self) -> int:
+        """Total content length across all messages."""
+        return self._char_total
+
+    @property
+    def system_count(self) -> int:
+        """Number of system messages in the conversation."""
+        return self._system_count
+
+    def get_char_total(self) -> int:
+        """Get the total content length across all messages."""
+        return self._char_total
+
+    def stats(self) -> tuple[int, int]:
+        """Get (message count, total content length) without rescanning."""
+        return len(self.messages), self._char_total
+
     class Config:
         """Pydantic configuration."""
         validate_assignment = True
@@ -148,12 +268,7 @@ class ConversationSummary(BaseModel):
     def from_conversation(cls, conversation: ConversationState) -> 'ConversationSummary':
         """Create a summary from a conversation state."""
         # Rough token estimation (4 chars per token average)
-        # Handle None content for tool call messages
-        total_chars = sum(
-            len(msg.content) if msg.content else 0 
-            for msg in conversation.messages
-        )
-        token_estimate = total_chars // 4
+        token_estimate = conversation.get_char_total() // 4
 
         return cls(
             session_id=conversation.session_id,
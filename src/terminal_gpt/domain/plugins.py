@@ -179,6 +179,7 @@ class PluginRegistry:
 
     def __init__(self):
         self._plugins: Dict[str, Plugin] = {}
+        self._version = 0
 
     def register(self, plugin: Plugin) -> None:
         """Register a plugin instance.
@@ -195,6 +196,12 @@ class PluginRegistry:
             )
 
         self._plugins[plugin.name] = plugin
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the set of registered plugins changes."""
+        return self._version
 
     def get(self, name: str) -> Plugin:
         """Get a registered plugin by name.
@@ -3,6 +3,7 @@
 This module contains the core plugins that ship with Terminal GPT.
 """
 
+import asyncio
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
@@ -48,8 +49,10 @@ class ReadFilePlugin(Plugin):
             if file_size > 1024 * 1024:
                 raise PluginError(f"File too large (>1MB): {file_size} bytes")
 
-            # Read file content
-            content = path.read_text(encoding='utf-8', errors='replace')
+            # Read file content off the event loop
+            content = await asyncio.to_thread(
+                path.read_text, encoding='utf-8', errors='replace'
+            )
 
             return ReadFileOutput(
                 content=content,
@@ -98,8 +101,10 @@ class WriteFilePlugin(Plugin):
             if input_data.create_directories:
                 path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write file content
-            path.write_text(input_data.content, encoding='utf-8')
+            # Write file content off the event loop
+            await asyncio.to_thread(
+                path.write_text, input_data.content, encoding='utf-8'
+            )
 
             bytes_written = len(input_data.content.encode('utf-8'))
 
@@ -153,20 +158,10 @@ class ListDirectoryPlugin(Plugin):
             if not path.is_dir():
                 raise PluginError(f"Path is not a directory: {input_data.path}")
 
-            entries = []
-            for item in path.iterdir():
-                # Skip hidden files unless requested
-                if not input_data.show_hidden and item.name.startswith('.'):
-                    continue
-
-                entry_type = "directory" if item.is_dir() else "file"
-                size = item.stat().st_size if item.is_file() else None
-
-                entries.append(DirectoryEntry(
-                    name=item.name,
-                    type=entry_type,
-                    size=size
-                ))
+            # Directory scans stat every entry, so run them off the event loop
+            entries = await asyncio.to_thread(
+                self._scan_directory, path, input_data.show_hidden
+            )
 
             # Sort entries by name
             entries.sort(key=lambda e: e.name.lower())
@@ -181,6 +176,25 @@ class ListDirectoryPlugin(Plugin):
         except Exception as e:
             raise PluginError(f"Failed to list directory {input_data.path}: {e}")
 
+    @staticmethod
+    def _scan_directory(path: Path, show_hidden: bool) -> List[DirectoryEntry]:
+        """Collect entries for a directory (blocking filesystem calls)."""
+        entries = []
+        for item in path.iterdir():
+            # Skip hidden files unless requested
+            if not show_hidden and item.name.startswith('.'):
+                continue
+
+            entry_type = "directory" if item.is_dir() else "file"
+            size = item.stat().st_size if item.is_file() else None
+
+            entries.append(DirectoryEntry(
+                name=item.name,
+                type=entry_type,
+                size=size
+            ))
+        return entries
+
 
 class CalculatorInput(BaseModel):
     """Input schema for calculator plugin."""
@@ -16,6 +16,27 @@ from ..infrastructure.llm_providers import LLMProvider
 logger = get_logger("terminal_gpt.context_summarizer")
 
 
+def _keyword_pattern(*keywords: str) -> "re.Pattern[str]":
+    """Compile keywords into one alternation so text is scanned only once."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+# Precompiled matchers for the keyword heuristics below
+_LANGUAGE_PATTERNS = (
+    re.compile(r'\b(python|javascript|java|rust|go|c\+\+|c#|typescript)\b'),
+    re.compile(r'\b(aws|azure|gcp|kubernetes|docker)\b'),
+)
+_STUDY_TOPICS = _keyword_pattern('aws', 'cka', 'certification', 'study')
+_SPORTS_INTERESTS = _keyword_pattern('epl', 'nba', 'football', 'basketball')
+_SYSTEM_INFO = _keyword_pattern('macbook', 'm1', 'slow', 'performance')
+_FILE_OPERATIONS = _keyword_pattern('read file', 'write file', 'list directory')
+_PROBLEM_KEYWORDS = _keyword_pattern('debug', 'issue', 'problem', 'help')
+_IMPORTANT_TOOL_INDICATORS = _keyword_pattern(
+    'content:', 'result:', 'score:', 'stat:', 'path:', 'file:',
+    'calculation:', 'directory:', 'list:', 'read_file', 'write_file'
+)
+
+
 class ContextSummary:
     """Represents a summarized context entry."""
 
@@ -186,25 +207,20 @@ class ContextSummarizer:
                 content = message.content.lower()
 
                 # Extract coding languages
-                lang_patterns = [
-                    r'\b(python|javascript|java|rust|go|c\+\+|c#|typescript)\b',
-                    r'\b(aws|azure|gcp|kubernetes|docker)\b'
-                ]
-
-                for pattern in lang_patterns:
-                    matches = re.findall(pattern, content)
+                for pattern in _LANGUAGE_PATTERNS:
+                    matches = pattern.findall(content)
                     preferences["coding_languages"].extend(matches)
 
                 # Extract study topics
-                if any(topic in content for topic in ['aws', 'cka', 'certification', 'study']):
+                if _STUDY_TOPICS.search(content):
                     preferences["study_topics"].append(content[:100])
 
                 # Extract sports interests
-                if any(sport in content for sport in ['epl', 'nba', 'football', 'basketball']):
+                if _SPORTS_INTERESTS.search(content):
                     preferences["sports_interests"].append(content[:100])
 
                 # Extract system information
-                if any(info in content for info in ['macbook', 'm1', 'slow', 'performance']):
+                if _SYSTEM_INFO.search(content):
                     preferences["system_info"]["performance_issues"] = True
 
         # Remove duplicates and clean up
@@ -263,7 +279,7 @@ class ContextSummarizer:
                     file_context["important_paths"].extend(matches)
 
                 # Extract file operations
-                if any(op in content.lower() for op in ['read file', 'write file', 'list directory']):
+                if _FILE_OPERATIONS.search(content.lower()):
                     file_context["file_operations"].append({
                         "operation": content[:100],
                         "timestamp": message.timestamp.isoformat()
@@ -301,7 +317,7 @@ class ContextSummarizer:
                 technical_context["code_snippets"].append(content[:300])
 
             # Extract problem descriptions
-            if any(keyword in content.lower() for keyword in ['debug', 'issue', 'problem', 'help']):
+            if _PROBLEM_KEYWORDS.search(content.lower()):
                 technical_context["current_problems"].append(content[:150])
 
         return technical_context
@@ -316,12 +332,7 @@ class ContextSummarizer:
         # - Sports scores/stats
         # - Directory listings
 
-        important_indicators = [
-            'content:', 'result:', 'score:', 'stat:', 'path:', 'file:',
-            'calculation:', 'directory:', 'list:', 'read_file', 'write_file'
-        ]
-
-        return any(indicator in content for indicator in important_indicators)
+        return _IMPORTANT_TOOL_INDICATORS.search(content) is not None
 
     def _select_recent_messages(self, messages: List[Message]) -> List[Message]:
         """
@@ -445,8 +456,13 @@ Summary:
 
         # Add recent activity
         if messages:
-            last_user_msg = next(
-                (m for m in reversed(messages) if m.role == "user"), None
+            # The newest message is usually the user's turn; only fall back
+            # to a backwards scan when it isn't
+            last_user_msg = (
+                messages[-1] if messages[-1].role == "user"
+                else next(
+                    (m for m in reversed(messages) if m.role == "user"), None
+                )
             )
             if last_user_msg:
                 summary_parts.append(f"Recent topic: {last_user_msg.content[:50]}...")
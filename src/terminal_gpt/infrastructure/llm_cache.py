@@ -0,0 +1,130 @@
+"""Response cache for LLM calls."""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Protocol, Sequence
+
+import orjson
+
+from .llm_providers import LLMResponse
+
+
+def request_key(
+    model: str,
+    messages: Sequence[Dict[str, Any]],
+    tools: Optional[Sequence[Dict[str, Any]]],
+    config: Mapping[str, Any]
+) -> str:
+    """Hash everything that determines an LLM response into a key."""
+    payload = orjson.dumps(
+        {
+            "model": model,
+            "messages": messages,
+            "tools": tools,
+            "config": dict(config)
+        },
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+class CacheBackend(Protocol):
+    """Storage used by LLMCache.
+
+    Backends store plain dicts so that out-of-process stores (Redis, files)
+    can be plugged in without knowing about LLMResponse.
+    """
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored value for a key, if any."""
+        ...
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a value under a key."""
+        ...
+
+
+class MemoryLRUBackend:
+    """In-process LRU backend."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored value for a key, marking it recently used."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LLMCache:
+    """Cache of final LLM responses keyed by the full request.
+
+    Only deterministic requests (temperature 0) are cached unless
+    ``cache_sampled`` is set, since sampled responses are expected to vary.
+    Responses that request tool calls are never cached.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        cache_sampled: bool = False
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend, an in-memory LRU by default
+            cache_sampled: Whether to also cache requests with temperature > 0
+        """
+        self.backend = backend if backend is not None else MemoryLRUBackend()
+        self.cache_sampled = cache_sampled
+        self.stats = {"hits": 0, "misses": 0}
+
+    def make_key(
+        self,
+        model: str,
+        messages: Sequence[Dict[str, Any]],
+        tools: Optional[Sequence[Dict[str, Any]]],
+        config: Mapping[str, Any]
+    ) -> Optional[str]:
+        """Build the cache key for a request, or None if it isn't cacheable."""
+        if not self.is_cacheable(config):
+            return None
+        return request_key(model, messages, tools, config)
+
+    def is_cacheable(self, config: Mapping[str, Any]) -> bool:
+        """Check whether requests with this generation config are cached."""
+        return self.cache_sampled or config.get("temperature", 0) <= 0
+
+    async def get(self, key: Optional[str]) -> Optional[LLMResponse]:
+        """Look up a cached response."""
+        if key is None:
+            return None
+
+        value = await self.backend.get(key)
+        if value is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return LLMResponse(**value)
+
+    async def set(self, key: Optional[str], response: LLMResponse) -> None:
+        """Store a final response."""
+        if key is None or response.tool_calls:
+            return
+        await self.backend.set(key, response.model_dump())
@@ -1,10 +1,11 @@
 """LLM provider implementations for Terminal GPT."""
 
 import asyncio
+import importlib.util
 import json
 import time
 from abc import ABC, abstractmethod
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence
 
 import httpx
 from pydantic import BaseModel
@@ -20,6 +21,12 @@ from ..application.events import publish_llm_call
 
 logger = get_logger("terminal_gpt.llm")
 
+# HTTP/2 lets concurrent requests share one connection; it needs the h2 package
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection pool limits for the shared provider client
+_CONNECTION_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+
 
 class LLMResponse(BaseModel):
     """Standardized LLM response format."""
@@ -38,23 +45,47 @@ class LLMProvider(ABC):
         self.api_key = api_key
         self.model = model
         self._client: Optional[httpx.AsyncClient] = None
+        self._persistent = False
+        self._active_contexts = 0
 
-    async def __aenter__(self):
-        """Async context manager entry."""
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create a pooled HTTP client for API requests."""
         # Increased timeouts for long streaming responses (Session Stability Fix)
         timeout = httpx.Timeout(60.0, read=180.0)  # 60s connect, 180s read
-        self._client = httpx.AsyncClient(
+        return httpx.AsyncClient(
             timeout=timeout,
-            headers=self._get_headers()
+            headers=self._get_headers(),
+            http2=_HTTP2_AVAILABLE,
+            limits=_CONNECTION_LIMITS
         )
-        return self
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
+    async def open(self) -> None:
+        """Open a persistent client that is reused until aclose() is called."""
+        if self._client is None:
+            self._client = self._create_client()
+        self._persistent = True
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        self._persistent = False
         if self._client:
             await self._client.aclose()
             self._client = None
 
+    async def __aenter__(self):
+        """Async context manager entry."""
+        # Reuse an open client (persistent or held by a concurrent context)
+        if self._client is None:
+            self._client = self._create_client()
+        self._active_contexts += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        self._active_contexts -= 1
+        if self._active_contexts == 0 and not self._persistent:
+            await self.aclose()
+
     @abstractmethod
     def _get_headers(self) -> Dict[str, str]:
         """Get HTTP headers for API requests."""
@@ -64,7 +95,7 @@ class LLMProvider(ABC):
     async def generate(
         self,
         messages: List[Dict[str, Any]],
-        tools: Optional[List[Dict[str, Any]]] = None,
+        tools: Optional[Sequence[Dict[str, Any]]] = None,
         config: Optional[Dict[str, Any]] = None
     ) -> LLMResponse:
         """Generate response from LLM."""
@@ -74,7 +105,7 @@ class LLMProvider(ABC):
     async def generate_stream(
         self,
         messages: List[Dict[str, Any]],
-        tools: Optional[List[Dict[str, Any]]] = None,
+        tools: Optional[Sequence[Dict[str, Any]]] = None,
         config: Optional[Dict[str, Any]] = None
     ) -> AsyncGenerator[LLMResponse, None]:
         """Generate streaming response from LLM."""
@@ -119,7 +150,7 @@ class OpenRouterProvider(LLMProvider):
     async def generate(
         self,
         messages: List[Dict[str, Any]],
-        tools: Optional[List[Dict[str, Any]]] = None,
+        tools: Optional[Sequence[Dict[str, Any]]] = None,
         config: Optional[Dict[str, Any]] = None
     ) -> LLMResponse:
         """Generate response from OpenRouter with retry logic."""
@@ -127,7 +158,7 @@ class OpenRouterProvider(LLMProvider):
             raise LLMError("Provider not properly initialized. Use async context manager.")
 
         config = config or {}
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Prepare request payload
         payload = {
@@ -138,6 +169,10 @@ class OpenRouterProvider(LLMProvider):
             "top_p": config.get("top_p", 1.0),
         }
 
+        # Lets the backend reuse the cached prompt prefix across turns
+        if "prompt_cache_key" in config:
+            payload["prompt_cache_key"] = config["prompt_cache_key"]
+
         if tools:
             payload["tools"] = tools
             payload["tool_choice"] = "auto"
@@ -176,7 +211,7 @@ class OpenRouterProvider(LLMProvider):
                 result = self._parse_response(response_data)
 
                 # Publish success event
-                duration_ms = int((time.time() - start_time) * 1000)
+                duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
                 await publish_llm_call(
                     provider="openrouter",
                     model=self.model,
@@ -194,7 +229,7 @@ class OpenRouterProvider(LLMProvider):
                     model=self.model,
                     tokens_used=0,
                     success=False,
-                    duration_ms=int((time.time() - start_time) * 1000)
+                    duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000
                 )
                 raise
 
@@ -219,7 +254,7 @@ class OpenRouterProvider(LLMProvider):
                         model=self.model,
                         tokens_used=0,
                         success=False,
-                        duration_ms=int((time.time() - start_time) * 1000)
+                        duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000
                     )
                     raise
 
@@ -242,7 +277,7 @@ class OpenRouterProvider(LLMProvider):
                         model=self.model,
                         tokens_used=0,
                         success=False,
-                        duration_ms=int((time.time() - start_time) * 1000)
+                        duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000
                     )
                     raise last_exception
 
@@ -252,7 +287,7 @@ class OpenRouterProvider(LLMProvider):
     async def generate_stream(
         self,
         messages: List[Dict[str, Any]],
-        tools: Optional[List[Dict[str, Any]]] = None,
+        tools: Optional[Sequence[Dict[str, Any]]] = None,
         config: Optional[Dict[str, Any]] = None
     ) -> AsyncGenerator[LLMResponse, None]:
         """Generate streaming response from OpenRouter with retry logic."""
@@ -260,7 +295,7 @@ class OpenRouterProvider(LLMProvider):
             raise LLMError("Provider not properly initialized. Use async context manager.")
 
         config = config or {}
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Prepare request payload with streaming enabled
         payload = {
@@ -272,6 +307,10 @@ class OpenRouterProvider(LLMProvider):
             "stream": True,
         }
 
+        # Lets the backend reuse the cached prompt prefix across turns
+        if "prompt_cache_key" in config:
+            payload["prompt_cache_key"] = config["prompt_cache_key"]
+
         if tools:
             payload["tools"] = tools
             payload["tool_choice"] = "auto"
@@ -345,7 +384,7 @@ class OpenRouterProvider(LLMProvider):
                     yield chunk
 
                 # Publish success event
-                duration_ms = int((time.time() - start_time) * 1000)
+                duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
                 await publish_llm_call(
                     provider="openrouter",
                     model=self.model,
@@ -363,7 +402,7 @@ class OpenRouterProvider(LLMProvider):
                     model=self.model,
                     tokens_used=0,
                     success=False,
-                    duration_ms=int((time.time() - start_time) * 1000)
+                    duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000
                 )
                 raise
 
@@ -388,7 +427,7 @@ class OpenRouterProvider(LLMProvider):
                         model=self.model,
                         tokens_used=0,
                         success=False,
-                        duration_ms=int((time.time() - start_time) * 1000)
+                        duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000
                     )
                     raise
 
@@ -411,7 +450,7 @@ class OpenRouterProvider(LLMProvider):
                         model=self.model,
                         tokens_used=0,
                         success=False,
-                        duration_ms=int((time.time() - start_time) * 1000)
+                        duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000
                     )
                     raise last_exception
 
@@ -76,6 +76,9 @@ class PromptManager:
         """Initialize prompt manager with cache."""
         self._cache = PromptCache()
         self._config = load_config()
+        # The configuration is fixed for the manager's lifetime, so its cache
+        # key only needs hashing once
+        self._cache_key = self._generate_cache_key()
 
     def get_system_prompt(self) -> str:
         """
@@ -84,8 +87,7 @@ class PromptManager:
         Returns:
             System prompt content
         """
-        # Create cache key based on configuration
-        cache_key = self._generate_cache_key()
+        cache_key = self._cache_key
 
         # Try to get from cache first
         cached_prompt = self._cache.get(cache_key)
@@ -5,6 +5,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
+from .cli import use_uvloop
+
 console = Console()
 
 
@@ -15,6 +17,12 @@ app = typer.Typer(
 )
 
 
+@app.callback()
+def main() -> None:
+    """Configure the runtime shared by all commands."""
+    use_uvloop()
+
+
 @app.command()
 def server(
     host: str = typer.Option(
@@ -23,9 +31,14 @@ def server(
     port: int = typer.Option(
         8000, "--port", "-p", help="Port to bind the server to"
     ),
-    reload: bool = typer.Option(True, "--reload", help="Enable auto-reload"),
+    dev: bool = typer.Option(
+        False, "--dev", "--reload", help="Development mode with auto-reload"
+    ),
 ):
     """Start the FastAPI server."""
+    import importlib.util
+    import os
+
     import uvicorn
 
     console.print(Panel(
@@ -33,15 +46,33 @@ def server(
         border_style="green"
     ))
 
+    # Prefer the C-accelerated event loop and HTTP parser when available
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    web_concurrency = os.getenv("WEB_CONCURRENCY")
+    if web_concurrency not in (None, "", "1"):
+        # Conversations, caches and the chat batch queue live in the worker's
+        # memory, so a session started on one worker is unknown to the others
+        console.print(
+            f"[yellow]⚠️  WEB_CONCURRENCY={web_concurrency} ignored: sessions "
+            "are kept per process and there is no shared store, so running "
+            "one worker[/yellow]"
+        )
+
     console.print(f"📡 Server will run at: http://{host}:{port}")
-    console.print(f"🔄 Auto-reload: {'Enabled' if reload else 'Disabled'}")
+    console.print(f"🔄 Auto-reload: {'Enabled' if dev else 'Disabled'}")
+    console.print(f"⚙️  Event loop: {loop}, HTTP parser: {http}, workers: 1")
     console.print("\nPress Ctrl+C to stop the server\n")
 
     uvicorn.run(
         "src.terminal_gpt.api.routes:app",
         host=host,
         port=port,
-        reload=reload
+        reload=dev,
+        workers=1,
+        loop=loop,
+        http=http,
+        ws="websockets"
     )
 
 
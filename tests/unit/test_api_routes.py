@@ -0,0 +1,439 @@
+"""Unit tests for the API routes."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence
+
+import msgspec
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from terminal_gpt.api import routes
+from terminal_gpt.application.events import event_bus
+from terminal_gpt.domain.exceptions import LLMError
+from terminal_gpt.domain.plugins import plugin_registry
+from terminal_gpt.infrastructure.llm_providers import LLMProvider, LLMResponse
+
+
+class FakeProvider(LLMProvider):
+    """Provider echoing the latest user message, crashing on "fail"."""
+
+    def __init__(self):
+        super().__init__("test-key", model="test-model")
+
+    def _get_headers(self) -> Dict[str, str]:
+        return {}
+
+    def _handle_error(self, response) -> None:
+        pass
+
+    async def open(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+    async def generate(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[Sequence[Dict[str, Any]]] = None,
+        config: Optional[Dict[str, Any]] = None
+    ) -> LLMResponse:
+        content = messages[-1]["content"]
+        if content.startswith("fail"):
+            raise RuntimeError("Provider crashed")
+        # Give concurrent requests time to share a batch
+        await asyncio.sleep(0.01)
+        return LLMResponse(content=f"Echo: {content}", model=self.model)
+
+    async def generate_stream(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[Sequence[Dict[str, Any]]] = None,
+        config: Optional[Dict[str, Any]] = None
+    ) -> AsyncGenerator[LLMResponse, None]:
+        reply = await self.generate(messages, tools, config)
+        words = reply.content.split(" ")
+        for index, word in enumerate(words):
+            last = index == len(words) - 1
+            yield LLMResponse(
+                content=word if last else word + " ",
+                model=self.model,
+                finish_reason="stop" if last else None
+            )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def empty_plugin_registry():
+    """Unregister the built-in plugins that importing the routes registered."""
+    yield
+    plugin_registry._plugins.clear()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Run the app against a fake provider, with the real startup wiring."""
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+    monkeypatch.setenv("ENABLE_RESPONSE_CACHE", "false")
+    monkeypatch.setenv("CONVERSATION_SPILL_PATH", "")
+    monkeypatch.setenv("CONVERSATION_JOURNAL_PATH", "")
+    provider = FakeProvider()
+    monkeypatch.setattr(
+        routes, "create_llm_provider", lambda *args, **kwargs: provider
+    )
+    # Each TestClient runs its own event loop, and a queue stays bound to the
+    # loop it was first used on
+    monkeypatch.setattr(event_bus, "_queues", [
+        asyncio.Queue(maxsize=queue.maxsize) for queue in event_bus._queues
+    ])
+
+    # Startup replaces the orchestrator dependency with the one it built
+    # around the fake provider
+    with TestClient(routes.app) as test_client:
+        assert routes.get_orchestrator in routes.app.dependency_overrides
+        yield test_client
+
+
+class FakeOrchestrator:
+    """Orchestrator recording the batches it is given."""
+
+    def __init__(self):
+        self.batches: List[List[tuple]] = []
+
+    async def process_user_messages_batch(self, requests):
+        self.batches.append(list(requests))
+        return [
+            LLMError("boom") if message == "fail" else f"Echo: {message}"
+            for _, message in requests
+        ]
+
+
+class TestChatBatching:
+    """Test micro-batching of /chat requests."""
+
+    def test_concurrent_requests_get_their_own_replies(self, client):
+        """Test that batched requests each receive their own response."""
+        batches = []
+        orchestrator = routes._orchestrator
+        process_batch = orchestrator.process_user_messages_batch
+
+        async def recording_batch(requests):
+            batches.append(len(requests))
+            return await process_batch(requests)
+
+        orchestrator.process_user_messages_batch = recording_batch
+        messages = [f"message {i}" for i in range(8)] + ["fail now"]
+
+        def post(index_message):
+            index, message = index_message
+            return client.post(
+                "/chat", json={"session_id": f"s{index}", "message": message}
+            ).json()
+
+        with ThreadPoolExecutor(len(messages)) as pool:
+            replies = list(pool.map(post, enumerate(messages)))
+
+        for index, (message, reply) in enumerate(zip(messages[:-1], replies)):
+            assert reply["session_id"] == f"s{index}"
+            assert reply["status"] == "success"
+            assert reply["reply"] == f"Echo: {message}"
+
+        # The provider crash fails only its own request
+        assert replies[-1]["status"] == "error"
+        assert sum(batches) == len(messages)
+
+    def test_same_session_requests_keep_order(self, client):
+        """Test that a session's messages build one history when batched."""
+        for message in ("first", "second"):
+            reply = client.post(
+                "/chat", json={"session_id": "ordered", "message": message}
+            ).json()
+            assert reply["reply"] == f"Echo: {message}"
+
+        conversation = routes._orchestrator.get_conversation("ordered")
+        contents = [msg.content for msg in conversation.messages
+                    if msg.role != "system"]
+        assert contents == ["first", "Echo: first", "second", "Echo: second"]
+
+
+class TestChatBatchLoop:
+    """Test how queued /chat requests are grouped and resolved."""
+
+    @pytest.fixture
+    def queue(self, monkeypatch):
+        queue: asyncio.Queue = asyncio.Queue()
+        monkeypatch.setattr(routes, "_chat_queue", queue)
+        return queue
+
+    @staticmethod
+    async def submit(queue, message: str) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        await queue.put(("s1", message, future))
+        return future
+
+    @pytest.mark.asyncio
+    async def test_batches_are_cut_at_max_batch(self, monkeypatch, queue):
+        """Test that a backlog is split into batches of at most MAX_BATCH."""
+        monkeypatch.setattr(routes, "MAX_BATCH", 3)
+        orchestrator = FakeOrchestrator()
+        futures = [await self.submit(queue, f"m{i}") for i in range(5)]
+
+        worker = asyncio.create_task(routes._chat_batch_loop(orchestrator))
+        try:
+            results = await asyncio.wait_for(asyncio.gather(*futures), 1)
+        finally:
+            worker.cancel()
+
+        assert [len(batch) for batch in orchestrator.batches] == [3, 2]
+        assert results == [f"Echo: m{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_batch_closes_at_deadline(self, monkeypatch, queue):
+        """Test that requests after BATCH_WAIT_MS start a new batch."""
+        monkeypatch.setattr(routes, "BATCH_WAIT_MS", 10)
+        orchestrator = FakeOrchestrator()
+        worker = asyncio.create_task(routes._chat_batch_loop(orchestrator))
+        try:
+            first = await self.submit(queue, "a")
+            second = await self.submit(queue, "b")
+            assert await asyncio.wait_for(first, 1) == "Echo: a"
+
+            # Well past the first batch's deadline
+            await asyncio.sleep(0.05)
+            third = await self.submit(queue, "c")
+            assert await asyncio.wait_for(third, 1) == "Echo: c"
+            assert await second == "Echo: b"
+        finally:
+            worker.cancel()
+
+        assert [[m for _, m in batch] for batch in orchestrator.batches] == [
+            ["a", "b"], ["c"]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failures_stay_with_their_request(self):
+        """Test that a failed request leaves the rest of its batch intact."""
+        loop = asyncio.get_running_loop()
+        batch = [("s1", m, loop.create_future()) for m in ("ok", "fail", "ok")]
+        # A request whose client went away is skipped
+        batch[2][2].cancel()
+
+        await routes._dispatch_chat_batch(FakeOrchestrator(), batch)
+
+        assert batch[0][2].result() == "Echo: ok"
+        with pytest.raises(LLMError):
+            batch[1][2].result()
+        assert batch[2][2].cancelled()
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_failure_fails_the_batch(self):
+        """Test that an error for the whole batch reaches every request."""
+        class BrokenOrchestrator:
+            async def process_user_messages_batch(self, requests):
+                raise RuntimeError("down")
+
+        loop = asyncio.get_running_loop()
+        batch = [("s1", m, loop.create_future()) for m in ("a", "b")]
+
+        await routes._dispatch_chat_batch(BrokenOrchestrator(), batch)
+
+        for _, _, future in batch:
+            with pytest.raises(RuntimeError):
+                future.result()
+
+
+def chunk(content: str, **kwargs) -> LLMResponse:
+    """Build a streamed text chunk."""
+    return LLMResponse(content=content, model="test-model", **kwargs)
+
+
+async def scripted_stream(*steps) -> AsyncGenerator[LLMResponse, None]:
+    """Yield chunks, sleeping for float steps and raising exception steps."""
+    for step in steps:
+        if isinstance(step, float):
+            await asyncio.sleep(step)
+        elif isinstance(step, Exception):
+            raise step
+        else:
+            yield step
+
+
+async def collect_frames(stream) -> List[Dict[str, Any]]:
+    """Copy each coalesced frame before advancing, as callers must."""
+    frames = []
+    async with aclosing(routes._coalesced_frames(stream)) as coalesced:
+        async for frame in coalesced:
+            frames.append(dict(frame))
+    return frames
+
+
+class TestCoalescedFrames:
+    """Test coalescing of streamed chunks into WebSocket frames."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_merged_until_flush_deadline(self, monkeypatch):
+        """Test that chunks after WS_FLUSH_MS go out in a new frame."""
+        monkeypatch.setattr(routes, "WS_FLUSH_MS", 10)
+
+        frames = await collect_frames(scripted_stream(
+            chunk("Hel"), chunk("lo"), 0.05, chunk(" there", finish_reason="stop")
+        ))
+
+        assert [frame["content"] for frame in frames] == ["Hello", " there"]
+        assert frames[0]["finish_reason"] is None
+        assert frames[1]["finish_reason"] == "stop"
+
+    @pytest.mark.asyncio
+    async def test_frames_hold_at_most_max_coalesce_chunks(self, monkeypatch):
+        """Test that a burst is split at WS_MAX_COALESCE chunks per frame."""
+        monkeypatch.setattr(routes, "WS_FLUSH_MS", 1000)
+        monkeypatch.setattr(routes, "WS_MAX_COALESCE", 3)
+
+        frames = await collect_frames(scripted_stream(
+            *(chunk(letter) for letter in "abcdefg")
+        ))
+
+        assert [frame["content"] for frame in frames] == ["abc", "def", "g"]
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_flush_pending_text(self, monkeypatch):
+        """Test that a tool-call chunk is sent alone, after earlier text."""
+        monkeypatch.setattr(routes, "WS_FLUSH_MS", 1000)
+        tool_calls = [{"id": "call_1", "function": {"name": "calculator"}}]
+
+        frames = await collect_frames(scripted_stream(
+            chunk("Let me "), chunk("check."),
+            chunk("", tool_calls=tool_calls, finish_reason="tool_calls"),
+            chunk("Done", finish_reason="stop")
+        ))
+
+        assert [frame["content"] for frame in frames] == [
+            "Let me check.", "", "Done"
+        ]
+        assert [frame["tools_used"] for frame in frames] == [
+            None, tool_calls, None
+        ]
+        # Metadata of the tool-call frame does not leak into the next one
+        assert frames[2]["finish_reason"] == "stop"
+
+    @pytest.mark.asyncio
+    async def test_error_is_raised_after_flushed_text(self, monkeypatch):
+        """Test that text before a stream error is delivered first."""
+        monkeypatch.setattr(routes, "WS_FLUSH_MS", 10)
+        frames = []
+
+        with pytest.raises(LLMError):
+            async with aclosing(routes._coalesced_frames(scripted_stream(
+                chunk("partial "), 0.05, chunk("reply"), LLMError("dropped")
+            ))) as coalesced:
+                async for frame in coalesced:
+                    frames.append(frame["content"])
+
+        assert frames == ["partial ", "reply"]
+
+    @pytest.mark.asyncio
+    async def test_frame_dict_is_reused(self, monkeypatch):
+        """Test that frames serialized on arrival keep their own content."""
+        monkeypatch.setattr(routes, "WS_FLUSH_MS", 10)
+        frames = []
+        encoded = []
+
+        async with aclosing(routes._coalesced_frames(scripted_stream(
+            chunk("one"), 0.05, chunk("two")
+        ))) as coalesced:
+            async for frame in coalesced:
+                frames.append(frame)
+                encoded.append(orjson.loads(orjson.dumps(frame))["content"])
+
+        assert frames[0] is frames[1]
+        assert encoded == ["one", "two"]
+
+    @pytest.mark.asyncio
+    async def test_closing_early_stops_the_stream(self):
+        """Test that closing the frames also stops reading the stream."""
+        closed = asyncio.Event()
+
+        async def endless() -> AsyncGenerator[LLMResponse, None]:
+            try:
+                while True:
+                    yield chunk("x")
+                    await asyncio.sleep(0)
+            finally:
+                closed.set()
+
+        async with aclosing(routes._coalesced_frames(endless())) as coalesced:
+            async for _ in coalesced:
+                break
+
+        await asyncio.wait_for(closed.wait(), 1)
+
+
+def receive_reply(websocket, decode=orjson.loads) -> List[Dict[str, Any]]:
+    """Read frames up to and including the complete or error frame."""
+    frames = []
+    while True:
+        frame = decode(websocket.receive_bytes())
+        frames.append(frame)
+        if frame["type"] in ("complete", "error"):
+            return frames
+
+
+class TestChatWebSocket:
+    """Test the streaming chat WebSocket."""
+
+    def test_streams_reply_and_completes(self, client):
+        """Test that a reply streams as chunks followed by a complete frame."""
+        with client.websocket_connect("/ws/chat/ws1") as websocket:
+            websocket.send_json({"message": "hi there"})
+            frames = receive_reply(websocket)
+
+        assert frames[-1]["type"] == "complete"
+        chunks = frames[:-1]
+        assert all(frame["type"] == "chunk" for frame in chunks)
+        assert "".join(f["content"] for f in chunks) == "Echo: hi there"
+        assert chunks[-1]["finish_reason"] == "stop"
+
+    def test_connection_is_reused_across_turns(self, client):
+        """Test that one connection serves several messages."""
+        with client.websocket_connect("/ws/chat/ws2") as websocket:
+            for message in ("first", "second"):
+                websocket.send_json({"message": message})
+                frames = receive_reply(websocket)
+                assert "".join(
+                    f["content"] for f in frames[:-1]
+                ) == f"Echo: {message}"
+
+    def test_empty_message_is_rejected(self, client):
+        """Test that a frame without a message gets an error frame."""
+        with client.websocket_connect("/ws/chat/ws3") as websocket:
+            websocket.send_json({"message": ""})
+            assert receive_reply(websocket) == [
+                {"type": "error", "error": "No message provided"}
+            ]
+
+    def test_stream_failure_sends_error_frame(self, client):
+        """Test that a provider failure ends the reply with an error frame."""
+        with client.websocket_connect("/ws/chat/ws4") as websocket:
+            websocket.send_json({"message": "fail please"})
+            frames = receive_reply(websocket)
+
+            # The connection survives for the next turn
+            websocket.send_json({"message": "again"})
+            retry = receive_reply(websocket)
+
+        assert frames[-1]["type"] == "error"
+        assert retry[-1]["type"] == "complete"
+
+    def test_msgpack_subprotocol(self, client):
+        """Test that offering the msgpack subprotocol switches encodings."""
+        with client.websocket_connect(
+            "/ws/chat/ws5", subprotocols=[routes.WS_MSGPACK_SUBPROTOCOL]
+        ) as websocket:
+            assert websocket.accepted_subprotocol == routes.WS_MSGPACK_SUBPROTOCOL
+            websocket.send_bytes(msgspec.msgpack.encode({"message": "hi"}))
+            frames = receive_reply(websocket, msgspec.msgpack.decode)
+
+        assert frames[-1]["type"] == "complete"
+        assert "".join(f["content"] for f in frames[:-1]) == "Echo: hi"
@@ -0,0 +1,21 @@
+"""Unit tests for configuration loading."""
+
+import pytest
+
+from terminal_gpt.config import load_config
+
+
+class TestLoadConfig:
+    """Test reading configuration from the environment."""
+
+    def test_max_parallel_tools_from_env(self, monkeypatch):
+        """Test that MAX_PARALLEL_TOOLS overrides the default."""
+        monkeypatch.setenv("MAX_PARALLEL_TOOLS", "8")
+        assert load_config()["max_parallel_tools"] == 8
+
+    @pytest.mark.parametrize("value", ["0", "-2"])
+    def test_max_parallel_tools_must_be_positive(self, monkeypatch, value):
+        """Test that a limit that would stall every tool call is rejected."""
+        monkeypatch.setenv("MAX_PARALLEL_TOOLS", value)
+        with pytest.raises(ValueError, match="MAX_PARALLEL_TOOLS"):
+            load_config()
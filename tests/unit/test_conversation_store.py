@@ -0,0 +1,215 @@
+"""Unit tests for the conversation store."""
+
+import asyncio
+import gc
+
+import orjson
+import pytest
+
+from terminal_gpt.application.conversation_store import (
+    ConversationJournal, ConversationStore, ShelveSpill
+)
+from terminal_gpt.domain.models import ConversationState, Message
+
+
+def make_conversation(session_id: str, *contents: str) -> ConversationState:
+    """Build a conversation with one user message per content string."""
+    conversation = ConversationState(session_id=session_id)
+    for content in contents:
+        conversation = conversation.add_message(Message(role="user", content=content))
+    return conversation
+
+
+class TestConversationStore:
+    """Test LRU eviction and running totals."""
+
+    def test_behaves_like_a_dict(self):
+        """Test basic mapping operations."""
+        store = ConversationStore()
+        assert store == {}
+
+        conversation = make_conversation("s1", "Hi")
+        store["s1"] = conversation
+
+        assert "s1" in store
+        assert store["s1"] is conversation
+        assert store.get("missing") is None
+        assert list(store.items()) == [("s1", conversation)]
+
+        del store["s1"]
+        assert len(store) == 0
+
+    def test_running_totals(self):
+        """Test that totals follow inserts, replacements and deletes."""
+        store = ConversationStore()
+        store["s1"] = make_conversation("s1", "Hi")
+        store["s2"] = make_conversation("s2", "Hello", "There")
+        assert (store.total_messages, store.total_chars) == (3, 12)
+
+        store["s1"] = make_conversation("s1", "Hi", "Again")
+        assert (store.total_messages, store.total_chars) == (4, 17)
+
+        del store["s2"]
+        assert (store.total_messages, store.total_chars) == (2, 7)
+
+    def test_least_recently_used_is_evicted(self):
+        """Test eviction order and the eviction callback."""
+        evicted = []
+        store = ConversationStore(
+            max_sessions=2,
+            on_evict=lambda session_id, conv: evicted.append(session_id)
+        )
+        store["s1"] = make_conversation("s1", "One")
+        store["s2"] = make_conversation("s2", "Two")
+
+        # Reading s1 makes s2 the least recently used
+        store["s1"]
+        store["s3"] = make_conversation("s3", "Three")
+
+        assert evicted == ["s2"]
+        assert set(store) == {"s1", "s3"}
+        assert store.total_messages == 2
+
+    def test_invalid_max_sessions(self):
+        """Test that the store must allow at least one session."""
+        with pytest.raises(ValueError):
+            ConversationStore(max_sessions=0)
+
+    @pytest.mark.asyncio
+    async def test_session_lock(self):
+        """Test that each session gets one lock, released once unused."""
+        store = ConversationStore()
+        lock = store.lock("s1")
+        assert store.lock("s1") is lock
+        assert store.lock("s2") is not lock
+
+        store["s1"] = make_conversation("s1", "Hi")
+        del store["s1"]
+        assert store.lock("s1") is lock
+
+        del lock
+        gc.collect()
+        assert "s1" not in store._locks
+
+    @pytest.mark.asyncio
+    async def test_session_lock_outlives_eviction_while_awaited(self):
+        """Test that an evicted session's lock is kept for its waiters."""
+        store = ConversationStore(max_sessions=1)
+        order = []
+
+        async def turn(name: str, session_id: str = "s1") -> None:
+            async with store.lock(session_id):
+                order.append(f"{name} start")
+                await asyncio.sleep(0)
+                order.append(f"{name} end")
+
+        store["s1"] = make_conversation("s1", "Hi")
+        holder = store.lock("s1")
+        await holder.acquire()
+        waiter = asyncio.create_task(turn("waiter"))
+        await asyncio.sleep(0)
+
+        # Release s1 and evict it before the queued waiter has woken up,
+        # then start a new turn
+        holder.release()
+        del holder
+        store["s2"] = make_conversation("s2", "Hello")
+        late = asyncio.create_task(turn("late"))
+        await asyncio.gather(waiter, late)
+
+        assert order == ["waiter start", "waiter end", "late start", "late end"]
+
+
+class TestShelveSpill:
+    """Test spilling evicted conversations to disk."""
+
+    def test_evicted_sessions_are_restored(self, tmp_path):
+        """Test that an evicted session comes back from disk on lookup."""
+        spill = ShelveSpill(str(tmp_path / "spill"))
+        store = ConversationStore(max_sessions=1, spill=spill)
+        store["s1"] = make_conversation("s1", "One", "Two")
+        store["s2"] = make_conversation("s2", "Three")
+
+        assert set(store) == {"s2"}
+        assert "s1" in store
+
+        restored = store["s1"]
+        assert [msg.content for msg in restored.messages] == ["One", "Two"]
+        assert restored.char_total == 6
+        assert set(store) == {"s1"}
+        assert "s2" in spill and "s1" not in spill
+
+        del store["s2"]
+        assert "s2" not in store
+        spill.close()
+
+
+class TestConversationJournal:
+    """Test restoring conversations from the change log."""
+
+    def test_sessions_survive_a_restart(self, tmp_path):
+        """Test appends, trims, rewrites and deletes replay into a new store."""
+        path = tmp_path / "journal.jsonl"
+        journal = ConversationJournal(str(path))
+        store = ConversationStore(journal=journal)
+
+        conversation = make_conversation("s1", "One")
+        store["s1"] = conversation
+        conversation = conversation.add_message(Message(role="user", content="Two"))
+        store["s1"] = conversation
+        conversation = conversation.add_message(Message(role="user", content="Three"))
+        store["s1"] = conversation.trim_to_window(2)
+        store["s2"] = make_conversation("s2", "Gone")
+        del store["s2"]
+        store["s3"] = make_conversation("s3", "Old")
+        store["s3"] = make_conversation("s3", "New")
+        journal.close()
+
+        ops = [orjson.loads(line)["op"] for line in path.read_bytes().splitlines()]
+        assert ops == [
+            "snapshot", "append", "append", "snapshot", "delete", "snapshot",
+            "snapshot"
+        ]
+
+        journal = ConversationJournal(str(path))
+        restored = ConversationStore(journal=journal)
+        assert set(restored) == {"s1", "s3"}
+        assert [msg.content for msg in restored["s1"].messages] == ["Two", "Three"]
+        assert [msg.content for msg in restored["s3"].messages] == ["New"]
+        assert (restored.total_messages, restored.total_chars) == (3, 11)
+
+        # Loading compacts the log to one snapshot per session
+        assert len(path.read_bytes().splitlines()) == 2
+        journal.close()
+
+    def test_restore_is_capped_at_max_sessions(self, tmp_path):
+        """Test that sessions past the limit are evicted without callbacks."""
+        path = tmp_path / "journal.jsonl"
+        journal = ConversationJournal(str(path))
+        store = ConversationStore(journal=journal)
+        store["s1"] = make_conversation("s1", "One")
+        store["s2"] = make_conversation("s2", "Two")
+        store["s3"] = make_conversation("s3", "Three")
+        # Changing s1 makes s2 the least recently changed session
+        store["s1"] = store["s1"].add_message(Message(role="user", content="Again"))
+        journal.close()
+
+        evicted = []
+        spill = ShelveSpill(str(tmp_path / "spill"))
+        journal = ConversationJournal(str(path))
+        restored = ConversationStore(
+            max_sessions=2,
+            on_evict=lambda session_id, conv: evicted.append(session_id),
+            spill=spill,
+            journal=journal
+        )
+        assert set(restored) == {"s3", "s1"}
+        assert evicted == []
+        assert "s2" in spill
+        journal.close()
+
+        # The evicted session stays out of the journal on the next restart
+        journal = ConversationJournal(str(path))
+        assert set(journal.load()) == {"s3", "s1"}
+        journal.close()
+        spill.close()
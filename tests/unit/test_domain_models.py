@@ -59,6 +59,26 @@ class TestMessage:
         with pytest.raises(ValidationError):
             Message(role="tool", content="Result", name="   ")
 
+    def test_as_llm_dict(self):
+        """Test the cached LLM API form of a message."""
+        msg = Message(role="tool", content="4", name="calculator", tool_call_id="c1")
+        assert msg.as_llm_dict == {
+            "role": "tool", "content": "4", "tool_call_id": "c1", "name": "calculator"
+        }
+        assert msg.as_llm_dict is msg.as_llm_dict
+
+        tool_calls = [{"id": "c1", "type": "function"}]
+        assistant = Message(role="assistant", tool_calls=tool_calls)
+        assert assistant.as_llm_dict == {
+            "role": "assistant", "content": None, "tool_calls": tool_calls
+        }
+
+        # Copies with changed fields don't reuse the cached dict
+        user = Message(role="user", content="Hi")
+        assert user.as_llm_dict["content"] == "Hi"
+        assert user.model_copy(update={"content": "Bye"}).as_llm_dict["content"] == "Bye"
+        assert user == Message(role="user", content="Hi", timestamp=user.timestamp)
+
 
 class TestConversationState:
     """Test ConversationState model and conversation management."""
@@ -126,6 +146,58 @@ class TestConversationState:
         with pytest.raises(ValidationError):
             ConversationState(session_id="test", messages=messages)
 
+    def test_char_total_tracking(self):
+        """Test that the content length counter is kept in sync."""
+        conv = ConversationState(
+            session_id="test",
+            messages=[Message(role="system", content="System prompt")]
+        )
+        assert conv.get_char_total() == len("System prompt")
+
+        conv2 = conv.add_message(Message(role="user", content="Hello"))
+
+        # Original counter is unaffected by the immutable update
+        assert conv.char_total == len("System prompt")
+        assert conv2.char_total == len("System prompt") + len("Hello")
+        assert conv2.stats() == (2, len("System prompt") + len("Hello"))
+
+    def test_append_message_in_place(self):
+        """Test that append_message mutates the state and its counters."""
+        conv = ConversationState(session_id="test")
+        working = conv.add_message(Message(role="user", content="Hello"))
+
+        working.append_message(Message(role="assistant", content="Hi there"))
+
+        assert len(conv.messages) == 0
+        assert [msg.content for msg in working.messages] == ["Hello", "Hi there"]
+        assert working.stats() == (2, len("Hello") + len("Hi there"))
+
+        working.append_message(Message(role="system", content="Note"))
+        assert working.system_count == 1
+        assert ConversationState(**working.model_dump()).system_count == 1
+
+    def test_trim_to_window(self):
+        """Test trimming keeps system messages and records evicted turns."""
+        conv = ConversationState(session_id="test")
+        conv = conv.add_message(Message(role="system", content="System prompt"))
+        for i in range(4):
+            conv = conv.add_message(Message(role="user", content=f"Question {i}"))
+            conv = conv.add_message(Message(role="assistant", content=f"Answer {i}"))
+
+        trimmed = conv.trim_to_window(3)
+
+        assert [msg.content for msg in trimmed.messages] == [
+            "System prompt", "Answer 2", "Question 3", "Answer 3"
+        ]
+        assert trimmed.char_total == sum(len(m.content) for m in trimmed.messages)
+        assert trimmed.system_count == 1
+        assert "Question 0" in trimmed.evicted_summary
+        assert "Question 2" in trimmed.evicted_summary
+        assert "Answer" not in trimmed.evicted_summary
+
+        # Nothing to trim returns the same state
+        assert trimmed.trim_to_window(3) is trimmed
+
     def test_conversation_methods(self):
         """Test conversation utility methods."""
         conv = ConversationState(session_id="test")
@@ -0,0 +1,355 @@
+"""Unit tests for the enhanced terminal UI."""
+
+import asyncio
+
+import pytest
+from rich.console import Console
+
+from terminal_gpt.cli.enhanced_ui import EnhancedUI, PROFESSIONAL_THEME, StatusLevel
+
+
+@pytest.fixture
+def ui():
+    """Enhanced UI printing to a recording console."""
+    ui = EnhancedUI()
+    ui.console = Console(theme=PROFESSIONAL_THEME, record=True, width=100)
+    return ui
+
+
+class TestEnhancedUI:
+    """Test rendering helpers."""
+
+    def test_jengo_ascii_art(self, ui):
+        """Test that the art prints as seven lines with no trailing blank."""
+        ui.print_jengo_ascii_art()
+        ui.print_jengo_ascii_art()
+
+        lines = ui.console.export_text().splitlines()
+        assert len(lines) == 14
+        assert lines[0] == lines[7]
+        assert lines[5].startswith("╚█████╔╝")
+
+    def test_message_bodies_are_reused(self, ui):
+        """Test that reprinting a message reuses its rendered body."""
+        metadata = {"tokens_used": 12, "status": "ok"}
+        ui.print_message("assistant", "**Hello**", "s1", metadata)
+        body = ui._message_body("assistant", "**Hello**", metadata)
+        ui.print_message("assistant", "**Hello**", "s2", metadata)
+
+        assert ui._message_body("assistant", "**Hello**", metadata) is body
+        assert len(ui._message_cache) == 1
+
+        output = ui.console.export_text()
+        assert output.count("Hello") == 2
+        assert "**" not in output
+        assert output.count("Tokens: 12") == 2
+        assert "s1" in output and "s2" in output
+
+    def test_message_headers(self, ui, monkeypatch):
+        """Test role headers and the given or current timestamp."""
+        from terminal_gpt.cli import enhanced_ui
+
+        monkeypatch.setattr(enhanced_ui, "_now_hms", lambda: "12:00:00")
+        ui.print_message("user", "Hi")
+        ui.print_message("assistant", "Hello", timestamp="09:30:15")
+        ui.print_message("narrator", "Meanwhile")
+
+        output = ui.console.export_text()
+        assert "👤 User • 12:00:00" in output
+        assert "🤖 Assistant • 09:30:15" in output
+        assert "💬 Narrator • 12:00:00" in output
+
+    @pytest.mark.parametrize("content, markdown", [
+        ("Plain prose, nothing else.", False),
+        ("Use **bold** here", True),
+        ("Steps:\n1. First", True),
+        ("Title\n=====", True),
+        ("    indented code", True),
+        ("Fish & chips", True),
+        ("First line of the reply\nsecond line continues", True),
+        ("  leading spaces", True),
+    ])
+    def test_markdown_only_when_needed(self, ui, content, markdown):
+        """Test that plain assistant text skips the Markdown parser."""
+        from rich.markdown import Markdown
+
+        body = ui._message_body("assistant", content, None)
+        assert isinstance(body, Markdown) is markdown
+
+    def test_prerendered_content_is_used_as_is(self, ui):
+        """Test that renderables are printed directly and not cached."""
+        from rich.markdown import Markdown
+
+        body = Markdown("# Title")
+        assert ui._message_body("assistant", body, None) is body
+
+        ui.print_message("assistant", body)
+        assert "Title" in ui.console.export_text()
+        assert len(ui._message_cache) == 0
+
+    def test_format_metadata(self, ui):
+        """Test which metadata values are shown and how."""
+        assert ui._format_metadata({
+            "tokens_used": 12,
+            "processing_time_ms": 0,
+            "status": "degraded",
+            "unknown": "x",
+        }) == "📝 Tokens: 12 | 🔧 Status: degraded"
+        assert ui._format_metadata({"status": "ok", "tokens_used": None}) == ""
+
+    def test_message_cache_is_bounded(self, ui):
+        """Test that the least recently used bodies are dropped."""
+        ui.MESSAGE_CACHE_SIZE = 2
+        for content in ("one", "two", "three"):
+            ui.print_message("user", content)
+
+        assert [key[1] for key in ui._message_cache] == ["two", "three"]
+
+    @pytest.mark.parametrize("data, expected", [
+        ('{"city": "Zürich", "n": [1]}', '"city": "Zürich"'),
+        ("[1, 2", "[1, 2"),
+        ("plain text", "plain text"),
+    ])
+    def test_plugin_text_formats_json(self, ui, data, expected):
+        """Test that JSON is pretty-printed and other text kept as is."""
+        ui.print_plugin_output("read_file", "text", data)
+
+        assert expected in ui.console.export_text()
+
+    def test_print_status(self, ui):
+        """Test status lines for built-in and custom levels."""
+        ui.print_status(StatusLevel.ERROR, "Failed", "Details here", persistent=True)
+        ui.print_status(("*", "ui.muted", "Custom"), "Noted", persistent=True)
+        ui.print_status(StatusLevel.DEBUG, "Traced", persistent=True)
+
+        lines = ui.console.export_text().splitlines()
+        assert lines[:3] == ["❌ Failed", "  Details here", "* Noted"]
+        assert lines[3].startswith("🐛 Traced [")
+
+    def test_plugin_table(self, ui):
+        """Test that rows follow the first row's columns."""
+        ui.print_plugin_output("sports", "table", [
+            {"team": "Arsenal", "score": 2},
+            {"score": 1, "team": "Liverpool"},
+            {"team": "Chelsea"},
+        ])
+
+        output = ui.console.export_text()
+        lines = output.splitlines()
+        assert any("Arsenal" in line and "2" in line for line in lines)
+        assert any("Liverpool" in line and "1" in line for line in lines)
+        assert lines.index(
+            next(line for line in lines if "Liverpool" in line)
+        ) < lines.index(next(line for line in lines if "Chelsea" in line))
+        assert "┃" in output
+
+    def test_long_plugin_table_is_unboxed(self, ui):
+        """Test that long tables are printed without borders."""
+        ui.print_plugin_output("sports", "table", [{"n": i} for i in range(201)])
+
+        output = ui.console.export_text()
+        assert "200" in output
+        assert "│" not in output and "┃" not in output
+
+    def test_plugin_list(self, ui):
+        """Test numbered list output."""
+        ui.print_plugin_output("search_web", "list", ["alpha", "beta"])
+
+        lines = [
+            line[2:].removesuffix("│").rstrip()
+            for line in ui.console.export_text().splitlines()[1:-1]
+        ]
+        assert lines[:3] == ["📋 Search_Web:", "  1. alpha", "  2. beta"]
+
+    def test_plugin_tree(self, ui):
+        """Test tree layout for nested dicts and lists."""
+        ui.print_plugin_output("search_web", "tree", {
+            "a": {"b": 1, "c": ["x", {"d": 2}]},
+            "e": "f",
+        })
+
+        lines = [
+            line[2:].removesuffix("│").rstrip()
+            for line in ui.console.export_text().splitlines()[1:-1]
+        ]
+        assert lines[:11] == [
+            "🌳 Search_Web:",
+            "├── a",
+            "│   ├── b",
+            "│   │       1",
+            "│   └── c",
+            "│       ├── [item 1]",
+            "│       │       x",
+            "│       └── [item 2]",
+            "│           └── d",
+            "│                   2",
+            "└── e",
+        ]
+
+    def test_terminal_validation_is_cached(self, ui):
+        """Test that validation is redone only when the terminal changes."""
+        ui.console.size = (100, 40)
+        validation = ui.validate_terminal_size()
+        assert validation["width"] == 100
+        assert ui.validate_terminal_size() is validation
+
+        ui.console.size = (60, 40)
+        narrow = ui.validate_terminal_size()
+        assert narrow is not validation
+        assert not narrow["is_compatible"]
+
+    def test_accessibility_report_is_one_print(self, ui, monkeypatch):
+        """Test that a failing report is written with a single print."""
+        ui.console.size = (60, 20)
+        prints = []
+        print_ = ui.console.print
+        monkeypatch.setattr(
+            ui.console, "print",
+            lambda *args, **kwargs: prints.append(1) or print_(*args, **kwargs)
+        )
+        ui.print_accessibility_report()
+
+        assert len(prints) == 1
+        lines = ui.console.export_text().splitlines()
+        assert lines[0].endswith("Terminal compatibility issues detected")
+        assert lines[1] == "  Size: 60x20"
+        assert lines[2].startswith("⚠️ Terminal width (60)")
+        assert any(line.startswith("ℹ️ ") for line in lines)
+
+    def test_status_table(self, ui):
+        """Test metric names and status indicators."""
+        ui.console.print(ui.create_status_table({
+            "active_sessions": 5,
+            "total_messages": 250,
+            "memory_usage_kb": 2048.5,
+            "cache_enabled": True,
+        }))
+
+        rows = {
+            cells[0]: cells[2]
+            for line in ui.console.export_text().splitlines()
+            if len(cells := [cell.strip() for cell in line.split("│")[1:-1]]) == 3
+        }
+        assert rows["Active Sessions"] == "✅ Low"
+        assert rows["Total Messages"] == "ℹ️ Medium"
+        assert rows["Memory Usage Kb"] == "⚠️ High"
+        assert rows["Cache Enabled"] == "✅ OK"
+
+    def test_batch_writes_once(self, ui, monkeypatch):
+        """Test that output printed in a batch reaches the file in one write."""
+        import io
+
+        out = io.StringIO()
+        ui.console = Console(theme=PROFESSIONAL_THEME, file=out, width=100)
+        writes = []
+        write = out.write
+        monkeypatch.setattr(
+            out, "write", lambda text: writes.append(text) or write(text)
+        )
+
+        with ui.batch():
+            ui.print_info("One", persistent=True)
+            ui.print_info("Two", persistent=True)
+        assert len(writes) == 1
+        assert out.getvalue().splitlines() == ["ℹ️ One", "ℹ️ Two"]
+
+        ui.print_welcome()
+        assert len(writes) == 2
+
+
+class TestClock:
+    """Test the cached wall clock."""
+
+    def test_formatted_once_per_second(self, monkeypatch):
+        """Test that the time is only reformatted when the second changes."""
+        from terminal_gpt.cli import enhanced_ui
+
+        now = [1000.2]
+        formatted = []
+        monkeypatch.setattr(enhanced_ui.time, "time", lambda: now[0])
+        monkeypatch.setattr(
+            enhanced_ui.time, "strftime",
+            lambda fmt, t: formatted.append(t) or f"t{len(formatted)}"
+        )
+
+        assert enhanced_ui._now_hms() == "t1"
+        now[0] = 1000.9
+        assert enhanced_ui._now_hms() == "t1"
+        now[0] = 1001.0
+        assert enhanced_ui._now_hms() == "t2"
+        assert len(formatted) == 2
+
+
+class TestThinkingIndicator:
+    """Test the thinking spinner."""
+
+    def test_spinner_modes(self, ui):
+        """Test that unknown modes fall back to the thinking spinner."""
+        spinner = ui.thinking_spinner.get_spinner("searching")
+        assert str(spinner.text) == "Searching for information"
+
+        spinner = ui.thinking_spinner.get_spinner("unknown")
+        assert str(spinner.text) == "Analyzing your request"
+
+    @pytest.mark.asyncio
+    async def test_redraws_once_per_frame(self, ui, monkeypatch):
+        """Test that the display is refreshed only when the frame changes."""
+        from terminal_gpt.cli import enhanced_ui
+
+        # Drive the animation with a fake clock; each sleep just yields
+        now = [100.0]
+        monkeypatch.setattr(ui.console, "get_time", lambda: now[0])
+        yield_once = asyncio.sleep
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            await yield_once(0)
+
+        monkeypatch.setattr(enhanced_ui.asyncio, "sleep", fake_sleep)
+
+        async def refreshes_at(elapsed):
+            now[0] = 100.0 + elapsed
+            for _ in range(3):
+                await yield_once(0)
+            return len(refreshes)
+
+        async with ui.thinking_indicator("thinking") as thinking:
+            refreshes = []
+            monkeypatch.setattr(
+                thinking.live, "refresh", lambda: refreshes.append(1)
+            )
+            assert thinking.live.is_started
+
+            # The dots spinner advances every 80ms
+            assert await refreshes_at(0.02) == 0
+            assert await refreshes_at(0.09) == 1
+            assert sleeps[-1] == pytest.approx(0.07)
+            assert await refreshes_at(0.15) == 1
+            # Skipped frames still cost a single redraw
+            assert await refreshes_at(0.33) == 2
+
+        await yield_once(0)
+        assert thinking._animation.done()
+
+    @pytest.mark.asyncio
+    async def test_auto_stop(self, ui):
+        """Test the duration limit and an early exit before it."""
+        async with ui.thinking_indicator("thinking", duration=0.05) as thinking:
+            await asyncio.sleep(0.1)
+            assert not thinking.live.is_started
+        assert not thinking.task.cancelled()
+
+        async with ui.thinking_indicator("thinking", duration=10) as thinking:
+            assert thinking.live.is_started
+        assert thinking.task.done() and not thinking.task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_no_spinner_on_dumb_terminals(self, ui):
+        """Test that dumb terminals don't start the live display."""
+        ui.console = Console(
+            theme=PROFESSIONAL_THEME, force_terminal=True, _environ={"TERM": "dumb"}
+        )
+        async with ui.thinking_indicator("thinking") as thinking:
+            assert not thinking.live.is_started
+        assert thinking._animation is None
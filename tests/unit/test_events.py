@@ -0,0 +1,342 @@
+"""Unit tests for the event bus."""
+
+import asyncio
+from datetime import datetime
+from typing import List, Type
+
+import pytest
+
+from terminal_gpt.application.events import (
+    EventBus, EventCategory, EventHandler, EventPriority, PluginExecuted,
+    UserMessageReceived
+)
+
+
+def make_user_event(
+    index: int, session_id: str = "test-session"
+) -> UserMessageReceived:
+    """Build a user message event for tests."""
+    return UserMessageReceived(
+        event_id=f"user-msg-{index}",
+        category=EventCategory.USER,
+        priority=EventPriority.NORMAL,
+        timestamp=datetime.utcnow(),
+        source="test",
+        data={},
+        session_id=session_id,
+        message_content=f"Message {index}"
+    )
+
+
+class RecordingHandler(EventHandler[UserMessageReceived]):
+    """Handler that records the batches it receives."""
+
+    def __init__(self):
+        self.batches: List[List[UserMessageReceived]] = []
+
+    async def handle(self, event: UserMessageReceived) -> None:
+        self.batches.append([event])
+
+    async def handle_batch(self, events) -> None:
+        self.batches.append(list(events))
+
+    @property
+    def event_type(self) -> Type[UserMessageReceived]:
+        return UserMessageReceived
+
+
+class TestEventBus:
+    """Test event bus dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_queued_events_are_batched(self):
+        """Test that events queued together reach handlers as one batch."""
+        bus = EventBus()
+        handler = RecordingHandler()
+        bus.register_handler(handler)
+        seen = []
+        bus.add_middleware(
+            lambda event: seen.append(event.event_id)
+            if isinstance(event, UserMessageReceived) else None
+        )
+
+        await bus.start()
+        events = [make_user_event(i) for i in range(5)]
+        for event in events:
+            await bus.publish(event)
+        await bus.join()
+        await bus.stop()
+
+        assert handler.batches == [events]
+        assert seen == [event.event_id for event in events]
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_do_not_stop_processing(self):
+        """Test that a failing handler does not break the processing loop."""
+
+        class FailingHandler(RecordingHandler):
+            async def handle_batch(self, events) -> None:
+                raise RuntimeError("boom")
+
+        bus = EventBus()
+        failing = FailingHandler()
+        recording = RecordingHandler()
+        bus.register_handler(failing)
+        bus.register_handler(recording)
+
+        await bus.start()
+        await bus.publish(make_user_event(0))
+        await bus.join()
+        await bus.publish(make_user_event(1))
+        await bus.join()
+        await bus.stop()
+
+        assert [batch[0].event_id for batch in recording.batches] == [
+            "user-msg-0", "user-msg-1"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_default_batch_handling_isolates_failures(self):
+        """Test that one failing event does not drop the rest of its batch."""
+
+        class PerEventHandler(EventHandler[UserMessageReceived]):
+            def __init__(self):
+                self.handled: List[str] = []
+
+            async def handle(self, event: UserMessageReceived) -> None:
+                if event.event_id == "user-msg-0":
+                    raise RuntimeError("boom")
+                self.handled.append(event.event_id)
+
+            @property
+            def event_type(self) -> Type[UserMessageReceived]:
+                return UserMessageReceived
+
+        handler = PerEventHandler()
+        await handler.handle_batch([make_user_event(i) for i in range(3)])
+
+        assert handler.handled == ["user-msg-1", "user-msg-2"]
+
+    @pytest.mark.asyncio
+    async def test_unhandled_event_types_are_ignored(self):
+        """Test publishing an event with no handlers."""
+        bus = EventBus()
+        handler = RecordingHandler()
+        bus.register_handler(handler)
+
+        await bus.publish(PluginExecuted(
+            event_id="plugin-test",
+            category=EventCategory.PLUGIN,
+            priority=EventPriority.NORMAL,
+            timestamp=datetime.utcnow(),
+            source="test",
+            data={},
+            plugin_name="test",
+            execution_time_ms=1.0,
+            success=True
+        ))
+
+        assert handler.batches == []
+
+    @pytest.mark.asyncio
+    async def test_unregister_handler(self):
+        """Test that unregistered handlers no longer receive events."""
+        bus = EventBus()
+        first = RecordingHandler()
+        second = RecordingHandler()
+        bus.register_handler(first)
+        bus.register_handler(second)
+
+        bus.unregister_handler(first)
+        await bus.publish(make_user_event(0))
+        bus.unregister_handler(second)
+        await bus.publish(make_user_event(1))
+
+        assert first.batches == []
+        assert [batch[0].event_id for batch in second.batches] == ["user-msg-0"]
+        assert UserMessageReceived not in bus._dispatch
+
+    @pytest.mark.asyncio
+    async def test_async_middleware(self):
+        """Test that coroutine middleware is awaited for each event."""
+        bus = EventBus()
+        seen = []
+
+        async def middleware(event):
+            seen.append(event.event_id)
+
+        bus.add_middleware(middleware)
+        assert bus._middleware == []
+        assert bus.has_handlers(UserMessageReceived)
+
+        await bus.publish(make_user_event(0))
+        await bus.start()
+        await bus.publish(make_user_event(1))
+        await bus.join()
+        await bus.stop()
+
+        assert [eid for eid in seen if eid.startswith("user-msg")] == [
+            "user-msg-0", "user-msg-1"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_single_handler_errors_are_contained(self):
+        """Test that a lone failing handler doesn't propagate its error."""
+
+        class FailingHandler(RecordingHandler):
+            async def handle(self, event) -> None:
+                raise RuntimeError("boom")
+
+        bus = EventBus()
+        bus.register_handler(FailingHandler())
+
+        await bus.publish(make_user_event(0))
+
+
+class TestPublishers:
+    """Test convenience publishing functions."""
+
+    @pytest.mark.asyncio
+    async def test_event_ids_are_unique(self, monkeypatch):
+        """Test that events published back to back get distinct IDs."""
+        from terminal_gpt.application import events
+
+        bus = EventBus()
+        handler = RecordingHandler()
+        bus.register_handler(handler)
+        monkeypatch.setattr(events, "event_bus", bus)
+
+        await events.publish_user_message("test-session", "Hello")
+        await events.publish_user_message("test-session", "Hello")
+
+        first, second = (batch[0] for batch in handler.batches)
+        assert first.event_id.startswith("user-msg-test-session-")
+        assert first.event_id != second.event_id
+
+    @pytest.mark.asyncio
+    async def test_publishers_skip_unobserved_events(self, monkeypatch):
+        """Test that publishers do nothing without handlers or middleware."""
+        from terminal_gpt.application import events
+
+        bus = EventBus()
+        monkeypatch.setattr(events, "event_bus", bus)
+        monkeypatch.setattr(bus, "publish", None)  # Would fail if called
+
+        assert not bus.has_handlers(events.PluginExecuted)
+        await events.publish_plugin_execution("test", 1.0, True)
+
+        seen = []
+        bus.add_middleware(seen.append)
+        assert bus.has_handlers(events.PluginExecuted)
+
+
+class TestEvents:
+    """Test event dataclasses."""
+
+    def test_events_are_slotted(self):
+        """Test that events do not carry a per-instance __dict__."""
+        event = make_user_event(0)
+
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.session_id = "other"
+
+
+class TestEventBusQueue:
+    """Test event bus queueing."""
+
+    @pytest.mark.asyncio
+    async def test_unhandled_events_are_not_queued(self):
+        """Test that events without handlers or middleware skip the queue."""
+        bus = EventBus(max_queued=1)
+        bus._running = True  # Queue without a consumer task
+
+        queue = bus._queue_for(make_user_event(0))
+        await bus.publish(make_user_event(0))
+        assert queue.empty()
+
+        bus.register_handler(RecordingHandler())
+        await bus.publish(make_user_event(1))
+        assert queue.qsize() == 1
+
+        # The bounded queue applies backpressure once full
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(bus.publish(make_user_event(2)), 0.05)
+
+    @pytest.mark.asyncio
+    async def test_workers_process_concurrently(self):
+        """Test that a slow handler does not block other workers."""
+        release = asyncio.Event()
+        handled = []
+
+        class SlowHandler(RecordingHandler):
+            async def handle_batch(self, events) -> None:
+                handled.extend(event.event_id for event in events)
+                if events[0].event_id == "user-msg-0":
+                    await release.wait()
+
+        bus = EventBus(workers=2)
+        bus.register_handler(SlowHandler())
+        # A session on the other worker's queue
+        first = make_user_event(0, session_id="s0")
+        second = next(
+            event for event in (
+                make_user_event(1, session_id=f"s{i}") for i in range(1, 100)
+            )
+            if bus._queue_for(event) is not bus._queue_for(first)
+        )
+
+        await bus.start()
+        assert len(bus._tasks) == 2
+        await bus.publish(first)
+        await asyncio.sleep(0)
+        await bus.publish(second)
+        await asyncio.wait_for(_wait_for(lambda: len(handled) == 2), 1)
+
+        release.set()
+        await bus.join()
+        await bus.stop()
+        assert bus._tasks == []
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped(self):
+        """Test that a worker takes at most max_batch events at a time."""
+        bus = EventBus(workers=1, max_batch=2)
+        handler = RecordingHandler()
+        bus.register_handler(handler)
+
+        await bus.start()
+        for i in range(5):
+            await bus.publish(make_user_event(i))
+        await bus.join()
+        await bus.stop()
+
+        assert [len(batch) for batch in handler.batches] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_session_events_keep_publish_order(self):
+        """Test that one session's events are handled in order across batches."""
+        handled = []
+
+        class OrderHandler(RecordingHandler):
+            async def handle_batch(self, events) -> None:
+                await asyncio.sleep(0.001)
+                handled.extend(event.event_id for event in events)
+
+        bus = EventBus(workers=4, max_batch=2)
+        bus.register_handler(OrderHandler())
+
+        await bus.start()
+        for i in range(10):
+            await bus.publish(make_user_event(i))
+            await asyncio.sleep(0)
+        await bus.join()
+        await bus.stop()
+
+        assert handled == [f"user-msg-{i}" for i in range(10)]
+
+
+async def _wait_for(predicate) -> None:
+    """Yield to the loop until predicate() is true."""
+    while not predicate():
+        await asyncio.sleep(0)
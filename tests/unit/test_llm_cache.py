@@ -0,0 +1,77 @@
+"""Unit tests for the LLM response cache."""
+
+import pytest
+
+from terminal_gpt.infrastructure.llm_cache import LLMCache, MemoryLRUBackend
+from terminal_gpt.infrastructure.llm_providers import LLMResponse
+
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+class TestLLMCache:
+    """Test response caching."""
+
+    def test_sampled_requests_are_not_cached_by_default(self):
+        """Test that only deterministic requests get a key by default."""
+        cache = LLMCache()
+
+        assert cache.make_key("model", MESSAGES, None, {"temperature": 0.7}) is None
+        assert cache.make_key("model", MESSAGES, None, {"temperature": 0}) is not None
+
+        sampled = LLMCache(cache_sampled=True)
+        assert sampled.make_key("model", MESSAGES, None, {"temperature": 0.7})
+
+    def test_key_covers_whole_request(self):
+        """Test that any change to the request changes the key."""
+        cache = LLMCache()
+        config = {"temperature": 0}
+        key = cache.make_key("model", MESSAGES, None, config)
+
+        assert key == cache.make_key("model", list(MESSAGES), None, dict(config))
+        assert key != cache.make_key("other", MESSAGES, None, config)
+        assert key != cache.make_key("model", MESSAGES, [{"name": "t"}], config)
+        assert key != cache.make_key(
+            "model", [{"role": "user", "content": "Hi"}], None, config
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_and_set(self):
+        """Test storing responses and hit/miss accounting."""
+        cache = LLMCache()
+        key = cache.make_key("model", MESSAGES, None, {"temperature": 0})
+        response = LLMResponse(content="Hi there", model="model", usage={})
+
+        assert await cache.get(key) is None
+        await cache.set(key, response)
+        assert await cache.get(key) == response
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_tool_call_responses_are_not_cached(self):
+        """Test that responses requesting tools are skipped."""
+        cache = LLMCache()
+        key = cache.make_key("model", MESSAGES, None, {"temperature": 0})
+
+        await cache.set(key, LLMResponse(
+            content="", model="model", usage={},
+            tool_calls=[{"id": "call_1", "type": "function"}]
+        ))
+        assert await cache.get(key) is None
+
+
+class TestMemoryLRUBackend:
+    """Test the in-memory backend."""
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_is_evicted(self):
+        """Test that the backend stays within its size bound."""
+        backend = MemoryLRUBackend(max_entries=2)
+        await backend.set("a", {"n": 1})
+        await backend.set("b", {"n": 2})
+        await backend.get("a")
+        await backend.set("c", {"n": 3})
+
+        assert len(backend) == 2
+        assert await backend.get("b") is None
+        assert await backend.get("a") == {"n": 1}
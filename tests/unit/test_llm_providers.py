@@ -109,6 +109,29 @@ class TestOpenRouterProvider:
         assert "HTTP-Referer" in headers
         assert "X-Title" in headers
 
+    @pytest.mark.asyncio
+    async def test_client_reuse(self):
+        """Test that contexts share the persistent and in-use client."""
+        provider = OpenRouterProvider("test-key")
+
+        # Overlapping contexts share one client, closed when the last exits
+        async with provider:
+            client = provider._client
+            async with provider:
+                assert provider._client is client
+            assert provider._client is client
+        assert provider._client is None
+
+        # A persistent client survives context exit until aclose()
+        await provider.open()
+        client = provider._client
+        async with provider:
+            assert provider._client is client
+        assert provider._client is client
+
+        await provider.aclose()
+        assert provider._client is None
+
     def test_generate_without_client(self):
         """Test generate method without initialized client."""
         provider = OpenRouterProvider("test-key")
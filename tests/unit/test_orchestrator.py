@@ -1,10 +1,16 @@
 """Unit tests for conversation orchestrator."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Dict, Any
 
-from terminal_gpt.application.orchestrator import ConversationOrchestrator
+from terminal_gpt.application.orchestrator import (
+    ConversationOrchestrator, _coalesce_chunks, is_terminal_intent
+)
+from terminal_gpt.application.conversation_store import ConversationJournal
+from terminal_gpt.infrastructure.llm_cache import LLMCache
 from terminal_gpt.infrastructure.llm_providers import LLMResponse, OpenRouterProvider
 from terminal_gpt.domain.models import ConversationState, Message
 from terminal_gpt.domain.exceptions import ValidationError, LLMError, PluginError
@@ -15,6 +21,7 @@ from terminal_gpt.domain.plugins import plugin_registry
 def mock_llm_provider():
     """Create a mock LLM provider for testing."""
     provider = MagicMock(spec=OpenRouterProvider)
+    provider.model = "test-model"
 
     # Mock the async context manager
     provider.__aenter__ = AsyncMock(return_value=provider)
@@ -148,6 +155,7 @@ class TestConversationOrchestrator:
             conversation = orchestrator._conversations[session_id]
             tool_messages = [msg for msg in conversation.messages if msg.role == "tool"]
             assert len(tool_messages) == 1
+            assert tool_messages[0].content == '{"result":4,"expression":"2 + 2"}'
 
     @pytest.mark.asyncio
     async def test_process_user_message_llm_error(self, orchestrator, mock_llm_provider):
@@ -160,6 +168,86 @@ class TestConversationOrchestrator:
         assert "apologize" in response.lower()
         assert "trouble" in response.lower()
 
+    @pytest.mark.asyncio
+    async def test_process_user_messages_batch(self, orchestrator, mock_llm_provider):
+        """Test batched processing keeps input order and isolates failures."""
+        mock_llm_provider.generate.return_value = LLMResponse(
+            content="Batched reply",
+            model="gpt-3.5-turbo"
+        )
+
+        results = await orchestrator.process_user_messages_batch([
+            ("session-a", "Hello"),
+            ("session-b", "Hi there"),
+            ("bad session!", "Hello"),
+            ("session-a", "Again"),
+        ])
+
+        assert results[0] == "Batched reply"
+        assert results[1] == "Batched reply"
+        assert isinstance(results[2], Exception)
+        assert results[3] == "Batched reply"
+
+        # Same-session messages are applied in arrival order
+        user_messages = [
+            msg.content
+            for msg in orchestrator._conversations["session-a"].messages
+            if msg.role == "user"
+        ]
+        assert user_messages == ["Hello", "Again"]
+
+    @pytest.mark.asyncio
+    async def test_events_published_in_background(self, orchestrator, mock_llm_provider):
+        """Test that slow event publication does not delay the response."""
+        mock_llm_provider.generate.return_value = LLMResponse(
+            content="Reply",
+            model="gpt-3.5-turbo"
+        )
+        release = asyncio.Event()
+
+        async def slow_publish(*args, **kwargs):
+            await release.wait()
+
+        with patch('terminal_gpt.application.orchestrator.publish_assistant_response',
+                   side_effect=slow_publish):
+            response = await orchestrator.process_user_message("test-session", "Hello")
+
+            assert response == "Reply"
+            assert orchestrator._pending_events
+
+            release.set()
+            await orchestrator.drain_events()
+            assert not orchestrator._pending_events
+
+    @pytest.mark.asyncio
+    async def test_background_publication_errors_are_logged(self, orchestrator):
+        """Test that a failing publication is logged instead of left unretrieved."""
+
+        async def failing_publish():
+            raise RuntimeError("bus down")
+
+        with patch('terminal_gpt.application.orchestrator.logger') as mock_logger:
+            orchestrator._publish_in_background(failing_publish())
+            await orchestrator.drain_events()
+
+        assert not orchestrator._pending_events
+        mock_logger.error.assert_called_once()
+        assert mock_logger.error.call_args.kwargs["error"] == "bus down"
+
+    @pytest.mark.asyncio
+    async def test_stream_terminal_intent_yields_llm_response(self, orchestrator, mock_llm_provider):
+        """Test farewell replies are streamed as LLMResponse chunks."""
+        chunks = [
+            chunk async for chunk in
+            orchestrator.process_user_message_stream("test-session", "bye!")
+        ]
+
+        assert len(chunks) == 1
+        assert isinstance(chunks[0], LLMResponse)
+        assert chunks[0].finish_reason == "stop"
+        assert chunks[0].tool_calls is None
+        mock_llm_provider.generate_stream.assert_not_called()
+
     def test_prepare_context_messages_within_window(self, orchestrator):
         """Test context preparation within sliding window."""
         conversation = ConversationState(session_id="test")
@@ -218,12 +306,112 @@ class TestConversationOrchestrator:
         assert context[0]["content"] == "You are helpful"
         assert all(msg["role"] == "user" for msg in context[1:])
 
+    def test_prepare_context_with_late_system_message(self, orchestrator):
+        """Test the window when a system message follows regular messages."""
+        conversation = ConversationState(session_id="test")
+        for i in range(8):
+            conversation = conversation.add_message(
+                Message(role="user", content=f"Message {i}")
+            )
+            if i == 1:
+                conversation = conversation.add_message(
+                    Message(role="system", content="Summary")
+                )
+
+        context = orchestrator._prepare_context_messages(conversation)
+
+        assert [msg["content"] for msg in context] == [
+            "Summary", "Message 3", "Message 4", "Message 5", "Message 6",
+            "Message 7"
+        ]
+
+    def test_prepare_context_fits_token_budget(self, mock_llm_provider):
+        """Test that the oldest messages past the token budget are left out."""
+        orch = ConversationOrchestrator(
+            llm_provider=mock_llm_provider, max_context_tokens=70
+        )
+        conversation = ConversationState(session_id="test")
+        conversation = conversation.add_message(
+            Message(role="system", content="s" * 40)  # ~14 tokens
+        )
+        for i in range(4):
+            conversation = conversation.add_message(
+                Message(role="user", content=f"{i}" * 80)  # ~24 tokens each
+            )
+
+        context = orch._prepare_context_messages(conversation)
+
+        assert [msg["content"][0] for msg in context] == ["s", "2", "3"]
+
+        # The newest message is kept even when it alone is over budget
+        orch.max_context_tokens = 10
+        context = orch._prepare_context_messages(conversation)
+        assert [msg["content"][0] for msg in context] == ["s", "3"]
+
+    def test_token_budget_drops_orphaned_tool_results(self, mock_llm_provider):
+        """Test that a cut never starts the context with a tool result."""
+        orch = ConversationOrchestrator(
+            llm_provider=mock_llm_provider, max_context_tokens=30
+        )
+        conversation = ConversationState(session_id="test")
+        for msg in [
+            Message(role="user", content="u" * 80),
+            Message(role="assistant", content="a" * 80),
+            Message(
+                role="tool", content="t" * 40, name="calc", tool_call_id="call_1"
+            ),
+            Message(role="user", content="Thanks"),
+        ]:
+            conversation = conversation.add_message(msg)
+
+        context = orch._prepare_context_messages(conversation)
+
+        assert [msg["role"] for msg in context] == ["user"]
+
+    def test_prepare_context_reuses_formatted_messages(self, orchestrator):
+        """Test that formatted messages are reused across calls."""
+        conversation = ConversationState(session_id="test")
+        for i in range(3):
+            conversation = conversation.add_message(
+                Message(role="user", content=f"Message {i}")
+            )
+
+        first = orchestrator._prepare_context_messages(conversation)
+
+        # Growing the conversation only formats the new message
+        conversation = conversation.add_message(
+            Message(role="assistant", content="Reply")
+        )
+        second = orchestrator._prepare_context_messages(conversation)
+        assert second is not first
+        assert all(new is old for new, old in zip(second, first))
+        assert second[-1] == {"role": "assistant", "content": "Reply"}
+
+        # Sliding the window still reuses the surviving messages
+        for i in range(3):
+            conversation = conversation.add_message(
+                Message(role="user", content=f"Later {i}")
+            )
+        third = orchestrator._prepare_context_messages(conversation)
+        assert [m["content"] for m in third] == [
+            "Message 2", "Reply", "Later 0", "Later 1", "Later 2"
+        ]
+        assert third[1] is second[3]
+
     def test_get_available_tools(self, orchestrator):
         """Test getting available tools."""
         with patch.object(plugin_registry, 'list_tools') as mock_list:
             mock_list.return_value = [{"name": "test_tool"}]
             tools = orchestrator._get_available_tools()
-            assert tools == [{"name": "test_tool"}]
+            assert tools == ({"name": "test_tool"},)
+
+            # Cached until the registry changes
+            assert orchestrator._get_available_tools() is tools
+            mock_list.assert_called_once()
+
+            with patch.object(plugin_registry, '_version', plugin_registry.version + 1):
+                orchestrator._get_available_tools()
+            assert mock_list.call_count == 2
 
     @pytest.mark.asyncio
     async def test_execute_tool_calls_success(self, orchestrator):
@@ -264,6 +452,34 @@ class TestConversationOrchestrator:
             assert results[0]["success"] is False
             assert "error" in results[0]["result"].lower()
 
+    @pytest.mark.asyncio
+    async def test_execute_tool_calls_concurrently(self, orchestrator):
+        """Test that tool calls run concurrently and keep their order."""
+        tool_calls = [
+            {
+                "id": f"call_{i}",
+                "function": {"name": "calculator", "arguments": f'{{"n": {i}}}'}
+            }
+            for i in range(3)
+        ]
+        running = 0
+        max_running = 0
+
+        async def execute(tool_name, tool_args):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01 * (3 - tool_args["n"]))
+            running -= 1
+            return {"n": tool_args["n"]}
+
+        with patch.object(plugin_registry, 'execute_tool_call', side_effect=execute):
+            results = await orchestrator._execute_tool_calls("session-123", tool_calls)
+
+        assert max_running == 3
+        assert [r["tool_call_id"] for r in results] == ["call_0", "call_1", "call_2"]
+        assert all(r["success"] for r in results)
+
     @pytest.mark.asyncio
     async def test_manage_conversation_length_no_action(self, orchestrator):
         """Test conversation length management when under limit."""
@@ -318,10 +534,10 @@ class TestConversationOrchestrator:
         conv2 = conv2.add_message(Message(role="user", content="Hello"))
         conv2 = conv2.add_message(Message(role="assistant", content="Hi there"))
 
-        orchestrator._conversations = {
+        orchestrator._conversations.update({
             "session1": conv1,
             "session2": conv2
-        }
+        })
 
         summaries = orchestrator.list_conversations()
 
@@ -349,7 +565,7 @@ class TestConversationOrchestrator:
         for i in range(3):
             conv2 = conv2.add_message(Message(role="user", content=f"Msg {i}"))
 
-        orchestrator._conversations = {"s1": conv1, "s2": conv2}
+        orchestrator._conversations.update({"s1": conv1, "s2": conv2})
 
         stats = orchestrator.get_stats()
 
@@ -359,6 +575,144 @@ class TestConversationOrchestrator:
         assert stats["sliding_window_size"] == 5
         assert stats["summarization_enabled"] is False
 
+    @pytest.mark.asyncio
+    async def test_prompt_cache_key_is_stable_per_session(
+        self, orchestrator, mock_llm_provider
+    ):
+        """Test that every streamed turn of a session sends the same key."""
+        async def stream(**kwargs):
+            yield LLMResponse(content="Hello!", model="test-model")
+
+        mock_llm_provider.generate_stream = MagicMock(side_effect=stream)
+
+        for session_id, message in (("s1", "Hi"), ("s1", "Hi again"), ("s2", "Hi")):
+            async for _ in orchestrator.process_user_message_stream(
+                session_id, message
+            ):
+                pass
+
+        keys = [
+            call.kwargs["config"]["prompt_cache_key"]
+            for call in mock_llm_provider.generate_stream.call_args_list
+        ]
+        assert keys[0] == keys[1]
+        assert keys[0] != keys[2]
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_use_response_cache(self, mock_llm_provider):
+        """Test that a repeated request is answered from the response cache."""
+        mock_llm_provider.model = "test-model"
+        mock_llm_provider.generate.return_value = LLMResponse(
+            content="Hello!", model="test-model", usage={}
+        )
+        cache = LLMCache(cache_sampled=True)
+
+        for session_id in ("s1", "s2"):
+            orch = ConversationOrchestrator(
+                llm_provider=mock_llm_provider, response_cache=cache
+            )
+            assert await orch.process_user_message(session_id, "Hi") == "Hello!"
+
+        mock_llm_provider.generate.assert_called_once()
+        assert orch.get_stats()["response_cache"] == {"hits": 1, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_sampled_requests_skip_response_cache(self, mock_llm_provider):
+        """Test that the cache's own key rules decide what is cached."""
+        mock_llm_provider.model = "test-model"
+        mock_llm_provider.generate.return_value = LLMResponse(
+            content="Hello!", model="test-model", usage={}
+        )
+        cache = LLMCache(cache_sampled=False)
+
+        with patch.object(cache, "make_key", wraps=cache.make_key) as make_key:
+            for session_id in ("s1", "s2"):
+                orch = ConversationOrchestrator(
+                    llm_provider=mock_llm_provider, response_cache=cache
+                )
+                await orch.process_user_message(session_id, "Hi")
+
+        assert make_key.call_count == 2
+        assert mock_llm_provider.generate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_provider_opened_once(self, orchestrator, mock_llm_provider):
+        """Test that the provider client is opened once and reused across turns."""
+        mock_llm_provider.generate.return_value = LLMResponse(
+            content="Hello!", model="test-model", usage={}
+        )
+
+        await orchestrator.process_user_message("s1", "Hi")
+        await orchestrator.process_user_message("s1", "Hi again")
+        mock_llm_provider.open.assert_awaited_once()
+
+        await orchestrator.aclose()
+        mock_llm_provider.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_summary_runs_in_background(self, mock_llm_provider):
+        """Test that a summary started near the limit is applied next turn."""
+        mock_llm_provider.generate.return_value = LLMResponse(
+            content="Reply", model="test-model", usage={}
+        )
+        orch = ConversationOrchestrator(
+            llm_provider=mock_llm_provider,
+            max_conversation_length=10,
+            enable_summarization=True
+        )
+        summary = Message(role="system", content="Summary")
+        release = asyncio.Event()
+
+        async def slow_summarize(conversation):
+            await release.wait()
+            return ConversationState(
+                session_id=conversation.session_id, messages=[summary]
+            )
+
+        with patch.object(orch, "_summarize", side_effect=slow_summarize):
+            for i in range(4):
+                await orch.process_user_message("s1", f"Message {i}")
+
+            # The turn returned while the summary is still pending
+            snapshot, task = orch._summarize_tasks["s1"]
+            assert not task.done()
+            assert orch._conversations["s1"] is snapshot
+
+            release.set()
+            await task
+            await orch.process_user_message("s1", "After summary")
+
+        conversation = orch._conversations["s1"]
+        assert [msg.content for msg in conversation.messages] == [
+            "Summary", "After summary", "Reply"
+        ]
+        assert "s1" not in orch._summarize_tasks
+
+    @pytest.mark.asyncio
+    async def test_identical_in_flight_requests_share_a_call(
+        self, orchestrator, mock_llm_provider
+    ):
+        """Test that concurrent identical requests make one provider call."""
+        release = asyncio.Event()
+
+        async def slow_generate(**kwargs):
+            await release.wait()
+            return LLMResponse(content="Shared", model="test-model", usage={})
+
+        mock_llm_provider.generate.side_effect = slow_generate
+
+        first = asyncio.create_task(orchestrator.process_user_message("s1", "Hi"))
+        second = asyncio.create_task(orchestrator.process_user_message("s2", "Hi"))
+        await asyncio.sleep(0.01)
+        release.set()
+
+        assert await asyncio.gather(first, second) == ["Shared", "Shared"]
+        mock_llm_provider.generate.assert_called_once()
+        assert orchestrator._inflight == {}
+        # A call shared across sessions carries no session's prompt cache key
+        config = mock_llm_provider.generate.call_args.kwargs["config"]
+        assert "prompt_cache_key" not in config
+
     @pytest.mark.asyncio
     async def test_max_iterations_prevention(self, orchestrator, mock_llm_provider):
         """Test prevention of infinite loops with max iterations."""
@@ -407,3 +761,118 @@ class TestConversationOrchestrator:
             call_args = mock_publish.call_args
             assert call_args[1]["session_id"] == session_id
             assert "Exception" in call_args[1]["error_type"]
+
+    def test_journal_restore_past_max_sessions(self, mock_llm_provider, tmp_path):
+        """Test restoring more journaled sessions than the store holds."""
+        path = str(tmp_path / "journal.jsonl")
+        journal = ConversationJournal(path)
+        first = ConversationOrchestrator(
+            llm_provider=mock_llm_provider, conversation_journal=journal
+        )
+        for session_id in ("s1", "s2", "s3"):
+            first._conversations[session_id] = ConversationState(
+                session_id=session_id
+            )
+        journal.close()
+
+        orch = ConversationOrchestrator(
+            llm_provider=mock_llm_provider,
+            max_sessions=2,
+            conversation_journal=ConversationJournal(path)
+        )
+
+        assert set(orch._conversations) == {"s2", "s3"}
+
+
+class TestTerminalIntent:
+    """Test farewell detection."""
+
+    @pytest.mark.parametrize("message", [
+        "bye", "Bye!", "  thanks a bunch", "Thank you.", "see ya later", "NO"
+    ])
+    def test_terminal_messages(self, message):
+        """Test messages that end the conversation."""
+        assert is_terminal_intent(message)
+
+    @pytest.mark.parametrize("message", [
+        "now list the files", "endless loop?", "what does exit code 1 mean", ""
+    ])
+    def test_other_messages(self, message):
+        """Test messages that only contain or resemble a terminal phrase."""
+        assert not is_terminal_intent(message)
+
+
+class TestCoalesceChunks:
+    """Test merging of streamed chunks."""
+
+    @staticmethod
+    async def stream(*chunks: LLMResponse):
+        for chunk in chunks:
+            yield chunk
+
+    @staticmethod
+    def chunk(content: str, **kwargs) -> LLMResponse:
+        return LLMResponse(content=content, model="test-model", **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_bursts_are_merged(self):
+        """Test that chunks within the window merge until a finish reason."""
+        chunks = [
+            merged async for merged in _coalesce_chunks(
+                self.stream(
+                    self.chunk("Hel"), self.chunk("lo"),
+                    self.chunk("!", finish_reason="stop"), self.chunk(" tail")
+                ),
+                window_ns=10**12, max_chars=100
+            )
+        ]
+
+        assert [c.content for c in chunks] == ["Hello!", " tail"]
+        assert chunks[0].finish_reason == "stop"
+
+    @pytest.mark.asyncio
+    async def test_pending_text_flushes_on_deadline(self):
+        """Test that text is sent once the window ends, not at the next chunk."""
+        release = asyncio.Event()
+
+        async def stream():
+            yield self.chunk("Hel")
+            yield self.chunk("lo")
+            await release.wait()  # A slow token
+            yield self.chunk("!", finish_reason="stop")
+
+        merged = _coalesce_chunks(stream(), window_ns=10_000_000, max_chars=100)
+        first = await asyncio.wait_for(merged.__anext__(), 1)
+        assert first.content == "Hello"
+
+        release.set()
+        assert [c.content async for c in merged] == ["!"]
+
+    @pytest.mark.asyncio
+    async def test_stream_errors_follow_pending_text(self):
+        """Test that an error is raised after the text before it is sent."""
+        async def stream():
+            yield self.chunk("Partial")
+            raise LLMError("boom")
+
+        merged = _coalesce_chunks(stream(), window_ns=10**12, max_chars=100)
+        assert (await merged.__anext__()).content == "Partial"
+        with pytest.raises(LLMError):
+            await merged.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_size_and_tool_calls(self):
+        """Test that large content and tool calls are not held back."""
+        tool_calls = [{"id": "call_1", "type": "function"}]
+        chunks = [
+            merged async for merged in _coalesce_chunks(
+                self.stream(
+                    self.chunk("abc"), self.chunk("def"),
+                    self.chunk("", tool_calls=tool_calls)
+                ),
+                window_ns=10**12, max_chars=5
+            )
+        ]
+
+        assert [c.content for c in chunks] == ["abcdef", ""]
+        assert chunks[1].tool_calls == tool_calls
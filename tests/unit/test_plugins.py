@@ -135,6 +135,15 @@ class TestPluginRegistry:
         assert registry.has_plugin("mock_plugin")
         assert registry.list_plugins() == {"mock_plugin": "A mock plugin for testing"}
 
+    def test_version_tracks_registration(self):
+        """Test that the registry version changes on registration."""
+        registry = PluginRegistry()
+        version = registry.version
+
+        registry.register(MockPlugin())
+
+        assert registry.version == version + 1
+
     def test_duplicate_registration(self):
         """Test duplicate plugin registration fails."""
         registry = PluginRegistry()
@@ -0,0 +1,417 @@
+"""Unit tests for the streaming CLI client."""
+
+import asyncio
+import io
+from collections import deque
+
+import msgspec
+import orjson
+import pytest
+from rich.console import Console
+from websockets.datastructures import Headers
+from websockets.exceptions import ConnectionClosedError, InvalidStatus
+from websockets.http11 import Response
+from websockets.protocol import State
+
+from terminal_gpt.cli import streaming_client
+from terminal_gpt.cli.enhanced_ui import PROFESSIONAL_THEME
+
+
+class FakeWebSocket:
+    """WebSocket connection replaying canned server frames.
+
+    Like the server, each message sent releases the frames of one reply: up
+    to and including the next complete or error frame, or an exception.
+    """
+
+    def __init__(self, frames, subprotocol=None):
+        self.frames = list(frames)
+        self.subprotocol = subprotocol
+        self.encode = (
+            msgspec.msgpack.encode if subprotocol == "msgpack" else orjson.dumps
+        )
+        self.state = State.OPEN
+        self.sent = []
+        self.connects = []
+        self.decoded = 0
+        self._ready: asyncio.Queue = asyncio.Queue()
+
+    async def send(self, data):
+        self.sent.append(data)
+        while self.frames:
+            frame = self.frames.pop(0)
+            self._ready.put_nowait(frame)
+            if isinstance(frame, Exception) or frame["type"] != "chunk":
+                break
+
+    async def close(self):
+        self.state = State.CLOSED
+
+    async def recv(self, decode=None):
+        frame = await self._ready.get()
+        if isinstance(frame, Exception):
+            raise frame
+        data = self.encode(frame)
+        # Like websockets, decode text frames to str unless told not to
+        if decode is None and self.subprotocol != "msgpack":
+            decode = True
+        if decode:
+            self.decoded += 1
+            return data.decode()
+        return data
+
+
+@pytest.fixture
+def output(monkeypatch):
+    """Send the client's console output to a string buffer."""
+    out = io.StringIO()
+    monkeypatch.setattr(
+        streaming_client.ui, "console",
+        Console(theme=PROFESSIONAL_THEME, file=out, width=100)
+    )
+    monkeypatch.setattr(
+        streaming_client, "conversation_history",
+        deque(maxlen=streaming_client.HISTORY_SIZE)
+    )
+    monkeypatch.setattr(streaming_client, "_connection", None)
+    monkeypatch.setattr(streaming_client, "_connection_url", None)
+    return out
+
+
+def connect_to(monkeypatch, frames, subprotocol=None) -> FakeWebSocket:
+    """Make websockets.connect return a fake connection with these frames.
+
+    The fake records the URL of each connect in its ``connects`` list and
+    the options of the last one in ``options``.
+    """
+    websocket = FakeWebSocket(frames, subprotocol)
+
+    async def connect(url, **kwargs):
+        websocket.connects.append(url)
+        websocket.options = kwargs
+        websocket.state = State.OPEN
+        return websocket
+
+    monkeypatch.setattr(streaming_client.websockets, "connect", connect)
+    return websocket
+
+
+class TestSendStreamingMessage:
+    """Test streaming a reply over the WebSocket."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_written_whole(self, monkeypatch, output):
+        """Test that chunk text is written directly and the reply assembled."""
+        monkeypatch.setattr(streaming_client, "PACING_ENABLED", False)
+        websocket = connect_to(monkeypatch, [
+            {"type": "chunk", "content": "Hello, "},
+            {"type": "chunk", "content": "[world]!"},
+            {"type": "complete", "processing_time_ms": 42},
+        ])
+        writes = []
+        write = output.write
+        monkeypatch.setattr(
+            output, "write", lambda text: writes.append(text) or write(text)
+        )
+
+        reply = await streaming_client.send_streaming_message("s1", "Hi")
+
+        assert reply == "Hello, [world]!"
+        assert websocket.sent == ['{"message":"Hi"}']
+        assert websocket.decoded == 0
+        assert "Hello, [world]!" in writes
+        assert "Hello, [world]!" in output.getvalue()
+        assert "42ms" in output.getvalue()
+        assert streaming_client.conversation_history[-1]["content"] == reply
+
+    @pytest.mark.asyncio
+    async def test_pacing_sleeps_once_per_chunk(self, monkeypatch, output):
+        """Test that pacing pauses per write, scaled and capped."""
+        monkeypatch.setattr(streaming_client, "PACING_ENABLED", True)
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(streaming_client.asyncio, "sleep", fake_sleep)
+        connect_to(monkeypatch, [
+            {"type": "chunk", "content": "Hi"},
+            {"type": "complete", "processing_time_ms": 1},
+            {"type": "chunk", "content": "x" * 1000},
+            {"type": "complete", "processing_time_ms": 1},
+        ])
+        await streaming_client.send_streaming_message("s1", "Hi")
+        await streaming_client.send_streaming_message("s1", "Hi")
+
+        assert sleeps == [pytest.approx(0.001), 0.02]
+
+    @pytest.mark.asyncio
+    async def test_waiting_frames_are_written_together(self, monkeypatch, output):
+        """Test that frames received together produce a single write."""
+        # The fake connection has every frame ready at once
+        monkeypatch.setattr(streaming_client, "PACING_ENABLED", False)
+        connect_to(monkeypatch, [
+            {"type": "chunk", "content": "One "},
+            {"type": "chunk", "content": "two "},
+            {"type": "chunk", "content": "three"},
+            {"type": "complete", "processing_time_ms": 1},
+        ])
+        writes = []
+        write = output.write
+        monkeypatch.setattr(
+            output, "write", lambda text: writes.append(text) or write(text)
+        )
+
+        reply = await streaming_client.send_streaming_message("s1", "Hi")
+
+        assert reply == "One two three"
+        assert "One two three" in writes
+
+    @pytest.mark.asyncio
+    async def test_history_keeps_recent_replies(self, monkeypatch, output):
+        """Test that only the most recent history entries are kept."""
+        size = streaming_client.HISTORY_SIZE
+        connect_to(monkeypatch, [
+            frame
+            for i in range(size + 2)
+            for frame in (
+                {"type": "chunk", "content": str(i)},
+                {"type": "complete", "processing_time_ms": 1},
+            )
+        ])
+
+        for _ in range(size + 2):
+            await streaming_client.send_streaming_message("s1", "Hi")
+
+        history = streaming_client.conversation_history
+        assert [entry["content"] for entry in history] == [
+            str(i) for i in range(2, size + 2)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_thinking_status_stops_before_text(self, monkeypatch, output):
+        """Test that the thinking spinner is stopped before text is written."""
+        connect_to(monkeypatch, [
+            {"type": "chunk", "content": "Answer"},
+            {"type": "complete", "processing_time_ms": 1},
+        ])
+        stopped_at = []
+
+        class Thinking:
+            def stop(self):
+                stopped_at.append(output.getvalue())
+
+        reply = await streaming_client.send_streaming_message(
+            "s1", "Hi", Thinking()
+        )
+
+        assert reply == "Answer"
+        assert stopped_at == [""]
+
+    @pytest.mark.asyncio
+    async def test_connection_closed_mid_stream(self, monkeypatch, output):
+        """Test that text before a dropped connection is kept and shown."""
+        connect_to(monkeypatch, [
+            {"type": "chunk", "content": "Partial"},
+            ConnectionClosedError(None, None),
+        ])
+
+        reply = await streaming_client.send_streaming_message("s1", "Hi")
+
+        assert reply == "Partial"
+        assert "Connection closed by server" in output.getvalue()
+        assert streaming_client._connection is None
+
+    @pytest.mark.asyncio
+    async def test_connection_closed_before_reply(self, monkeypatch, output):
+        """Test that a drop before any reply text is raised for retrying."""
+        connect_to(monkeypatch, [ConnectionClosedError(None, None)])
+
+        with pytest.raises(ConnectionClosedError):
+            await streaming_client.send_streaming_message("s1", "Hi")
+
+        assert streaming_client._connection is None
+
+    @pytest.mark.asyncio
+    async def test_msgpack_frames(self, monkeypatch, output):
+        """Test the MessagePack protocol when the server accepts it."""
+        websocket = connect_to(monkeypatch, [
+            {"type": "chunk", "content": "Packed"},
+            {"type": "complete", "processing_time_ms": 1},
+        ], subprotocol="msgpack")
+
+        reply = await streaming_client.send_streaming_message("s1", "Hi")
+
+        assert reply == "Packed"
+        assert msgspec.msgpack.decode(websocket.sent[0]) == {"message": "Hi"}
+
+
+class TestReadFrames:
+    """Test the reader task feeding a reply's frame queue."""
+
+    @pytest.mark.asyncio
+    async def test_reading_pauses_when_queue_is_full(self):
+        """Test that the reader stops receiving once the queue is full."""
+        websocket = FakeWebSocket(
+            [{"type": "chunk", "content": str(i)} for i in range(5)]
+            + [{"type": "complete"}]
+        )
+        await websocket.send("Hi")
+        frames: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+        reader = asyncio.create_task(
+            streaming_client._read_frames(websocket, frames)
+        )
+        try:
+            await asyncio.sleep(0.01)
+            # Two queued, one received and waiting for room
+            assert frames.qsize() == 2
+            assert websocket._ready.qsize() == 3
+
+            frames.get_nowait()
+            await asyncio.sleep(0.01)
+            assert frames.qsize() == 2
+            assert websocket._ready.qsize() == 2
+        finally:
+            reader.cancel()
+
+
+class TestPersistentConnection:
+    """Test reusing one WebSocket across turns."""
+
+    @pytest.mark.asyncio
+    async def test_turns_share_a_connection(self, monkeypatch, output):
+        """Test that consecutive messages to a session connect only once."""
+        websocket = connect_to(monkeypatch, [
+            {"type": "chunk", "content": "One"},
+            {"type": "complete", "processing_time_ms": 1},
+            {"type": "chunk", "content": "Two"},
+            {"type": "complete", "processing_time_ms": 1},
+            {"type": "chunk", "content": "Three"},
+            {"type": "complete", "processing_time_ms": 1},
+        ])
+
+        assert await streaming_client.send_streaming_message("s1", "A") == "One"
+        assert await streaming_client.send_streaming_message("s1", "B") == "Two"
+        assert len(websocket.connects) == 1
+        assert websocket.options["max_size"] == 2**22
+        assert websocket.options["compression"] is None
+
+        # Switching sessions needs a connection to the new session's URL
+        assert await streaming_client.send_streaming_message("s2", "C") == "Three"
+        assert [url.rsplit("/", 1)[1] for url in websocket.connects] == [
+            "s1", "s2"
+        ]
+
+        await streaming_client.close_connection()
+        assert websocket.state is State.CLOSED
+        assert streaming_client._connection is None
+
+    @pytest.mark.asyncio
+    async def test_closed_connection_is_replaced(self, monkeypatch, output):
+        """Test that a connection the server closed is reopened on send."""
+        websocket = connect_to(monkeypatch, [
+            {"type": "chunk", "content": "One"},
+            {"type": "complete", "processing_time_ms": 1},
+            {"type": "chunk", "content": "Two"},
+            {"type": "complete", "processing_time_ms": 1},
+        ])
+        await streaming_client.send_streaming_message("s1", "A")
+
+        websocket.state = State.CLOSED
+        assert await streaming_client.send_streaming_message("s1", "B") == "Two"
+        assert len(websocket.connects) == 2
+
+
+class TestRetry:
+    """Test reconnecting when a message fails to go through."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record backoff delays instead of sleeping."""
+        delays = []
+
+        async def fake_sleep(seconds):
+            delays.append(seconds)
+
+        monkeypatch.setattr(streaming_client.asyncio, "sleep", fake_sleep)
+        return delays
+
+    @pytest.mark.asyncio
+    async def test_dropped_connection_is_retried(
+        self, monkeypatch, output, sleeps
+    ):
+        """Test that a connection dropped before the reply is retried."""
+        websocket = connect_to(monkeypatch, [
+            ConnectionClosedError(None, None),
+            {"type": "chunk", "content": "Whole"},
+            {"type": "complete", "processing_time_ms": 1},
+        ])
+
+        reply = await streaming_client.send_streaming_message_with_retry(
+            "s1", "Hi"
+        )
+
+        assert reply == "Whole"
+        assert sleeps == [streaming_client.RETRY_DELAYS[0]]
+        assert len(websocket.sent) == 2
+        assert "Retrying in 1s" in output.getvalue()
+
+    @pytest.mark.asyncio
+    async def test_drop_mid_reply_is_not_resent(
+        self, monkeypatch, output, sleeps
+    ):
+        """Test that a reply cut off mid-stream doesn't send the turn again."""
+        websocket = connect_to(monkeypatch, [
+            {"type": "chunk", "content": "Part"},
+            ConnectionClosedError(None, None),
+            {"type": "chunk", "content": "Whole"},
+            {"type": "complete", "processing_time_ms": 1},
+        ])
+
+        reply = await streaming_client.send_streaming_message_with_retry(
+            "s1", "Hi"
+        )
+
+        assert reply == "Part"
+        assert sleeps == []
+        assert len(websocket.sent) == 1
+        assert "Connection closed by server" in output.getvalue()
+        assert "Whole" not in output.getvalue()
+        assert streaming_client._connection is None
+
+    @pytest.mark.asyncio
+    async def test_error_shown_after_last_attempt(
+        self, monkeypatch, output, sleeps
+    ):
+        """Test that failed connects back off, then report the failure."""
+        async def connect(url, **kwargs):
+            raise ConnectionRefusedError("Connection refused")
+
+        monkeypatch.setattr(streaming_client.websockets, "connect", connect)
+
+        reply = await streaming_client.send_streaming_message_with_retry(
+            "s1", "Hi"
+        )
+
+        assert reply is None
+        assert sleeps == streaming_client.RETRY_DELAYS[:-1]
+        assert "Connection refused" in output.getvalue()
+
+    @pytest.mark.asyncio
+    async def test_missing_session_is_not_retried(
+        self, monkeypatch, output, sleeps
+    ):
+        """Test that a handshake rejected with 404 fails at once."""
+        async def connect(url, **kwargs):
+            raise InvalidStatus(Response(404, "Not Found", Headers()))
+
+        monkeypatch.setattr(streaming_client.websockets, "connect", connect)
+
+        reply = await streaming_client.send_streaming_message_with_retry(
+            "s1", "Hi"
+        )
+
+        assert reply is None
+        assert sleeps == []
+        assert "Session not found" in output.getvalue()